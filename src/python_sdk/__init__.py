@@ -1 +1,24 @@
+import importlib
+import typing
+
 from python_sdk.__version__ import __version__ as __version__
+
+if typing.TYPE_CHECKING:
+    from python_sdk import bin as bin
+    from python_sdk import config as config
+    from python_sdk import encoding as encoding
+    from python_sdk import log as log
+    from python_sdk import secrets as secrets
+    from python_sdk import sentinel as sentinel
+    from python_sdk import testing as testing
+    from python_sdk import utils as utils
+    from python_sdk import versioning as versioning
+
+_SUBMODULES = frozenset(["bin", "config", "encoding", "log", "secrets", "sentinel", "testing", "utils", "versioning"])
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Submodules are imported on first access, so that `import python_sdk` only pays for what is used.
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
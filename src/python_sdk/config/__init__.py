@@ -1,19 +1,42 @@
 from python_sdk.config._config import Config as Config
 from python_sdk.config._config import ConfigSourcesConfig as ConfigSourcesConfig
+from python_sdk.config._config import ConfigSubscriber as ConfigSubscriber
+from python_sdk.config._config_load_session import load_session as load_session
+from python_sdk.config._config_load_timings import ConfigLoadTimings as ConfigLoadTimings
+from python_sdk.config._config_load_timings import ConfigLoadTimingsHook as ConfigLoadTimingsHook
+from python_sdk.config._config_load_timings import set_load_timings_hook as set_load_timings_hook
 from python_sdk.config._config_option import Option as Option
+from python_sdk.config._config_registry import load_all as load_all
+from python_sdk.config._config_registry import registered_configs as registered_configs
+from python_sdk.config._config_registry import reload_all as reload_all
+from python_sdk.config._config_reloader import LocalFileReloader as LocalFileReloader
+from python_sdk.config._config_reloader import PeriodicReloader as PeriodicReloader
 from python_sdk.config._config_sources import AWSParameterStoreDocument as AWSParameterStoreDocument
 from python_sdk.config._config_sources import AWSSecretsManagerSecret as AWSSecretsManagerSecret
+from python_sdk.config._config_sources import AsyncConfigSource as AsyncConfigSource
 from python_sdk.config._config_sources import ConfigSource as ConfigSource
+from python_sdk.config._config_sources import DocumentFormat as DocumentFormat
 from python_sdk.config._config_sources import EnvironmentVariables as EnvironmentVariables
 from python_sdk.config._config_sources import FileObject as FileObject
+from python_sdk.config._config_sources import FingerprintableConfigSource as FingerprintableConfigSource
 from python_sdk.config._config_sources import LocalFile as LocalFile
 from python_sdk.config._config_sources import RemoteHTTPFile as RemoteHTTPFile
 from python_sdk.config._config_sources import S3File as S3File
 from python_sdk.config._config_sources import StaticDictionary as StaticDictionary
+from python_sdk.config._config_sources import invalidate_environment_variables as invalidate_environment_variables
+from python_sdk.config._config_sources import set_environment_variable as set_environment_variable
+from python_sdk.config._config_state import STATE_FILE_ENVIRONMENT_VARIABLE as STATE_FILE_ENVIRONMENT_VARIABLE
+from python_sdk.config._config_state import export_state as export_state
+from python_sdk.config._config_state import import_state as import_state
+from python_sdk.config._config_state import process_initializer as process_initializer
+from python_sdk.config._config_state import share_state_with_child_processes as share_state_with_child_processes
 from python_sdk.config._config_validators import ConfigValidationError as ConfigValidationError
 from python_sdk.config._config_validators import ConfigValidator as ConfigValidator
+from python_sdk.config._config_validators import DependentConfigValidator as DependentConfigValidator
 from python_sdk.config._config_value_types import Base64EncodedString as Base64EncodedString
 from python_sdk.config._config_value_types import ConfigValueType as ConfigValueType
+from python_sdk.config._config_value_types import Float64Array as Float64Array
+from python_sdk.config._config_value_types import Int64Array as Int64Array
 from python_sdk.config._config_value_validators import ConfigValueValidationError as ConfigValueValidationError
 from python_sdk.config._config_value_validators import ConfigValueValidator as ConfigValueValidator
 from python_sdk.config._config_value_validators import ValidateDirectoryExists as ValidateDirectoryExists
@@ -1,26 +1,36 @@
+import concurrent.futures
+import contextlib
 import dataclasses
 import datetime
+import functools
+import hashlib
 import logging
 import pathlib
+import threading
+import time
+import types
 import typing
 
 import python_sdk
 from python_sdk import sentinel
+from python_sdk.config import _config_load_session
+from python_sdk.config import _config_load_timings
 from python_sdk.config import _config_option
+from python_sdk.config import _config_registry
+from python_sdk.config import _config_secrets
+from python_sdk.config import _config_snapshot
 from python_sdk.config import _config_sources
+from python_sdk.config import _config_state
+from python_sdk.config import _config_validators
 from python_sdk.config import _config_value_types
 from python_sdk.config import _config_value_validators
 
-if typing.TYPE_CHECKING:
-    from python_sdk.config import _config_validators
-
 Unset: sentinel.Sentinel = sentinel.Sentinel("Unset")
 
 
 # TODO: get_documentation function at module level which pulls out docs from all configuration objects
-# TODO: registry of tuples of all Config classes and all of their config options, so we can fetch documentation for it
-# and also append to it manually options which are only available through plain environment variables, e.g., in this
-# module
+# TODO: append to the registry manually options which are only available through plain environment variables, e.g., in
+# this module
 
 
 class _ConfigMetaclass(type):
@@ -33,17 +43,66 @@ class _ConfigMetaclass(type):
         return super().__repr__()
 
     def __getattribute__(cls, item: str) -> typing.Any:
+        # Fast path. Loaded configs publish their decoded values into a plain value table, so reading an option costs
+        # a single dictionary lookup. The table is never mutated, only swapped out, so readers never see partial updates.
+        option_values: dict[str, typing.Any] = type.__getattribute__(cls, "_option_values")
+        if item in option_values:
+            return option_values[item]
+
         attribute = super().__getattribute__(item)
         if not isinstance(attribute, _config_option.ConfigOption):
             return attribute
 
         if cls.meta.lazy_load_config and not cls.meta.loaded:
-            cls._load_config()
+            with cls._change_lock():
+                # Another thread may have loaded the config while we waited for the lock.
+                if not cls.meta.loaded:
+                    cls._load_config()
             attribute = super().__getattribute__(item)
 
+        if cls.meta.lazy_decode_options:
+            return cls._decode_deferred_option(name=item)
         return attribute.value
 
 
+class _StagedOptionValues(dict[str, typing.Any]):
+    """
+    Value table published while the config validators run against values which are yet to pass them. The thread
+    running the config validators sees the staged values, while every other thread keeps seeing the current ones.
+    """
+
+    def __init__(self, current: dict[str, typing.Any], staged: dict[str, typing.Any]) -> None:
+        super().__init__(current)
+        self.staged = staged
+        self.thread_id = threading.get_ident()
+
+    def for_current_thread(self) -> dict[str, typing.Any]:
+        return self.staged if threading.get_ident() == self.thread_id else dict(self)
+
+    def __contains__(self, item: object) -> bool:
+        if threading.get_ident() == self.thread_id:
+            return item in self.staged
+        return super().__contains__(item)
+
+    def __getitem__(self, item: str) -> typing.Any:
+        if threading.get_ident() == self.thread_id:
+            return self.staged[item]
+        return super().__getitem__(item)
+
+
+class ConfigSubscriber(typing.Protocol):
+    def __call__(self, config: type["Config"], changed_options: frozenset[str]) -> None:
+        """Called with the names of the subscribed to options which changed."""
+        ...
+
+
+@dataclasses.dataclass(frozen=True)
+class _Subscription:
+    subscriber: ConfigSubscriber
+    options: frozenset[str] | None
+    executor: concurrent.futures.Executor | None
+
+
 @dataclasses.dataclass
 class _ConfigMeta:
     name: str
@@ -51,8 +110,24 @@ class _ConfigMeta:
     option_prefix: str
     config_sources: list["_config_sources.ConfigSource"]
     lazy_load_config: bool
+    lazy_decode_options: bool
     validators: list["_config_validators.ConfigValidator"]
+    options: dict[str, "_config_option.ConfigOption"]
+    # The config validators, alongside the options each depends on, or None if they do not say. None as a whole when
+    # Config.validate is overridden, as overrides can depend on any option.
+    validation_plan: tuple[tuple["_config_validators.ConfigValidator", frozenset[str] | None], ...] | None
     last_loaded_at: datetime.datetime | None = None
+    changed_options: frozenset[str] = frozenset()
+    lock: threading.RLock = dataclasses.field(default_factory=threading.RLock)
+    subscriptions: tuple[_Subscription, ...] = ()
+    # Changes waiting for the lock to be released to notify their subscribers, alongside the subscriptions at the time.
+    pending_notifications: list[tuple[frozenset[str], tuple[_Subscription, ...]]] = dataclasses.field(
+        default_factory=list
+    )
+    change_depth: int = 0
+    # Bumped within the config lock by every load, including those from snapshots and imported state.
+    load_count: int = 0
+    last_load_timings: _config_load_timings.ConfigLoadTimings | None = None
     _loaded: bool = False
 
     def __init__(
@@ -62,17 +137,40 @@ class _ConfigMeta:
         option_prefix: str,
         config_sources: list["_config_sources.ConfigSource"],
         lazy_load_config: bool,
+        lazy_decode_options: bool,
         validators: list["_config_validators.ConfigValidator"],
+        options: dict[str, "_config_option.ConfigOption"],
+        validate_is_overridden: bool = False,
     ) -> None:
         self.name = name
         self.description = description
         self.option_prefix = option_prefix
         self.config_sources = config_sources
         self.lazy_load_config = lazy_load_config
+        self.lazy_decode_options = lazy_decode_options
         self.validators = validators
+        self.options = options
+        self.validation_plan = (
+            None if validate_is_overridden else tuple((validator, _depends_on(validator)) for validator in validators)
+        )
         self.last_loaded_at = None
+        self.changed_options = frozenset()
+        # Serializes loads and updates of the config. Reads of loaded configs never take it.
+        self.lock = threading.RLock()
+        # Replaced rather than mutated, so that it can be iterated over while subscribers come and go.
+        self.subscriptions = ()
+        self.pending_notifications = []
+        self.change_depth = 0
+        self.load_count = 0
+        self.last_load_timings = None
         self._loaded = False
 
+    @functools.cached_property
+    def options_fingerprint(self) -> str:
+        # Options changing name or datatype invalidate snapshots of the config.
+        options = [f"{option.fully_qualified_name}:{option.datatype!r}" for option in self.options.values()]
+        return hashlib.blake2b(repr(options).encode(), digest_size=16).hexdigest()
+
     @property
     def loaded(self) -> bool:
         return self._loaded
@@ -85,6 +183,7 @@ class _ConfigMeta:
 
 class Config(metaclass=_ConfigMetaclass):
     meta: _ConfigMeta
+    _option_values: dict[str, _config_value_types.ConfigValueType] = {}
 
     # TODO: config cache
     # TODO: how do we allow ops to configure some of these options?
@@ -96,6 +195,7 @@ class Config(metaclass=_ConfigMetaclass):
         option_prefix: str = "",
         config_sources: list["_config_sources.ConfigSource"] | None = None,
         lazy_load_config: bool = False,
+        lazy_decode_options: bool = False,
         validators: list["_config_validators.ConfigValidator"] | None = None,  # TODO: this or function
     ) -> None:
         super().__init_subclass__()
@@ -104,6 +204,11 @@ class Config(metaclass=_ConfigMetaclass):
         # We will be overriding it below to store the configuration of this class in.
         if "meta" in cls.__dict__ or ("meta" in cls.__annotations__ and cls.__annotations__["meta"] != _ConfigMeta):
             raise ValueError("`meta` is a reserved keyword and cannot be used as a configuration option.")
+        if "_option_values" in cls.__dict__:
+            raise ValueError("`_option_values` is a reserved keyword and cannot be used as a configuration option.")
+
+        # Values are only published once the config is loaded. Until then, reads take the slow path.
+        cls._option_values = {}
 
         options: dict[str, _config_option.PartialConfigOption] = {
             k: v for k, v in cls.__dict__.items() if isinstance(v, _config_option.PartialConfigOption)
@@ -116,6 +221,7 @@ class Config(metaclass=_ConfigMetaclass):
 
         # Finish instantiation of _config_option.ConfigOptions instances with attributes that the user cannot supply,
         # but are now known.
+        complete_options: dict[str, _config_option.ConfigOption] = {}
         for option_name, option in options.items():
             # We can assume here that the annotation is available, because of the typing checks we did earlier.
             complete_option: _config_option.ConfigOption = option(
@@ -124,6 +230,7 @@ class Config(metaclass=_ConfigMetaclass):
                 datatype=cls.__annotations__[option_name],
             )
             setattr(cls, option_name, complete_option)
+            complete_options[option_name] = complete_option
 
         # We store this data in a container rather than on the Config itself to prevent name collisions.
         cls.meta = _ConfigMeta(
@@ -132,10 +239,20 @@ class Config(metaclass=_ConfigMetaclass):
             option_prefix=option_prefix,
             config_sources=config_sources or _get_config_sources(),
             lazy_load_config=lazy_load_config,
+            lazy_decode_options=lazy_decode_options,
             validators=validators or [],
+            options=complete_options,
+            validate_is_overridden=next(klass for klass in cls.__mro__ if "validate" in klass.__dict__) is not Config,
         )
 
-        if not cls.meta.lazy_load_config:
+        for validator in cls.meta.validators:
+            if unknown_options := (_depends_on(validator) or frozenset()) - complete_options.keys():
+                raise ValueError(f"{validator.name} depends on options {sorted(unknown_options)} which do not exist.")
+
+        _config_registry.register(config=cls)
+
+        # Processes which imported the state of another process restore the config from it, rather than loading it.
+        if not _config_state.restore_state(config=cls) and not cls.meta.lazy_load_config:
             cls._load_config()
 
     def __init__(self) -> None:
@@ -144,22 +261,153 @@ class Config(metaclass=_ConfigMetaclass):
 
     @classmethod
     def _load_config(cls) -> None:
+        # Hold the lock while reading as well, so that concurrent reloads cannot apply older config data last.
+        with cls._change_lock():
+            started_at = time.perf_counter()
+            timings = _config_load_timings.ConfigLoadTimings()
+            config_data = cls._read_config_data(timings=timings)
+            cls._resolve_secret_references(config_data=config_data, timings=timings)
+            cls._apply_config_data(config_data=config_data, timings=timings, started_at=started_at)
+
+    @classmethod
+    def _read_config_data(cls, timings: _config_load_timings.ConfigLoadTimings) -> dict[str, str]:
         config_data: dict[str, str] = {}
         for config_source in reversed(cls.meta.config_sources):
             # Start sourcing config data from provided config sources, backwards.
             # Top of the list in cls.meta.config_sources takes precedence.
-            config_data |= {key.lower(): value for key, value in config_source(prefix=cls.meta.option_prefix).items()}
+            read_started_at = time.perf_counter()
+            config_data |= cls._read_config_source(config_source=config_source)
+            timings.config_sources[config_source] = time.perf_counter() - read_started_at
+        return config_data
+
+    @classmethod
+    def _secret_references(cls, config_data: dict[str, str]) -> dict[str, str]:
+        references = {}
+        for config_option in cls.meta.options.values():
+            key = config_option.fully_qualified_name.lower()
+            if not config_option.hardcoded and _config_secrets.is_secret_reference(config_data.get(key)):
+                references[key] = config_data[key]
+        return references
+
+    @classmethod
+    def _resolve_secret_references(
+        cls, config_data: dict[str, str], timings: _config_load_timings.ConfigLoadTimings
+    ) -> None:
+        """
+        Replaces `secret:` references held by options with the values of the secrets they reference, all fetched at
+        once rather than one at a time as each option is decoded.
+
+        Raises:
+            ValueError: A referenced secret does not exist.
+            PermissionError: Not authorized to access a referenced secret.
+        """
+        references = cls._secret_references(config_data=config_data)
+        if not references:
+            return
+        started_at = time.perf_counter()
+        config_data |= _config_secrets.resolve_secret_references(references=references)
+        timings.secret_references = time.perf_counter() - started_at
+
+    @classmethod
+    async def aload(cls) -> bool:
+        """
+        Loads the config without blocking the event loop.
+        All config sources are read concurrently. Config sources implementing AsyncConfigSource are awaited, while all
+        others are read in a worker thread. Values are then decoded, validated and applied in a worker thread as well.
+        Returns whether the loaded values were applied. Like `refresh_config`, they are not if the config was loaded by
+        other means while the config sources were being read, as those values are at least as new.
+        """
+        # Imported here rather than at the top, as asyncio is slow to import, and is already imported by any caller.
+        import asyncio
+
+        load_count = cls.meta.load_count
+        started_at = time.perf_counter()
+        timings = _config_load_timings.ConfigLoadTimings()
+        config_source_data = await asyncio.gather(
+            *(
+                cls._aread_config_source(config_source=config_source, timings=timings)
+                for config_source in cls.meta.config_sources
+            )
+        )
+        config_data: dict[str, str] = {}
+        for data in reversed(config_source_data):
+            # Top of the list in cls.meta.config_sources takes precedence.
+            config_data |= data
+        await asyncio.to_thread(cls._resolve_secret_references, config_data=config_data, timings=timings)
+        return await asyncio.to_thread(
+            cls._apply_config_data_unless_loaded_since,
+            config_data=config_data,
+            timings=timings,
+            started_at=started_at,
+            load_count=load_count,
+        )
+
+    @classmethod
+    def _read_config_source(cls, config_source: "_config_sources.ConfigSource") -> dict[str, str]:
+        session = _config_load_session.current_session()
+        if session is not None:
+            # Within a load session, each config source is only read once, and is already keyed by lowercase key.
+            return session(config_source=config_source, prefix=cls.meta.option_prefix)
+        return {key.lower(): value for key, value in config_source(prefix=cls.meta.option_prefix).items()}
 
-        config_options = [val for val in cls.__dict__.values() if isinstance(val, _config_option.ConfigOption)]
+    @classmethod
+    async def _aread_config_source(
+        cls, config_source: "_config_sources.ConfigSource", timings: _config_load_timings.ConfigLoadTimings
+    ) -> dict[str, str]:
+        import asyncio
+
+        started_at = time.perf_counter()
+        if _config_load_session.current_session() is None and isinstance(
+            config_source, _config_sources.AsyncConfigSource
+        ):
+            data = await config_source.acall(prefix=cls.meta.option_prefix)
+            config_data = {key.lower(): value for key, value in data.items()}
+        else:
+            # The context, and with it any load session, is copied over to the worker thread.
+            config_data = await asyncio.to_thread(cls._read_config_source, config_source=config_source)
+        timings.config_sources[config_source] = time.perf_counter() - started_at
+        return config_data
+
+    @classmethod
+    def _apply_config_data(
+        cls, config_data: dict[str, str], timings: _config_load_timings.ConfigLoadTimings, started_at: float
+    ) -> None:
+        # A single validation pass, so that validators checking the same paths share the filesystem queries.
+        with _config_value_validators.validation_pass():
+            staged_values = cls._stage_config_data(config_data=config_data, timings=timings)
+            cls._commit_option_values(staged_values=staged_values, load_timings=timings, load_started_at=started_at)
 
-        for config_option in config_options:
+    @classmethod
+    def _stage_config_data(
+        cls, config_data: dict[str, str], timings: _config_load_timings.ConfigLoadTimings
+    ) -> dict[str, tuple[_config_value_types.ConfigValueType | sentinel.Sentinel, typing.Any]]:
+        # Decode and validate every value before setting any, so that a bad value leaves the config as it was.
+        staged_values: dict[str, tuple[_config_value_types.ConfigValueType | sentinel.Sentinel, typing.Any]] = {}
+        for name, config_option in cls.meta.options.items():
+            if config_option.hardcoded:
+                continue
             if config_option.fully_qualified_name.lower() in config_data:
                 encoded_config_value: str = config_data.pop(config_option.fully_qualified_name.lower())
-                config_option.value = encoded_config_value
+                value = config_option.unchanged_value(encoded_value=encoded_config_value)
+                if value is not _config_option.Unset:
+                    # Unchanged since the last load, so already decoded and validated, or deferred.
+                    staged_values[name] = (value, config_option.encoded_value)
+                elif cls.meta.lazy_decode_options:
+                    # Decoded and validated on first read instead.
+                    staged_values[name] = (_config_option.Deferred, encoded_config_value)
+                else:
+                    decode_started_at = time.perf_counter()
+                    value = config_option.decode_value(encoded_value=encoded_config_value)
+                    decoded_at = time.perf_counter()
+                    config_option.validate_value(config_value=value)
+                    timings.decode[name] = decoded_at - decode_started_at
+                    timings.value_validators[name] = time.perf_counter() - decoded_at
+                    staged_values[name] = (value, encoded_config_value)
             elif config_option.has_default:
-                continue
+                # Fall back to the default, in case the option was set during a previous load.
+                staged_values[name] = (_config_option.Unset, _config_option.Unset)
             elif config_option.is_optional:
-                config_option.value = None
+                staged_values[name] = (None, _config_option.Unset)
             else:
                 raise ValueError(
                     f"Required config option {config_option.fully_qualified_name} with no default was not set."
@@ -172,27 +420,409 @@ class Config(metaclass=_ConfigMetaclass):
         #     for unused_config_option in config_data:
         #         logging.warning(f"Config option {unused_config_option} not supported by {cls.meta.name}.")
 
-        cls.meta.loaded = True
-        cls.validate()
+        return staged_values
+
+    @classmethod
+    def _commit_option_values(
+        cls,
+        staged_values: dict[str, tuple[_config_value_types.ConfigValueType | sentinel.Sentinel, typing.Any]],
+        load_timings: _config_load_timings.ConfigLoadTimings | None = None,
+        load_started_at: float = 0.0,
+    ) -> None:
+        """
+        Publishes prepared option values with a single swap of the value table, so that readers see either all of the
+        old values or all of the new ones. The config validators run against the prepared values first, which only the
+        thread running them sees, and the values are only published once they pass. Should they fail, the previous
+        values are restored.
+        Values from a load come with the timings of the load so far, and the time the load started at.
+        Must be called within `_change_lock`, which notifies subscribers to the change once the lock is released.
+        """
+        load = load_timings is not None
+        options = cls.meta.options
+        changed_options = frozenset(
+            name for name, (_, encoded_value) in staged_values.items() if encoded_value != options[name].encoded_value
+        )
+
+        previous_option_values = cls._option_values
+        previous_states = {name: options[name].state for name in staged_values}
+        for name, (value, encoded_value) in staged_values.items():
+            options[name].restore_value(value=value, encoded_value=encoded_value)
+
+        # Configs which are yet to be loaded publish their values on first load.
+        publish = load or cls.meta.loaded
+        if publish:
+            option_values = {name: option.value for name, option in options.items() if not option.is_deferred}
+            cls._option_values = _StagedOptionValues(current=previous_option_values, staged=option_values)
+
+        validate_started_at = time.perf_counter()
+        try:
+            # Loading for the first time validates the config as a whole. From then on, only what changed.
+            cls._validate(changed_options=None if load and not cls.meta.loaded else changed_options)
+        except BaseException:
+            for name, (value, encoded_value) in previous_states.items():
+                options[name].restore_value(value=value, encoded_value=encoded_value)
+            if publish:
+                cls._option_values = previous_option_values
+            raise
+
+        if publish:
+            cls._option_values = option_values
+        validated_at = time.perf_counter()
+
+        if load:
+            cls.meta.changed_options = changed_options
+            cls.meta.loaded = True
+        elif not publish:
+            # The config validators may have loaded the config in the meantime.
+            cls._publish_option_values()
         cls.post_load_hook()
 
+        if load_timings is not None:
+            finished_at = time.perf_counter()
+            load_timings.config_validators = validated_at - validate_started_at
+            load_timings.post_load_hook = finished_at - validated_at
+            load_timings.total = finished_at - load_started_at
+            cls.meta.load_count += 1
+            cls.meta.last_load_timings = load_timings
+            _config_load_timings.report(config=cls, timings=load_timings)
+
+        if changed_options and cls.meta.subscriptions:
+            cls.meta.pending_notifications.append((changed_options, cls.meta.subscriptions))
+
+    @classmethod
+    @contextlib.contextmanager
+    def _change_lock(cls) -> typing.Generator[None, None, None]:
+        """
+        Holds the config lock while changing the config. Subscribers to the changes made are notified once the
+        outermost change lock is released, so that they are never called with the config lock held.
+        """
+        meta = cls.meta
+        notifications: list[tuple[frozenset[str], tuple[_Subscription, ...]]] = []
+        try:
+            with meta.lock:
+                meta.change_depth += 1
+                try:
+                    yield
+                finally:
+                    meta.change_depth -= 1
+                    if meta.change_depth == 0:
+                        notifications, meta.pending_notifications = meta.pending_notifications, []
+        finally:
+            for changed_options, subscriptions in notifications:
+                cls._notify_subscribers(changed_options=changed_options, subscriptions=subscriptions)
+
+    @classmethod
+    def _notify_subscribers(cls, changed_options: frozenset[str], subscriptions: tuple[_Subscription, ...]) -> None:
+        for subscription in subscriptions:
+            options = changed_options if subscription.options is None else changed_options & subscription.options
+            if not options:
+                continue
+            if subscription.executor is None:
+                try:
+                    subscription.subscriber(config=cls, changed_options=options)
+                except Exception:
+                    logging.exception(f"Subscriber {subscription.subscriber} to {cls.meta.name} failed.")
+            else:
+                future = subscription.executor.submit(subscription.subscriber, config=cls, changed_options=options)
+                future.add_done_callback(
+                    functools.partial(_log_subscriber_failure, config=cls, subscription=subscription)
+                )
+
+    @classmethod
+    def _publish_option_values(cls) -> None:
+        if not cls.meta.loaded:
+            # Lazily loaded configs publish their values on first load.
+            return
+        # Build the new value table off to the side, then swap it in with a single assignment.
+        # Deferred options are published once they are first read and decoded.
+        cls._option_values = {name: option.value for name, option in cls.meta.options.items() if not option.is_deferred}
+
+    @classmethod
+    def _decode_deferred_option(cls, name: str) -> _config_value_types.ConfigValueType:
+        """
+        Raises:
+            ValueError: Value could not be decoded.
+            ConfigValueValidationError: Value does not pass validation.
+        """
+        # Decode under the lock, so that a concurrent reload cannot be overwritten with a value decoded from before it.
+        with cls.meta.lock:
+            option = cls.meta.options[name]
+            value = option.value
+            # Staged values are published in full once they pass the config validators.
+            if cls.meta.loaded and name not in cls._option_values and type(cls._option_values) is dict:
+                # Publish the decoded value, so that further reads take the fast path.
+                cls._option_values = {**cls._option_values, name: value}
+            return value
+
+    @classmethod
+    def validate_all(cls) -> None:
+        """
+        Decodes and validates every option, as well as the config as a whole.
+        For configs with `lazy_decode_options`, which otherwise only decode and validate options as they are read, to
+        fail early on bad values.
+
+        Raises:
+            ValueError: A value could not be decoded.
+            ConfigValueValidationError: A value does not pass validation.
+            ConfigValidationError: Config does not pass validation.
+        """
+        with _config_value_validators.validation_pass():
+            for name in cls.meta.options:
+                getattr(cls, name)
+            cls.validate()
+
+    @classmethod
+    def subscribe(
+        cls,
+        subscriber: ConfigSubscriber,
+        options: typing.Iterable[str] | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        """
+        Calls the subscriber whenever the config is loaded, or an option is set, and the value of any of the given
+        options, or of any option if none are given, changed. The subscriber is called once per change, with the names
+        of the options it subscribed to which changed.
+
+        Subscribers are called on the given executor, or if none is given, in the thread which changed the config, once
+        the change is complete and the config lock is released. Failing subscribers are logged, and do not fail the
+        change.
+
+        Example:
+        ```
+        def on_change(config: type[config.Config], changed_options: frozenset[str]) -> None:
+            ...
+
+        AppConfig.subscribe(subscriber=on_change, options=["DB_HOST", "DB_PORT"], executor=executor)
+        ```
+
+        Raises:
+            ValueError: An option does not exist on this config.
+        """
+        if options is not None:
+            options = frozenset(options)
+            if unknown_options := options - cls.meta.options.keys():
+                raise ValueError(f"{cls.meta.name} has no options {sorted(unknown_options)}.")
+        subscription = _Subscription(subscriber=subscriber, options=options, executor=executor)
+        with cls.meta.lock:
+            cls.meta.subscriptions = (*cls.meta.subscriptions, subscription)
+
+    @classmethod
+    def unsubscribe(cls, subscriber: ConfigSubscriber) -> None:
+        with cls.meta.lock:
+            cls.meta.subscriptions = tuple(
+                subscription for subscription in cls.meta.subscriptions if subscription.subscriber is not subscriber
+            )
+
     @classmethod
     def validate(cls) -> None:
         for validator in cls.meta.validators:
             validator(config=cls)
 
+    @classmethod
+    def _validate(cls, changed_options: frozenset[str] | None) -> None:
+        """
+        Runs the config validators which depend on any of the changed options, along with those not declaring what they
+        depend on, or all of them if changed_options is None.
+
+        Raises:
+            ConfigValidationError: Config does not pass validation.
+        """
+        validation_plan = cls.meta.validation_plan
+        if changed_options is None or validation_plan is None:
+            cls.validate()
+            return
+        for validator, depends_on in validation_plan:
+            if depends_on is None or not depends_on.isdisjoint(changed_options):
+                validator(config=cls)
+
     @classmethod
     def post_load_hook(cls) -> None:
         pass
 
     @classmethod
     def reload_config(cls) -> None:
+        """
+        Options whose encoded value is unchanged since the last load keep their value, without being decoded or
+        validated again. Dicts, lists and numeric arrays are replaced with a copy of the value as it was decoded, so
+        that changes made to them are undone.
+        """
         cls._load_config()
 
+    @classmethod
+    async def areload_config(cls) -> None:
+        await cls.aload()
+
+    @classmethod
+    def refresh_config(cls) -> bool:
+        """
+        Reloads the config like `reload_config`, but reads the config sources without holding the lock of the config,
+        so that neither readers nor writers of the config wait on slow config sources. Until the refresh completes, and
+        if it fails, the config keeps its current values.
+        Returns whether the refreshed values were applied. They are not if the config was loaded by other means while
+        the config sources were being read, as those values are at least as new.
+
+        Raises:
+            PermissionError: Could not read from a config source.
+            ConnectionError: Could not connect to a networked config source.
+            ValueError: A value could not be decoded, or a referenced secret does not exist.
+            ConfigValueValidationError: A value does not pass validation.
+            ConfigValidationError: Config does not pass validation.
+        """
+        load_count = cls.meta.load_count
+        started_at = time.perf_counter()
+        timings = _config_load_timings.ConfigLoadTimings()
+        config_data = cls._read_config_data(timings=timings)
+        cls._resolve_secret_references(config_data=config_data, timings=timings)
+        return cls._apply_config_data_unless_loaded_since(
+            config_data=config_data, timings=timings, started_at=started_at, load_count=load_count
+        )
+
+    @classmethod
+    def _apply_config_data_unless_loaded_since(
+        cls,
+        config_data: dict[str, str],
+        timings: _config_load_timings.ConfigLoadTimings,
+        started_at: float,
+        load_count: int,
+    ) -> bool:
+        # Load counts only ever go up, unlike load times, which can be equal for loads within the resolution of the
+        # clock, and are set back to those of another process by restored state.
+        with cls._change_lock():
+            if cls.meta.load_count != load_count:
+                return False
+            cls._apply_config_data(config_data=config_data, timings=timings, started_at=started_at)
+        return True
+
     @classmethod
     def save_to_file(cls, file: pathlib.Path) -> None:
-        # TODO
-        raise NotImplementedError()
+        """
+        Saves a snapshot of the decoded option values the config holds, along with a fingerprint of its config sources,
+        for `load_from_file` to warm start from. The config is not loaded again, unless it is yet to be loaded, so save
+        the snapshot straight after loading the config, for the fingerprint to match the values it holds.
+        The snapshot is a pickle, and holds the values of sensitive options. Protect it as you would the config itself.
+        Configs holding the values of `secret:` references are never snapshotted, so that secrets are never written to
+        disk.
+
+        Raises:
+            ValueError: A config source does not implement FingerprintableConfigSource, or cannot currently be
+                fingerprinted, or an option holds the value of a `secret:` reference.
+            PermissionError: Could not write to the file.
+        """
+        fingerprint = cls._fingerprint()
+        if fingerprint is None:
+            raise ValueError(
+                f"The config sources of {cls.meta.name} cannot be fingerprinted, so cannot be snapshotted."
+            )
+        with cls._change_lock():
+            if not cls.meta.loaded:
+                cls._load_config()
+            values, _ = cls._export_option_values()
+        if secret_options := [
+            name
+            for name, (encoded_value, _) in values.items()
+            if isinstance(encoded_value, _config_secrets.SecretValue)
+        ]:
+            raise ValueError(
+                f"{cls.meta.name} holds the values of secrets in {sorted(secret_options)}, so cannot be snapshotted."
+            )
+        _config_snapshot.write_snapshot(file=file, fingerprint=fingerprint, values=values)
+
+    @classmethod
+    def load_from_file(cls, file: pathlib.Path) -> bool:
+        """
+        Loads the config from a snapshot written by `save_to_file`, if the config sources still match the fingerprint
+        saved alongside it. Neither are the config sources read, nor are the option values decoded or validated again.
+        Config validators and the post load hook still run.
+        Only load snapshots written by this application, as loading a snapshot can execute arbitrary code.
+
+        Returns whether the config was loaded from the snapshot.
+
+        Example:
+        ```
+        class AppConfig(config.Config, lazy_load_config=True):
+            ...
+
+        if not AppConfig.load_from_file(file=SNAPSHOT_FILE):
+            AppConfig.reload_config()
+            AppConfig.save_to_file(file=SNAPSHOT_FILE)
+        ```
+        """
+        started_at = time.perf_counter()
+        fingerprint = cls._fingerprint()
+        if fingerprint is None:
+            return False
+        values = _config_snapshot.read_snapshot(file=file, fingerprint=fingerprint)
+        if values is None:
+            logging.debug(f"Snapshot {file} of {cls.meta.name} is missing, unreadable, or out of date.")
+            return False
+        cls._restore_option_values(values=values, started_at=started_at)
+        return True
+
+    @classmethod
+    def _export_option_values(cls) -> tuple[dict[str, tuple[typing.Any, typing.Any]], dict[str, typing.Any]]:
+        """
+        Returns the values of options not holding their default, as option name to (encoded value, decoded value), with
+        unset encoded values as None, alongside the values of hardcoded options.
+        """
+        values: dict[str, tuple[typing.Any, typing.Any]] = {}
+        hardcoded_values: dict[str, typing.Any] = {}
+        for name, option in cls.meta.options.items():
+            if option.hardcoded:
+                hardcoded_values[name] = option.value
+                continue
+            # Options holding their default resolve to it on load.
+            if option.encoded_value is _config_option.Unset and option.value is not None:
+                continue
+            encoded_value = option.encoded_value
+            values[name] = (None if isinstance(encoded_value, sentinel.Sentinel) else encoded_value, option.value)
+        return values, hardcoded_values
+
+    @classmethod
+    def _restore_option_values(
+        cls,
+        values: dict[str, tuple[typing.Any, typing.Any]],
+        hardcoded_values: dict[str, typing.Any] | None = None,
+        last_loaded_at: datetime.datetime | None = None,
+        started_at: float | None = None,
+    ) -> None:
+        """
+        Loads the config from values returned by `_export_option_values`, without decoding or validating them again.
+
+        Raises:
+            ConfigValidationError: Config does not pass validation.
+        """
+        started_at = time.perf_counter() if started_at is None else started_at
+        staged_values: dict[str, tuple[_config_value_types.ConfigValueType | sentinel.Sentinel, typing.Any]] = {}
+        for name, option in cls.meta.options.items():
+            if option.hardcoded:
+                continue
+            if name in values:
+                encoded_value, value = values[name]
+                staged_values[name] = (value, _config_option.Unset if encoded_value is None else encoded_value)
+            else:
+                staged_values[name] = (_config_option.Unset, _config_option.Unset)
+        with cls._change_lock():
+            cls._commit_option_values(
+                staged_values=staged_values,
+                load_timings=_config_load_timings.ConfigLoadTimings(),
+                load_started_at=started_at,
+            )
+            for name, value in (hardcoded_values or {}).items():
+                cls.hardcode_config_value(option=name, value=value)
+            if last_loaded_at is not None:
+                cls.meta.last_loaded_at = last_loaded_at
+
+    @classmethod
+    def _fingerprint(cls) -> str | None:
+        fingerprints = [cls.meta.options_fingerprint]
+        for config_source in cls.meta.config_sources:
+            if not isinstance(config_source, _config_sources.FingerprintableConfigSource):
+                return None
+            fingerprint = config_source.fingerprint(prefix=cls.meta.option_prefix)
+            if fingerprint is None:
+                return None
+            fingerprints.append(f"{type(config_source).__qualname__}:{fingerprint}")
+        return "\n".join(fingerprints)
 
     @classmethod
     def get_documentation(cls) -> str:
@@ -207,16 +837,57 @@ class Config(metaclass=_ConfigMetaclass):
     @classmethod
     def set_config_value(cls, option: str, value: _config_value_types.ConfigValueType) -> None:
         config_option = cls.get_config_option(option=option)
-        config_option.value = value
-        cls.validate()
-        cls.post_load_hook()
+        with cls._change_lock(), _config_value_validators.validation_pass():
+            if config_option.hardcoded:
+                return
+            staged_value = cls._prepare_option_value(config_option=config_option, value=value)
+            cls._commit_option_values(staged_values={option: staged_value})
 
     @classmethod
     def hardcode_config_value(cls, option: str, value: _config_value_types.ConfigValueType) -> None:
         config_option = cls.get_config_option(option=option)
-        config_option.hardcode_value(value=value)
-        cls.validate()
-        cls.post_load_hook()
+        with cls._change_lock(), _config_value_validators.validation_pass():
+            staged_value = cls._prepare_option_value(config_option=config_option, value=value)
+            hardcoded = config_option.hardcoded
+            config_option.hardcoded = False
+            try:
+                cls._commit_option_values(staged_values={option: staged_value})
+            except BaseException:
+                config_option.hardcoded = hardcoded
+                raise
+            config_option.hardcoded = True
+
+    @staticmethod
+    def _prepare_option_value(
+        config_option: _config_option.ConfigOption, value: _config_value_types.ConfigValueType
+    ) -> tuple[_config_value_types.ConfigValueType | sentinel.Sentinel, typing.Any]:
+        """
+        Raises:
+            ValueError: Value could not be decoded, or is None for an option which is not optional.
+            ConfigValueValidationError: Value does not pass validation.
+        """
+        if isinstance(value, str):
+            current_value = config_option.unchanged_value(encoded_value=value)
+            if current_value is not _config_option.Unset:
+                # Unchanged, so already decoded and validated, or deferred.
+                return current_value, config_option.encoded_value
+        return config_option.prepare_value(maybe_encoded_value=value)
+
+    @classmethod
+    def option_values(cls) -> typing.Mapping[str, _config_value_types.ConfigValueType]:
+        """
+        Values of all options, as a read-only mapping of option name to value.
+        Reading options one at a time while the config is reloaded in another thread may mix values from before and
+        after the reload. The returned mapping holds values from a single load.
+        """
+        if not cls.meta.loaded:
+            with cls._change_lock():
+                if not cls.meta.loaded:
+                    cls._load_config()
+        option_values = cls._option_values
+        if isinstance(option_values, _StagedOptionValues):
+            option_values = option_values.for_current_thread()
+        return types.MappingProxyType(option_values)
 
     @classmethod
     def last_loaded_at(cls) -> datetime.datetime | None:
@@ -224,8 +895,21 @@ class Config(metaclass=_ConfigMetaclass):
 
     @classmethod
     def last_load_contained_changes(cls) -> bool:
-        # TODO: Implement this
-        return False
+        return bool(cls.meta.changed_options)
+
+    @classmethod
+    def last_load_changed_options(cls) -> frozenset[str]:
+        """Names of the options whose encoded value changed during the last load."""
+        return cls.meta.changed_options
+
+
+def _log_subscriber_failure(
+    future: concurrent.futures.Future[None], config: type[Config], subscription: _Subscription
+) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logging.error(
+            f"Subscriber {subscription.subscriber} to {config.meta.name} failed.", exc_info=future.exception()
+        )
 
 
 # TODO: How do we allow custom config sources if SOURCE is a literal?
@@ -256,6 +940,12 @@ class ConfigSourcesConfig(
         """,
         validators=[_config_value_validators.ValidateFileExists(), _config_value_validators.ValidatePathIsReadable()],
     )
+    SOURCE_DOCUMENT_FORMAT: typing.Literal["PLAIN_TEXT", "JSON", "TOML"] | None = _config_option.Option(
+        description="""
+        Document format of the LOCAL_FILE and REMOTE_HTTP_FILE config sources. Defaults to JSON for files ending in
+        .json, TOML for files ending in .toml, and PLAIN_TEXT otherwise.
+        """
+    )
     SOURCE_REMOTE_HTTP_FILE_URL: str | None = _config_option.Option(
         description="""
         URL for the REMOTE_HTTP_FILE config source. Required when PYTHON_SDK_CONFIG_SOURCE is set to REMOTE_HTTP_FILE.
@@ -271,6 +961,24 @@ class ConfigSourcesConfig(
         default=f"python-sdk-{python_sdk.__version__}",
         description="User-Agent string to send along when accessing the REMOTE_HTTP_FILE config source.",
     )
+    SOURCE_S3_FILE_URL: str | None = _config_option.Option(
+        description="""
+        URL for the S3_FILE config source, in the form of s3://bucket/key. Required when PYTHON_SDK_CONFIG_SOURCE is
+        set to S3_FILE.
+        """
+    )
+    SOURCE_AWS_SECRETS_MANAGER_SECRET_ID: str | None = _config_option.Option(
+        description="""
+        Name or ARN of the secret for the AWS_SECRETS_MANAGER_SECRET config source. Required when
+        PYTHON_SDK_CONFIG_SOURCE is set to AWS_SECRETS_MANAGER_SECRET.
+        """
+    )
+    SOURCE_AWS_PARAMETER_STORE_DOCUMENT_NAME: str | None = _config_option.Option(
+        description="""
+        Name of the parameter for the AWS_PARAMETER_STORE_DOCUMENT config source. Required when
+        PYTHON_SDK_CONFIG_SOURCE is set to AWS_PARAMETER_STORE_DOCUMENT.
+        """
+    )
 
     @classmethod
     def validate(cls) -> None:
@@ -283,6 +991,26 @@ class ConfigSourcesConfig(
                 "PYTHON_SDK_CONFIG_SOURCE_REMOTE_HTTP_FILE_URL must be set when PYTHON_SDK_CONFIG_SOURCE is "
                 "REMOTE_HTTP_FILE."
             )
+        if cls.SOURCE == "S3_FILE" and not cls.SOURCE_S3_FILE_URL:
+            raise _config_validators.ConfigValidationError(
+                "PYTHON_SDK_CONFIG_SOURCE_S3_FILE_URL must be set when PYTHON_SDK_CONFIG_SOURCE is S3_FILE."
+            )
+        if cls.SOURCE == "AWS_SECRETS_MANAGER_SECRET" and not cls.SOURCE_AWS_SECRETS_MANAGER_SECRET_ID:
+            raise _config_validators.ConfigValidationError(
+                "PYTHON_SDK_CONFIG_SOURCE_AWS_SECRETS_MANAGER_SECRET_ID must be set when PYTHON_SDK_CONFIG_SOURCE is "
+                "AWS_SECRETS_MANAGER_SECRET."
+            )
+        if cls.SOURCE == "AWS_PARAMETER_STORE_DOCUMENT" and not cls.SOURCE_AWS_PARAMETER_STORE_DOCUMENT_NAME:
+            raise _config_validators.ConfigValidationError(
+                "PYTHON_SDK_CONFIG_SOURCE_AWS_PARAMETER_STORE_DOCUMENT_NAME must be set when PYTHON_SDK_CONFIG_SOURCE "
+                "is AWS_PARAMETER_STORE_DOCUMENT."
+            )
+
+
+def _depends_on(validator: "_config_validators.ConfigValidator") -> frozenset[str] | None:
+    if isinstance(validator, _config_validators.DependentConfigValidator):
+        return frozenset(validator.depends_on)
+    return None
 
 
 def _get_config_sources() -> list["_config_sources.ConfigSource"]:
@@ -290,7 +1018,12 @@ def _get_config_sources() -> list["_config_sources.ConfigSource"]:
         return [_config_sources.EnvironmentVariables()]
     elif ConfigSourcesConfig.SOURCE == "LOCAL_FILE":
         assert ConfigSourcesConfig.SOURCE_LOCAL_FILE_FILEPATH is not None
-        return [_config_sources.LocalFile(filepath=ConfigSourcesConfig.SOURCE_LOCAL_FILE_FILEPATH)]
+        return [
+            _config_sources.LocalFile(
+                filepath=ConfigSourcesConfig.SOURCE_LOCAL_FILE_FILEPATH,
+                document_format=ConfigSourcesConfig.SOURCE_DOCUMENT_FORMAT,
+            )
+        ]
     elif ConfigSourcesConfig.SOURCE == "REMOTE_HTTP_FILE":
         assert ConfigSourcesConfig.SOURCE_REMOTE_HTTP_FILE_URL is not None
         return [
@@ -299,6 +1032,22 @@ def _get_config_sources() -> list["_config_sources.ConfigSource"]:
                 timeout=ConfigSourcesConfig.SOURCE_REMOTE_HTTP_FILE_TIMEOUT,
                 authorization_header=ConfigSourcesConfig.SOURCE_REMOTE_HTTP_FILE_AUTHORIZATION_HEADER,
                 user_agent_string=ConfigSourcesConfig.SOURCE_REMOTE_HTTP_FILE_USER_AGENT_STRING,
+                document_format=ConfigSourcesConfig.SOURCE_DOCUMENT_FORMAT,
+            )
+        ]
+    elif ConfigSourcesConfig.SOURCE == "S3_FILE":
+        assert ConfigSourcesConfig.SOURCE_S3_FILE_URL is not None
+        return [_config_sources.S3File(url=ConfigSourcesConfig.SOURCE_S3_FILE_URL)]
+    elif ConfigSourcesConfig.SOURCE == "AWS_SECRETS_MANAGER_SECRET":
+        assert ConfigSourcesConfig.SOURCE_AWS_SECRETS_MANAGER_SECRET_ID is not None
+        return [
+            _config_sources.AWSSecretsManagerSecret(secret_id=ConfigSourcesConfig.SOURCE_AWS_SECRETS_MANAGER_SECRET_ID)
+        ]
+    elif ConfigSourcesConfig.SOURCE == "AWS_PARAMETER_STORE_DOCUMENT":
+        assert ConfigSourcesConfig.SOURCE_AWS_PARAMETER_STORE_DOCUMENT_NAME is not None
+        return [
+            _config_sources.AWSParameterStoreDocument(
+                parameter_name=ConfigSourcesConfig.SOURCE_AWS_PARAMETER_STORE_DOCUMENT_NAME
             )
         ]
     raise NotImplementedError()
@@ -0,0 +1,120 @@
+import bisect
+import contextlib
+import contextvars
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from python_sdk.config import _config_sources
+
+
+class PrefixIndex:
+    """
+    Configuration from a single config source, with lowercase keys kept sorted, so that all keys starting with a given
+    prefix can be found by bisection rather than by scanning every key.
+    Slices are keyed by lowercase key, unless `preserve_case` is given, in which case they are keyed as given.
+    """
+
+    _keys: list[str]
+    _sliced_keys: list[str]
+    _values: list[str]
+
+    def __init__(self, configuration: typing.Mapping[str, str], preserve_case: bool = False) -> None:
+        if preserve_case:
+            items = sorted(configuration.items(), key=lambda item: item[0].lower())
+            self._keys = [key.lower() for key, _ in items]
+            self._sliced_keys = [key for key, _ in items]
+            self._values = [value for _, value in items]
+        else:
+            lowercase_configuration = {key.lower(): value for key, value in configuration.items()}
+            self._keys = self._sliced_keys = sorted(lowercase_configuration)
+            self._values = [lowercase_configuration[key] for key in self._keys]
+
+    def slice(self, prefix: str) -> dict[str, str]:
+        prefix = prefix.lower()
+        configuration = {}
+        for i in range(bisect.bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            configuration[self._sliced_keys[i]] = self._values[i]
+        return configuration
+
+
+class _LoadSession:
+    """
+    Materializes each config source once, and serves every Config class loaded within the session from that snapshot.
+    """
+
+    # None for config sources which could not be read whole, and so are read per prefix instead.
+    _indexes: dict["_config_sources.ConfigSource", PrefixIndex | None]
+    _locks: dict["_config_sources.ConfigSource", threading.Lock]
+    _lock: threading.Lock
+    # Values of `secret:` references resolved within the session, keyed by reference.
+    secrets: dict[str, str]
+
+    def __init__(self) -> None:
+        self._indexes = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.secrets = {}
+
+    def __call__(self, config_source: "_config_sources.ConfigSource", prefix: str) -> dict[str, str]:
+        """
+        Raises:
+            PermissionError: Could not read from config source.
+            ConnectionError: Could not connect to a networked config source.
+            ValueError: Could not parse the config file, which may be malformed.
+        """
+        with self._lock:
+            source_lock = self._locks.setdefault(config_source, threading.Lock())
+
+        # Lock per config source, so that different config sources can be read concurrently, but each only once.
+        with source_lock:
+            if config_source in self._indexes:
+                index = self._indexes[config_source]
+            else:
+                try:
+                    index = PrefixIndex(configuration=config_source(prefix=""))
+                except ValueError:
+                    # Outside a session, plain text documents are only parsed under the prefix being loaded, so a
+                    # malformed line elsewhere in the document fails none of the loads. Read those per prefix instead,
+                    # so that loading within a session fails the same loads as without.
+                    index = None
+                self._indexes[config_source] = index
+        if index is None:
+            return {key.lower(): value for key, value in config_source(prefix=prefix).items()}
+        return index.slice(prefix=prefix)
+
+
+_SESSION: contextvars.ContextVar[_LoadSession | None] = contextvars.ContextVar(
+    "_PYTHON_SDK_CONFIG_LOAD_SESSION", default=None
+)
+
+
+def current_session() -> _LoadSession | None:
+    return _SESSION.get()
+
+
+@contextlib.contextmanager
+def load_session() -> typing.Generator[None, None, None]:
+    """
+    Within a load session, each config source is read and parsed once, no matter how many Config classes are loaded
+    from it. Changes made to a config source during the session are not picked up until the next session.
+    Nested sessions share the outermost session.
+
+    Example:
+    ```
+    with config.load_session():
+        import app.config
+        import db.config
+    ```
+    """
+    if _SESSION.get() is not None:
+        yield
+        return
+
+    token = _SESSION.set(_LoadSession())
+    try:
+        yield
+    finally:
+        _SESSION.reset(token)
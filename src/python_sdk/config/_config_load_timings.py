@@ -0,0 +1,61 @@
+import dataclasses
+import logging
+import typing
+
+if typing.TYPE_CHECKING:
+    from python_sdk.config import _config
+    from python_sdk.config import _config_sources
+
+
+@dataclasses.dataclass
+class ConfigLoadTimings:
+    """
+    Seconds spent in each phase of a config load.
+    Options decoded lazily, with `lazy_decode_options`, are decoded and validated on first read rather than during the
+    load, so do not appear in `decode` and `value_validators`. Neither do options whose encoded value is unchanged since
+    the previous load, as their values are kept without being decoded and validated again.
+    """
+
+    config_sources: dict["_config_sources.ConfigSource", float] = dataclasses.field(default_factory=dict)
+    secret_references: float = 0.0
+    decode: dict[str, float] = dataclasses.field(default_factory=dict)
+    value_validators: dict[str, float] = dataclasses.field(default_factory=dict)
+    config_validators: float = 0.0
+    post_load_hook: float = 0.0
+    total: float = 0.0
+
+
+class ConfigLoadTimingsHook(typing.Protocol):
+    def __call__(self, config: type["_config.Config"], timings: ConfigLoadTimings) -> None:
+        """Called after every successful config load."""
+        ...
+
+
+_HOOK: ConfigLoadTimingsHook | None = None
+
+
+def set_load_timings_hook(hook: ConfigLoadTimingsHook | None) -> None:
+    """
+    Sets a hook to be called with the timings of every successful config load, such as to export them as metrics.
+    Pass None to remove the hook.
+
+    Example:
+    ```
+    def report(config: type[config.Config], timings: config.ConfigLoadTimings) -> None:
+        metrics.histogram("config.load.seconds", timings.total, tags={"config": config.meta.name})
+
+    config.set_load_timings_hook(hook=report)
+    ```
+    """
+    global _HOOK
+    _HOOK = hook
+
+
+def report(config: type["_config.Config"], timings: ConfigLoadTimings) -> None:
+    hook = _HOOK
+    if hook is None:
+        return
+    try:
+        hook(config=config, timings=timings)
+    except Exception:
+        logging.exception(f"Load timings hook failed for {config.meta.name}.")
@@ -11,6 +11,8 @@ if typing.TYPE_CHECKING:
     from python_sdk.config import _config_value_validators
 
 Unset: sentinel.Sentinel = sentinel.Sentinel("Unset")
+# Value of an option whose encoded value is only decoded on first read.
+Deferred: sentinel.Sentinel = sentinel.Sentinel("Deferred")
 
 
 # TODO?: Rename to Option
@@ -23,8 +25,14 @@ class ConfigOption:
     validators: list["_config_value_validators.ConfigValueValidator"]
     hardcoded: bool
     is_sensitive: bool
+    is_optional: bool
+    _real_datatype: type
+    _decoder: "_string_decoder.StringDecoder"
     _value: typing.Union["_config_value_types.ConfigValueType", sentinel.Sentinel, None]
     _encoded_value: str | sentinel.Sentinel
+    # The encoded value last decoded to a value which can be changed in place, alongside a copier of that value as it
+    # was decoded, so that unchanged values are copied rather than decoded and validated again.
+    _decoded: tuple[str, typing.Callable[[], "_config_value_types.ConfigValueType"]] | None
 
     SECRET_REFERENCE_TOKEN: str = "secret:"
 
@@ -52,35 +60,48 @@ class ConfigOption:
         self.is_sensitive = is_sensitive
         self._value = Unset
         self._encoded_value = Unset
+        self._decoded = None
 
-        if not _string_decoder.type_is_supported(data_type=self._real_datatype):
-            raise ValueError(f"{self.datatype} not supported.")
+        # Resolve everything derived from the datatype once, up front, as the datatype never changes.
+        # Doing this on every value set is measurably slow when reloading many options.
+        self.is_optional = _optional_type.is_optional_type(data_type=self.datatype)
+        self._real_datatype = (
+            _optional_type.get_type_in_optional_type(data_type=self.datatype) if self.is_optional else self.datatype
+        )
+        try:
+            self._decoder = _string_decoder.get_string_decoder(data_type=self._real_datatype)
+        except NotImplementedError as e:
+            raise ValueError(f"{self.datatype} not supported.") from e
 
         if self.has_default and self.default is not None:
-            self._run_validators(config_value=self.default)
+            self.validate_value(config_value=self.default)
 
     @property
     def fully_qualified_name(self) -> str:
         return f"{self.prefix}{self.name}"
 
     @property
-    def is_optional(self) -> bool:
-        return _optional_type.is_optional_type(data_type=self.datatype)
+    def encoded_value(self) -> typing.Union[str, "_config_value_types.ConfigValueType", sentinel.Sentinel]:
+        return self._encoded_value
 
     @property
-    def has_default(self) -> bool:
-        return self.default is not Unset
+    def is_deferred(self) -> bool:
+        return self._value is Deferred
 
     @property
-    def _real_datatype(self) -> type:
-        return (
-            _optional_type.get_type_in_optional_type(data_type=self.datatype)
-            if _optional_type.is_optional_type(data_type=self.datatype)
-            else self.datatype
-        )
+    def state(self) -> tuple[typing.Union["_config_value_types.ConfigValueType", sentinel.Sentinel], typing.Any]:
+        """The value and encoded value of the option as they are stored, for handing back to `restore_value`."""
+        return self._value, self._encoded_value
+
+    @property
+    def has_default(self) -> bool:
+        return self.default is not Unset
 
     @property
     def value(self) -> "_config_value_types.ConfigValueType":
+        if self._value is Deferred:
+            assert isinstance(self._encoded_value, str)
+            self._value, self._encoded_value = self.prepare_value(maybe_encoded_value=self._encoded_value)
         if self._value is not Unset:
             return self._value
         if self.default is not Unset:
@@ -94,16 +115,27 @@ class ConfigOption:
         if self.hardcoded:
             return
 
+        self._value, self._encoded_value = self.prepare_value(maybe_encoded_value=maybe_encoded_value)
+
+    def prepare_value(
+        self, maybe_encoded_value: typing.Union["_config_value_types.ConfigValueType", str, None]
+    ) -> tuple["_config_value_types.ConfigValueType", typing.Any]:
+        """
+        Decodes and validates a value without setting it, so that a whole set of values can be prepared before any of
+        them are set. Returns the decoded value, alongside the encoded value to set with it.
+
+        Raises:
+            ValueError: Value could not be decoded, or is None for an option which is not optional.
+            ConfigValueValidationError: Value does not pass validation.
+        """
         if maybe_encoded_value is None:
             # Value is being set to None. This is valid so long as this option is optional.
             if not self.is_optional:
                 raise ValueError(f"{self.fully_qualified_name} is not optional.")
-            self._value = None
-            self._encoded_value = Unset
-            return
+            return None, Unset
         elif isinstance(maybe_encoded_value, str):
             # Value may be encoded, let's decode it
-            value = _string_decoder.decode_string(string=maybe_encoded_value, data_type=self._real_datatype)
+            value = self.decode_value(encoded_value=maybe_encoded_value)
         else:
             # Caller provided a decoded value, lets make a copy
             # Note that we do not validate that the decoded value is of correct type. This is intentional.
@@ -111,17 +143,79 @@ class ConfigOption:
             # themselves in the foot, and in turn, we avoid the significant complexity of validating data types.
             value = copy.deepcopy(maybe_encoded_value)
 
-        self._run_validators(config_value=value)
+        self.validate_value(config_value=value)
 
-        self._value = value
-        self._encoded_value = maybe_encoded_value
+        return value, maybe_encoded_value
 
-    def hardcode_value(self, value: "_config_value_types.ConfigValueType") -> None:
+    def restore_value(
+        self,
+        value: typing.Union["_config_value_types.ConfigValueType", sentinel.Sentinel],
+        encoded_value: typing.Any,
+    ) -> None:
+        """
+        Sets a value which was already decoded and validated, such as one from `prepare_value` or a snapshot, skipping
+        both. Setting both to Unset falls back to the default. Setting the value to Deferred decodes and validates the
+        encoded value on first read instead.
+        """
+        if self.hardcoded:
+            return
+        self._value = value
+        self._encoded_value = encoded_value
+
+    def hardcode_value(self, value: typing.Union["_config_value_types.ConfigValueType", str, None]) -> None:
+        """
+        Decodes and validates a value, and sets it for good, so that loading the config leaves it as it is.
+        Prefer `Config.hardcode_config_value`, which also runs the config validators and publishes the value straight
+        away, rather than on the next load.
+
+        Raises:
+            ValueError: Value could not be decoded, or is None for an option which is not optional.
+            ConfigValueValidationError: Value does not pass validation.
+        """
+        value, encoded_value = self.prepare_value(maybe_encoded_value=value)
         self.hardcoded = False
-        self.value = value
+        self.restore_value(value=value, encoded_value=encoded_value)
         self.hardcoded = True
 
-    def _run_validators(self, config_value: "_config_value_types.ConfigValueType") -> None:
+    def unchanged_value(
+        self, encoded_value: str
+    ) -> typing.Union["_config_value_types.ConfigValueType", sentinel.Sentinel]:
+        """
+        Returns the value of the option if the given encoded value is the one it holds, so is already decoded and
+        validated, or Deferred if it is yet to be. Values which can be changed in place are handed out as a fresh copy
+        of the value as it was decoded, so that changes made to the current value do not survive.
+        Returns Unset if the encoded value has to be decoded and validated again.
+        """
+        value, current_encoded_value = self.state
+        if value is Unset or not isinstance(current_encoded_value, str) or current_encoded_value != encoded_value:
+            return Unset
+        if self._decoded is not None and self._decoded[0] is current_encoded_value:
+            return self._decoded[1]()
+        if isinstance(value, _string_decoder.MUTABLE_TYPES):
+            # Restored from a snapshot, or from the state of another process, so not decoded by this option.
+            return Unset
+        return value
+
+    def decode_value(self, encoded_value: str) -> "_config_value_types.ConfigValueType":
+        """
+        Raises:
+            ValueError: Value could not be decoded.
+        """
+        value = self._decoder(encoded_value)
+        if isinstance(value, _string_decoder.MUTABLE_TYPES):
+            # The decoded value is kept back, and only ever handed out as a copy.
+            copy_value: typing.Callable[[], "_config_value_types.ConfigValueType"] = (
+                _string_decoder.decoded_value_copier(value)
+            )
+            self._decoded = (encoded_value, copy_value)
+            return copy_value()
+        return value
+
+    def validate_value(self, config_value: "_config_value_types.ConfigValueType") -> None:
+        """
+        Raises:
+            ConfigValueValidationError: Value does not pass validation.
+        """
         for validator in self.validators:
             validator(config_option_name=self.name, config_option=self, config_value=config_value)
 
@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+import typing
+import weakref
+
+from python_sdk.config import _config_load_session
+from python_sdk.config import _config_load_timings
+from python_sdk.config import _config_secrets
+from python_sdk.config import _config_value_validators
+
+if typing.TYPE_CHECKING:
+    from python_sdk.config import _config
+
+# Weak references, so that registering a Config class does not keep it alive, e.g. classes defined within functions.
+_REGISTRY: list[weakref.ref[type["_config.Config"]]] = []
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register(config: type["_config.Config"]) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.append(weakref.ref(config))
+
+
+def registered_configs() -> list[type["_config.Config"]]:
+    """All Config classes defined so far, in the order they were defined in."""
+    with _REGISTRY_LOCK:
+        _REGISTRY[:] = [ref for ref in _REGISTRY if ref() is not None]
+        return [config for ref in _REGISTRY if (config := ref()) is not None]
+
+
+def load_all(configs: typing.Iterable[type["_config.Config"]] | None = None) -> dict[type["_config.Config"], float]:
+    """
+    Loads every registered Config class, or every given Config class, which is yet to be loaded, such as those with
+    `lazy_load_config`. See `reload_all`.
+
+    Raises:
+        Exception: The first exception raised while loading a Config class. The others are logged.
+    """
+    configs = registered_configs() if configs is None else configs
+    return _load(configs=[config for config in configs if not config.meta.loaded])
+
+
+def reload_all(configs: typing.Iterable[type["_config.Config"]] | None = None) -> dict[type["_config.Config"], float]:
+    """
+    Reloads every registered Config class, or every given Config class, within a single load session, so that each
+    config source is only read once.
+    Registered classes are reloaded in the order they were defined in, so that classes are reloaded after the classes
+    they were defined in terms of, such as ConfigSourcesConfig.
+    A class failing to reload does not prevent the others from being reloaded.
+
+    Returns how long each class took to reload, in seconds.
+
+    Raises:
+        Exception: The first exception raised while reloading a Config class. The others are logged.
+    """
+    return _load(configs=registered_configs() if configs is None else list(configs))
+
+
+def _load(configs: list[type["_config.Config"]]) -> dict[type["_config.Config"], float]:
+    durations: dict[type["_config.Config"], float] = {}
+    first_exception: Exception | None = None
+
+    # Within one load session and validation pass, so that config sources are read, and validated paths are queried,
+    # once for all of the Config classes.
+    with _config_load_session.load_session(), _config_value_validators.validation_pass():
+        _prefetch_secret_references(configs=configs)
+        for config in configs:
+            started_at = time.perf_counter()
+            try:
+                config.reload_config()
+            except Exception as e:
+                logging.exception(f"Failed to load {config.meta.name} ({config.__qualname__}).")
+                first_exception = first_exception or e
+            durations[config] = time.perf_counter() - started_at
+            logging.debug(f"Loaded {config.meta.name} ({config.__qualname__}) in {durations[config] * 1e3:.1f}ms.")
+
+    if first_exception is not None:
+        raise first_exception
+    return durations
+
+
+def _prefetch_secret_references(configs: list[type["_config.Config"]]) -> None:
+    # Resolve the `secret:` references of every Config class at once, rather than one Config class at a time, into the
+    # load session they are then loaded from. Failures surface when loading the Config classes holding the references.
+    references: dict[str, str] = {}
+    try:
+        for i, config in enumerate(configs):
+            config_data = config._read_config_data(timings=_config_load_timings.ConfigLoadTimings())
+            references |= {
+                f"{i}.{key}": reference for key, reference in config._secret_references(config_data=config_data).items()
+            }
+        if references:
+            _config_secrets.resolve_secret_references(references=references)
+    except Exception:
+        logging.debug("Failed to prefetch secret references.", exc_info=True)
@@ -0,0 +1,349 @@
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import os
+import pathlib
+import random
+import select
+import sys
+import threading
+import time
+import typing
+
+from python_sdk.config import _config_registry
+from python_sdk.config import _config_sources
+
+if typing.TYPE_CHECKING:
+    from python_sdk.config import _config
+
+# Subset of the inotify event masks from <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+)
+_INOTIFY_READ_BUFFER_SIZE = 64 * 1024
+
+_FileSignature: typing.TypeAlias = tuple[int, int, int] | None
+
+
+def _file_signature(filepath: pathlib.Path) -> _FileSignature:
+    # Compare on inode as well as mtime and size, to catch files atomically replaced by a rename.
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+class _Inotify:
+    """
+    Minimal inotify wrapper, watching the parent directories of the given files.
+    Directories rather than files are watched, so that files replaced by a rename (editors, Kubernetes ConfigMaps) are
+    still picked up.
+    """
+
+    def __init__(self, directories: typing.Iterable[pathlib.Path]) -> None:
+        """
+        Raises:
+            OSError: inotify is not available on this system.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux.")
+        # Deferred, as ctypes.util imports subprocess, and only reloaders watching with inotify need it.
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed.")
+        for directory in directories:
+            if libc.inotify_add_watch(self._fd, os.fsencode(directory), _INOTIFY_WATCH_MASK) < 0:
+                error = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(error, f"inotify_add_watch failed for {directory}.")
+
+    def wait(self, timeout: float) -> bool:
+        """Waits up to `timeout` seconds for any events. Returns whether any events were received."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        # We re-check the signatures of all watched files on any event, so the events themselves can be discarded.
+        # Kubernetes ConfigMaps, for example, are updated by swapping a symlink that has a different name to our file.
+        while True:
+            try:
+                os.read(self._fd, _INOTIFY_READ_BUFFER_SIZE)
+            except BlockingIOError:
+                return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class LocalFileReloader:
+    """
+    Reloads Config classes in the background whenever a LocalFile they source configuration from changes.
+    Changes are detected with inotify on Linux, falling back to polling the files' mtime, inode and size elsewhere.
+    Bursts of writes are coalesced into a single reload, and only the Config classes sourcing from a changed file are
+    reloaded.
+
+    Example:
+    ```
+    reloader = config.LocalFileReloader(configs=[AppConfig, DBConfig])
+    reloader.start()
+    ```
+    """
+
+    configs: list[type["_config.Config"]]
+    poll_interval: float
+    debounce_interval: float
+    force_polling: bool
+
+    def __init__(
+        self,
+        configs: list[type["_config.Config"]],
+        poll_interval: float = 1.0,
+        debounce_interval: float = 0.1,
+        force_polling: bool = False,
+    ) -> None:
+        self.configs = configs
+        self.poll_interval = poll_interval
+        self.debounce_interval = debounce_interval
+        self.force_polling = force_polling
+        self._configs_by_file: dict[pathlib.Path, list[type["_config.Config"]]] = {}
+        self._signatures: dict[pathlib.Path, _FileSignature] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("LocalFileReloader already started.")
+
+        self._configs_by_file = {}
+        for config in self.configs:
+            for config_source in config.meta.config_sources:
+                if isinstance(config_source, _config_sources.LocalFile):
+                    filepath = config_source.filepath.absolute()
+                    self._configs_by_file.setdefault(filepath, []).append(config)
+        self._signatures = {filepath: _file_signature(filepath=filepath) for filepath in self._configs_by_file}
+
+        inotify: _Inotify | None = None
+        if not self.force_polling:
+            try:
+                inotify = _Inotify(directories={filepath.parent for filepath in self._configs_by_file})
+            except (OSError, AttributeError):
+                logging.debug("inotify not available. Falling back to polling for config file changes.")
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, kwargs={"inotify": inotify}, name="python-sdk-config-reloader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "LocalFileReloader":
+        self.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stop()
+
+    def _run(self, inotify: _Inotify | None) -> None:
+        try:
+            while not self._stop.is_set():
+                if inotify is not None:
+                    if not inotify.wait(timeout=self.poll_interval):
+                        continue
+                elif self._stop.wait(timeout=self.poll_interval):
+                    break
+                self._reload_changed_configs()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _changed_files(self) -> set[pathlib.Path]:
+        changed_files = set()
+        for filepath, previous_signature in self._signatures.items():
+            signature = _file_signature(filepath=filepath)
+            if signature != previous_signature:
+                self._signatures[filepath] = signature
+                changed_files.add(filepath)
+        return changed_files
+
+    def _reload_changed_configs(self) -> None:
+        changed_files = self._changed_files()
+        if not changed_files:
+            return
+
+        # Coalesce bursts of writes. Keep waiting until the files have been quiet for a whole debounce interval.
+        while not self._stop.wait(timeout=self.debounce_interval):
+            still_changing_files = self._changed_files()
+            if not still_changing_files:
+                break
+            changed_files |= still_changing_files
+
+        if self._stop.is_set():
+            return
+
+        # A Config class may source from several of the changed files. Only reload it once.
+        configs_to_reload: dict[type["_config.Config"], None] = {}
+        for filepath in changed_files:
+            configs_to_reload |= dict.fromkeys(self._configs_by_file[filepath])
+
+        try:
+            # Within one load session, so that each changed file is read once, however many classes source from it.
+            _config_registry.reload_all(configs=configs_to_reload)
+        except Exception:
+            # Each class failing to reload is logged by reload_all, and the others are still reloaded.
+            logging.error("Failed to reload some configs after their config files changed.")
+
+
+class PeriodicReloader:
+    """
+    Refreshes the given Config classes in the background, every `interval` seconds, for config sources which cannot be
+    watched for changes, such as RemoteHTTPFile, S3File, and the AWS Secrets Manager and Parameter Store sources.
+
+    Config classes are refreshed with `Config.refresh_config`, which reads the config sources without holding the lock
+    of the config, so neither reads of the config nor explicit reloads wait on a slow config source. Until a refresh
+    completes, and whenever it fails, the config keeps serving its last good values.
+
+    Each interval is randomly spread by up to `jitter` of itself, so that processes started together across a fleet do
+    not all refresh at once. After a failed refresh, the interval doubles with every consecutive failure, up to
+    `max_backoff_interval`, so that a failing config server is not hammered. It resets on the next successful refresh.
+
+    Example:
+    ```
+    reloader = config.PeriodicReloader(configs=[AppConfig, DBConfig], interval=60)
+    reloader.start()
+    ```
+    """
+
+    configs: list[type["_config.Config"]]
+    interval: float
+    jitter: float
+    max_backoff_interval: float
+    max_workers: int
+
+    def __init__(
+        self,
+        configs: list[type["_config.Config"]],
+        interval: float = 60.0,
+        jitter: float = 0.1,
+        max_backoff_interval: float | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Args:
+            max_backoff_interval: Defaults to 16 times the interval.
+            max_workers: Maximum number of Config classes refreshed at once.
+
+        Raises:
+            ValueError: The interval is not positive, or the jitter is not between 0 and 1.
+        """
+        if interval <= 0:
+            raise ValueError("The interval must be positive.")
+        if not 0 <= jitter < 1:
+            raise ValueError("The jitter must be at least 0, and less than 1.")
+        self.configs = configs
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff_interval = max(
+            interval, interval * 16 if max_backoff_interval is None else max_backoff_interval
+        )
+        self.max_workers = max_workers
+        self._failures: dict[type["_config.Config"], int] = {}
+        # Heap of (due at, tie breaker, config). Config classes being refreshed are left out until the refresh finishes.
+        self._schedule: list[tuple[float, int, type["_config.Config"]]] = []
+        self._tie_breaker = itertools.count()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("PeriodicReloader already started.")
+
+        now = time.monotonic()
+        self._failures = dict.fromkeys(self.configs, 0)
+        self._schedule = [(now + self._delay(failures=0), next(self._tie_breaker), config) for config in self.configs]
+        heapq.heapify(self._schedule)
+        self._stopping = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="python-sdk-config-refresh"
+        )
+        self._thread = threading.Thread(target=self._run, name="python-sdk-config-periodic-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops scheduling refreshes, and waits for those in flight to finish."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "PeriodicReloader":
+        self.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stop()
+
+    def consecutive_failures(self, config: type["_config.Config"]) -> int:
+        """Number of refreshes of the Config class which failed since it was last refreshed successfully."""
+        return self._failures.get(config, 0)
+
+    def _delay(self, failures: int) -> float:
+        interval = min(self.interval * 2.0**failures, self.max_backoff_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._stopping:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due_at, _, config = self._schedule[0]
+                timeout = due_at - time.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout=timeout)
+                    continue
+                heapq.heappop(self._schedule)
+                assert self._executor is not None
+                self._executor.submit(self._refresh, config)
+
+    def _refresh(self, config: type["_config.Config"]) -> None:
+        try:
+            config.refresh_config()
+        except Exception:
+            self._failures[config] += 1
+            delay = self._delay(failures=self._failures[config])
+            logging.exception(
+                f"Failed to refresh {config.meta.name}. Serving its last good values, and retrying in {delay:.1f}s."
+            )
+        else:
+            self._failures[config] = 0
+            delay = self._delay(failures=0)
+
+        with self._condition:
+            heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._tie_breaker), config))
+            self._condition.notify()
@@ -0,0 +1,63 @@
+import re
+import typing
+
+from python_sdk.config import _config_load_session
+from python_sdk.config import _config_option
+
+# `secret:ENGINE_TYPE:key` gets the key from the given secrets engine, while `secret:key` uses the configured one.
+_ENGINE_TYPE_PATTERN = re.compile(r"([A-Z][A-Z0-9_]*):(.+)", re.DOTALL)
+
+
+class SecretValue(str):
+    """The value of a resolved `secret:` reference, marked as such so that it is never written to snapshots."""
+
+
+def is_secret_reference(value: typing.Any) -> bool:
+    return isinstance(value, str) and value.startswith(_config_option.ConfigOption.SECRET_REFERENCE_TOKEN)
+
+
+def _parse_secret_reference(reference: str) -> tuple[str | None, str]:
+    key = reference.removeprefix(_config_option.ConfigOption.SECRET_REFERENCE_TOKEN)
+    if match := _ENGINE_TYPE_PATTERN.fullmatch(key):
+        return match.group(1), match.group(2)
+    return None, key
+
+
+def resolve_secret_references(references: dict[str, str]) -> dict[str, str]:
+    """
+    Resolves `secret:` references to the values of the secrets they reference, keyed as given.
+    References are grouped by secrets engine, and each group is got at once, see `secrets.get_secret_values`.
+    Within a load session, each reference is only resolved once, no matter how many Config classes hold it.
+
+    Raises:
+        ValueError: A referenced secret does not exist, is not UTF-8 encoded, or its secrets engine does not exist.
+        PermissionError: Not authorized to access a referenced secret.
+    """
+    # The secrets package is configured through Config classes itself, so it can only be imported once they are.
+    from python_sdk import secrets
+
+    session = _config_load_session.current_session()
+    resolved = session.secrets if session is not None else {}
+
+    unresolved: dict[str | None, dict[str, str]] = {}
+    for reference in references.values():
+        if reference not in resolved:
+            engine_type, key = _parse_secret_reference(reference=reference)
+            unresolved.setdefault(engine_type, {})[key] = reference
+
+    for engine_type, keys in unresolved.items():
+        try:
+            values = secrets.get_secret_values(keys=keys, type=engine_type)
+        except NotImplementedError as e:
+            raise ValueError(f"Secrets engine {engine_type} does not exist.") from e
+        except secrets.DoesNotExist as e:
+            raise ValueError(f"Referenced secret does not exist. {e}") from e
+        except secrets.Unauthorized as e:
+            raise PermissionError(f"Not authorized to access referenced secret. {e}") from e
+        for key, value in values.items():
+            try:
+                resolved[keys[key]] = value.read().decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise ValueError(f"Referenced secret {key} is not UTF-8 encoded.") from e
+
+    return {name: SecretValue(resolved[reference]) for name, reference in references.items()}
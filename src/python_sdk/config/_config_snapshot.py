@@ -0,0 +1,67 @@
+import dataclasses
+import os
+import pathlib
+import pickle
+import tempfile
+import typing
+
+import python_sdk
+
+# Bump whenever the layout of _Snapshot changes, so that snapshots written by other versions are ignored.
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclasses.dataclass
+class _Snapshot:
+    format_version: int
+    python_sdk_version: str
+    fingerprint: str
+    # Option name to (encoded value, decoded value), for options not holding their default. Unset encoded values are None.
+    values: dict[str, tuple[typing.Any, typing.Any]]
+
+
+def write_snapshot(file: pathlib.Path, fingerprint: str, values: dict[str, tuple[typing.Any, typing.Any]]) -> None:
+    """
+    Writes the snapshot to a temporary file first, and then moves it into place, so that processes starting up
+    concurrently never read a partially written snapshot.
+
+    Raises:
+        PermissionError: Could not write to the file.
+        pickle.PicklingError: An option value cannot be pickled.
+    """
+    snapshot = _Snapshot(
+        format_version=_SNAPSHOT_FORMAT_VERSION,
+        python_sdk_version=python_sdk.__version__,
+        fingerprint=fingerprint,
+        values=values,
+    )
+    fd, temporary_file = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, file)
+    except BaseException:
+        os.unlink(temporary_file)
+        raise
+
+
+def read_snapshot(file: pathlib.Path, fingerprint: str) -> dict[str, tuple[typing.Any, typing.Any]] | None:
+    """
+    Returns the values in the snapshot, or None if the snapshot does not exist, cannot be read, was written by another
+    version, or was taken from config sources which have since changed.
+    """
+    try:
+        with file.open(mode="rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        # Unpickling a corrupt or truncated snapshot can raise almost anything. Load from the config sources instead.
+        return None
+
+    if (
+        not isinstance(snapshot, _Snapshot)
+        or getattr(snapshot, "format_version", None) != _SNAPSHOT_FORMAT_VERSION
+        or snapshot.python_sdk_version != python_sdk.__version__
+        or snapshot.fingerprint != fingerprint
+    ):
+        return None
+    return snapshot.values
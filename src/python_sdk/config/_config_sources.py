@@ -1,13 +1,26 @@
+import contextlib
+import dataclasses
+import datetime
+import hashlib
+import io
+import json
+import mmap
 import os
 import pathlib
+import re
+import threading
+import time
 import typing
-import urllib.error
-import urllib.request
+import urllib.parse
 
 import python_sdk
+from python_sdk.config import _config_load_session
+from python_sdk.config import _string_decoder
 
 # TODO: support custom CA's and proxies
 
+DocumentFormat: typing.TypeAlias = typing.Literal["PLAIN_TEXT", "JSON", "TOML"]
+
 
 class ConfigSource(typing.Protocol):
     """
@@ -16,6 +29,8 @@ class ConfigSource(typing.Protocol):
     flat, dictionary. Implementing classes should not attempt any config value manipulation or even normalization
     (e.g. stripping blank characters), unless said manipulation is to remove artifacts specific to the configuration
     source. Implementing classes should be casing-agnostic.
+    Instances reading from the same underlying configuration should compare equal and hash the same, so that a load
+    session only reads from them once.
     """
 
     name: str
@@ -31,6 +46,45 @@ class ConfigSource(typing.Protocol):
         ...
 
 
+@typing.runtime_checkable
+class AsyncConfigSource(ConfigSource, typing.Protocol):
+    """
+    Config source which can also be read without blocking the event loop, such as one backed by an async HTTP client.
+    Used by `Config.aload` and `Config.areload_config`. Config sources not implementing it are read in a worker thread.
+    """
+
+    async def acall(self, prefix: str) -> dict[str, str]:
+        """
+        Raises:
+            PermissionError: Could not read from config source.
+            ConnectionError: Could not connect to a networked config source.
+            ValueError: Could not parse the config file, which may be malformed.
+        """
+        ...
+
+
+@typing.runtime_checkable
+class FingerprintableConfigSource(ConfigSource, typing.Protocol):
+    """
+    Config source which can cheaply tell whether its configuration has changed, without reading it in full.
+    Used by `Config.load_from_file` to decide whether a snapshot is still current. Snapshots of configs sourcing from
+    config sources not implementing it are never used.
+    """
+
+    def fingerprint(self, prefix: str) -> str | None:
+        """
+        Returns a string which changes whenever the configuration under the prefix changes, or None if the
+        configuration cannot currently be fingerprinted.
+        """
+        ...
+
+
+def _fingerprint_dictionary(dictionary: typing.Mapping[str, str], prefix: str) -> str:
+    prefix = prefix.lower()
+    items = sorted((key.lower(), val) for key, val in dictionary.items() if key.lower().startswith(prefix))
+    return hashlib.blake2b(repr(items).encode("utf-8", "surrogateescape"), digest_size=16).hexdigest()
+
+
 class StaticDictionary:
     name: str = "Static Dictionary"
     description: str = "Sources configuration from a static dictionary."
@@ -42,60 +96,158 @@ class StaticDictionary:
     def __call__(self, prefix: str) -> dict[str, str]:
         return {key: val for key, val in self.dictionary.items() if key.lower().startswith(prefix.lower())}
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, StaticDictionary) and other.dictionary is self.dictionary
+
+    def __hash__(self) -> int:
+        return hash((StaticDictionary, id(self.dictionary)))
+
+    def fingerprint(self, prefix: str) -> str | None:
+        return _fingerprint_dictionary(dictionary=self.dictionary, prefix=prefix)
+
 
 class EnvironmentVariables:
     name: str = "Environment Variables"
-    description: str = "Sources configuration from the environment variables."
+    description: str = """
+    Sources configuration from the environment variables.
+    The environment is indexed by prefix once, and the index is shared by every instance, so that loads are served
+    without reading the whole environment. Changes made to the environment through `set_environment_variable` are picked
+    up by the next load. Changes made through `os.environ` are only picked up once `invalidate_environment_variables` is
+    called.
+    Within a load session, every Config class loaded within the session is served from the environment as it was when
+    the session first read it.
+    """
 
     def __call__(self, prefix: str) -> dict[str, str]:
-        return StaticDictionary(dictionary=dict(os.environ))(prefix=prefix)
+        return _environment_index().slice(prefix=prefix)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, EnvironmentVariables)
+
+    def __hash__(self) -> int:
+        return hash(EnvironmentVariables)
+
+    def fingerprint(self, prefix: str) -> str | None:
+        session = _config_load_session.current_session()
+        configuration = self(prefix=prefix) if session is None else session(config_source=self, prefix=prefix)
+        return _fingerprint_dictionary(dictionary=configuration, prefix=prefix)
+
+
+# The environment, indexed by prefix, alongside the generation of the environment it was indexed at. The generation is
+# bumped whenever the environment is changed through python-sdk, or is invalidated, so checking whether the index is
+# current costs an integer comparison, and the environment is only read whole when rebuilding it.
+_ENVIRONMENT_GENERATION = 0
+_ENVIRONMENT_INDEX: tuple[int, _config_load_session.PrefixIndex] | None = None
+_ENVIRONMENT_INDEX_LOCK = threading.Lock()
+
+
+def _environment_index() -> _config_load_session.PrefixIndex:
+    global _ENVIRONMENT_INDEX
+    cached = _ENVIRONMENT_INDEX
+    if cached is not None and cached[0] == _ENVIRONMENT_GENERATION:
+        return cached[1]
+    with _ENVIRONMENT_INDEX_LOCK:
+        # Taken before reading the environment, so that a change made while reading it triggers another rebuild.
+        generation = _ENVIRONMENT_GENERATION
+        if _ENVIRONMENT_INDEX is None or _ENVIRONMENT_INDEX[0] != generation:
+            _ENVIRONMENT_INDEX = generation, _config_load_session.PrefixIndex(
+                configuration=dict(os.environ), preserve_case=True
+            )
+        return _ENVIRONMENT_INDEX[1]
+
+
+def invalidate_environment_variables() -> None:
+    """
+    Makes EnvironmentVariables read the environment again on its next read, to pick up changes made to the environment
+    other than through `set_environment_variable`, such as through `os.environ`.
+    """
+    global _ENVIRONMENT_GENERATION
+    with _ENVIRONMENT_INDEX_LOCK:
+        _ENVIRONMENT_GENERATION += 1
+
+
+def set_environment_variable(key: str, value: str | None) -> None:
+    """
+    Sets an environment variable, or unsets it if the value is None, so that EnvironmentVariables picks up the change
+    on its next read.
+    """
+    if value is None:
+        os.environ.pop(key, None)
+    else:
+        os.environ[key] = value
+    invalidate_environment_variables()
 
 
 class FileObject:
     name: str = "File Object"
     description: str = """
-    Sources configuration from a given file object.
-    The file object is interpreted as a plain text document.
+    Sources configuration from a given file object, or bytes-like object such as a memory mapped file.
+    The file object is interpreted as a plain text document, unless a JSON or TOML document format is given.
     The document must use `=` as a key value separator and `\n` as a new line separator.
+    Blank lines, and lines starting with `#`, are ignored.
+
+    The document is parsed one line at a time, and lines not starting with the prefix are skipped without being parsed.
+    Bytes-like objects are searched for lines starting with the prefix without being decoded as a whole.
 
     Example valid document:
     ```
+    # Database
     DB_USER=admin
     DB_PORT=5432
     ```
+
+    JSON and TOML documents are parsed whole. Nested tables map to option prefixes, with table names and keys joined by
+    `_`, and each table is also available as a whole to `dict` options, without being parsed again.
+
+    Example valid TOML document, equivalent to the plain text document above:
+    ```
+    [db]
+    user = "admin"
+    port = 5432
+    ```
     """
     key_value_separator: str = "="
     line_separator: str = "\n"
-    file: typing.TextIO
+    file: typing.TextIO | bytes | memoryview
+    document_format: DocumentFormat
 
-    def __init__(self, file: typing.TextIO) -> None:
+    def __init__(
+        self, file: typing.TextIO | bytes | memoryview, document_format: DocumentFormat = "PLAIN_TEXT"
+    ) -> None:
         self.file = file
+        self.document_format = document_format
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
         Raises:
             ValueError: Could not parse the config file, which may be malformed.
+            ModuleNotFoundError: TOML documents require the `tomli` package on Python versions before 3.11.
         """
-        configuration = {}
-
-        for line in self.file.read().split(self.line_separator):
-            if self.key_value_separator not in line:
-                raise ValueError(f"No key value separator `{self.key_value_separator}` in config line: {line}")
-            key, val = line.split(self.key_value_separator, 1)
-            configuration[key] = val
-
-        return StaticDictionary(dictionary=dict(os.environ))(prefix=prefix)
+        if self.document_format != "PLAIN_TEXT":
+            document = self.file if isinstance(self.file, (bytes, memoryview)) else self.file.read()
+            configuration = _parse_structured_document(document=document, document_format=self.document_format)
+            return StaticDictionary(dictionary=configuration)(prefix=prefix)
+        if isinstance(self.file, (bytes, memoryview)):
+            return _parse_key_value_buffer(
+                buffer=self.file, key_value_separator=self.key_value_separator, prefix=prefix
+            )
+        return _parse_key_value_lines(lines=self.file, key_value_separator=self.key_value_separator, prefix=prefix)
 
 
 class LocalFile:
     name: str = "Local File"
     description: str = """
     Sources configuration from a given local file.
-    The file is interpreted as a plain text document.
-    The document must use `=` as a key value separator and `\n` as a new line separator.
+    Files ending in `.json` or `.toml` are interpreted as JSON or TOML documents, as described by `FileObject`, and
+    other files as plain text documents, unless a document format is given.
+    The plain text document must use `=` as a key value separator and `\n` as a new line separator.
+    Blank lines, and lines starting with `#`, are ignored.
+    Plain text files are memory mapped rather than read, so only the lines starting with the prefix are ever copied.
+    JSON and TOML files are parsed once, and only parsed again once they change.
 
     Example valid document:
     ```
+    # Database
     DB_USER=admin
     DB_PORT=5432
     ```
@@ -103,18 +255,235 @@ class LocalFile:
     key_value_separator: str = "="
     line_separator: str = "\n"
     filepath: pathlib.Path
+    document_format: DocumentFormat | None
 
-    def __init__(self, filepath: pathlib.Path) -> None:
+    def __init__(self, filepath: pathlib.Path, document_format: DocumentFormat | None = None) -> None:
         self.filepath: pathlib.Path = filepath
+        self.document_format = document_format
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, LocalFile)
+            and other.filepath == self.filepath
+            and other.document_format == self.document_format
+        )
+
+    def __hash__(self) -> int:
+        return hash((LocalFile, self.filepath, self.document_format))
+
+    def fingerprint(self, prefix: str) -> str | None:
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+        return self._fingerprint(stat=stat)
+
+    def _fingerprint(self, stat: os.stat_result) -> str:
+        # Compare on inode as well as mtime and size, to catch files atomically replaced by a rename.
+        return f"{self.filepath.absolute()}:{stat.st_mtime_ns}:{stat.st_ino}:{stat.st_size}"
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
         Raises:
             PermissionError: Could not read from config source.
             ValueError: Could not parse the config file, which may be malformed.
+            ModuleNotFoundError: TOML documents require the `tomli` package on Python versions before 3.11.
         """
-        with self.filepath.open(mode="r", encoding="utf-8") as f:
-            return FileObject(file=f)(prefix=prefix)
+        document_format = _document_format(path=self.filepath.name, document_format=self.document_format)
+        with self.filepath.open(mode="rb") as f:
+            stat = os.fstat(f.fileno())
+            if document_format != "PLAIN_TEXT":
+                cache_key = (self.filepath.absolute(), document_format)
+                fingerprint = self._fingerprint(stat=stat)
+                cached = _PARSED_LOCAL_FILES.get(cache_key)
+                if cached is None or cached[0] != fingerprint:
+                    configuration = _parse_structured_document(document=f.read(), document_format=document_format)
+                    cached = fingerprint, _config_load_session.PrefixIndex(configuration=configuration)
+                    _PARSED_LOCAL_FILES[cache_key] = cached
+                return cached[1].slice(prefix=prefix)
+            # Empty files cannot be memory mapped.
+            if stat.st_size == 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+                return FileObject(file=view)(prefix=prefix)
+
+
+def _parse_key_value_lines(
+    lines: typing.Iterable[str], key_value_separator: str = "=", prefix: str = ""
+) -> dict[str, str]:
+    """
+    Parses a plain text document one line at a time, so that streamed documents never have to be held in memory whole.
+    Blank lines and comments are skipped, as are lines not starting with the prefix, which are not parsed at all.
+
+    Raises:
+        ValueError: Could not parse the document, which may be malformed.
+    """
+    prefix = prefix.lower()
+    configuration = {}
+    for line in lines:
+        if line[: len(prefix)].lower() != prefix:
+            continue
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if key_value_separator not in line:
+            raise ValueError(f"No key value separator `{key_value_separator}` in config line: {line}")
+        key, val = line.split(key_value_separator, 1)
+        configuration[key] = val
+    return configuration
+
+
+_LINE_PATTERN = re.compile(rb"[^\n]+")
+
+
+def _parse_key_value_buffer(
+    buffer: bytes | memoryview, key_value_separator: str = "=", prefix: str = ""
+) -> dict[str, str]:
+    """
+    Parses a plain text document held in a bytes-like object.
+    Lines starting with the prefix are found with a regular expression over the raw bytes, so that only those lines are
+    copied out of the buffer and decoded.
+
+    Raises:
+        ValueError: Could not parse the document, which may be malformed.
+    """
+    # Bytes patterns only fold the case of ASCII characters. Other prefixes are matched after decoding instead.
+    if prefix and prefix.isascii():
+        pattern = re.compile(rb"^" + re.escape(prefix.encode("ascii")) + rb"[^\n]*", re.MULTILINE | re.IGNORECASE)
+    else:
+        pattern = _LINE_PATTERN
+    lines = (match.group().decode("utf-8") for match in pattern.finditer(buffer))
+    try:
+        return _parse_key_value_lines(lines=lines, key_value_separator=key_value_separator, prefix=prefix)
+    finally:
+        # Release the buffer held by the regular expression scanner, so that memory mapped files can be closed.
+        lines.close()
+
+
+# Parsed JSON and TOML files, keyed by path and document format, alongside the fingerprint of the file they were parsed
+# from, so that Config classes sourcing from the same file share a single parse.
+# Flattened documents can hold many more keys than plain text documents, so they are indexed by prefix.
+_PARSED_LOCAL_FILES: dict[tuple[pathlib.Path, DocumentFormat], tuple[str, _config_load_session.PrefixIndex]] = {}
+
+_DOCUMENT_FORMATS_BY_SUFFIX: dict[str, DocumentFormat] = {".json": "JSON", ".toml": "TOML"}
+
+
+def _document_format(path: str, document_format: DocumentFormat | None) -> DocumentFormat:
+    if document_format is not None:
+        return document_format
+    return _DOCUMENT_FORMATS_BY_SUFFIX.get(pathlib.PurePosixPath(path).suffix.lower(), "PLAIN_TEXT")
+
+
+def _parse_structured_document(document: str | bytes | memoryview, document_format: DocumentFormat) -> dict[str, str]:
+    """
+    Parses a JSON or TOML document, flattening nested tables into keys prefixed by the names of the tables they are in.
+
+    Raises:
+        ValueError: Could not parse the document, which may be malformed.
+        ModuleNotFoundError: TOML documents require the `tomli` package on Python versions before 3.11.
+    """
+    try:
+        if isinstance(document, (bytes, memoryview)):
+            document = bytes(document).decode("utf-8")
+        if document_format == "JSON":
+            data = json.loads(document)
+        else:
+            try:
+                import tomllib
+            except ModuleNotFoundError:
+                import tomli as tomllib  # type: ignore
+
+            # TOML dates and times are converted to the ISO 8601 strings an equivalent JSON document would hold, so that
+            # options decode the same way whichever format the document is in.
+            data = _with_iso_format_dates(value=tomllib.loads(document))
+    except ValueError as e:
+        # Both json.JSONDecodeError and tomllib.TOMLDecodeError are ValueErrors, as is UnicodeDecodeError.
+        raise ValueError(f"Could not parse the {document_format} document: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValueError(f"The {document_format} document must be a table of keys to values.")
+    configuration: dict[str, str] = {}
+    _flatten_table(table=data, prefix="", configuration=configuration)
+    return configuration
+
+
+def _flatten_table(table: dict[str, typing.Any], prefix: str, configuration: dict[str, str]) -> None:
+    for key, value in table.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            # Tables are also encoded whole, for dict options, and carry their parsed value so it is not parsed again.
+            configuration[name] = _string_decoder.DecodedString(json.dumps(value), decoded=value)
+            _flatten_table(table=value, prefix=f"{name}_", configuration=configuration)
+        elif (encoded_value := _encode_structured_value(value=value)) is not None:
+            configuration[name] = encoded_value
+
+
+def _with_iso_format_dates(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return {key: _with_iso_format_dates(value=item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_with_iso_format_dates(value=item) for item in value]
+    elif isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def _encode_structured_value(value: typing.Any) -> str | None:
+    # Encodes values the way they would be written in a plain text document, so they decode the same way.
+    if value is None:
+        return None
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, list):
+        if any(isinstance(item, (dict, list)) for item in value):
+            return json.dumps(value)
+        return _string_decoder.ENCODED_STRING_LIST_SEPARATOR.join(
+            encoded_item for item in value if (encoded_item := _encode_structured_value(value=item)) is not None
+        )
+    return str(value)
+
+
+# boto3 clients are thread safe and expensive to create, so they are created once per service and shared.
+_AWS_CLIENTS: dict[str, typing.Any] = {}
+_AWS_CLIENTS_LOCK = threading.Lock()
+
+
+def _aws_client(service_name: str) -> typing.Any:
+    with _AWS_CLIENTS_LOCK:
+        if service_name not in _AWS_CLIENTS:
+            import boto3  # type: ignore
+
+            _AWS_CLIENTS[service_name] = boto3.Session().client(service_name=service_name)
+        return _AWS_CLIENTS[service_name]
+
+
+@dataclasses.dataclass
+class _AWSDocument:
+    version: str
+    configuration: dict[str, str]
+
+
+# Parsed documents, keyed by where they came from, alongside the version they were parsed from.
+# Unchanged documents are not re-parsed, or where the API allows, not even re-downloaded.
+_AWS_DOCUMENTS: dict[tuple[str, str, int], _AWSDocument] = {}
+
+
+def _raise_for_aws_client_error(e: Exception, resource: str) -> typing.NoReturn:
+    """
+    Raises:
+        FileNotFoundError: Document does not exist.
+        PermissionError: Not authorized to read the document.
+        ConnectionError: Could not connect to the AWS API.
+    """
+    import botocore.exceptions  # type: ignore
+
+    if isinstance(e, botocore.exceptions.ClientError):
+        code = e.response["Error"]["Code"]
+        if code in {"NoSuchKey", "NoSuchBucket", "404", "ResourceNotFoundException", "ParameterNotFound"}:
+            raise FileNotFoundError(f"{resource} does not exist.") from e
+        if code in {"AccessDenied", "AccessDeniedException", "403", "NotAuthorizedException"}:
+            raise PermissionError(f"Not authorized to read {resource}.") from e
+    raise ConnectionError(f"Could not read {resource}.") from e
 
 
 class S3File:
@@ -123,6 +492,7 @@ class S3File:
     Sources configuration from an S3 (Simple Storage Service) compatible API.
     The file is interpreted as a plain text document.
     The document must use `=` as a key value separator and `\n` as a new line separator.
+    The document is parsed as it is streamed, and is only downloaded again once its ETag changes.
 
     Example valid document:
     ```
@@ -130,6 +500,29 @@ class S3File:
     DB_PORT=5432
     ```
     """
+    url: str
+    bucket: str
+    key: str
+
+    def __init__(self, url: str, client: typing.Any = None) -> None:
+        """
+        Args:
+            url: Location of the file, in the form of `s3://bucket/key`.
+            client: boto3 S3 client to use. Defaults to a client shared by all S3File instances.
+        """
+        if not url.startswith("s3://"):
+            raise ValueError("S3File only supports s3:// URLs.")
+        self.url = url
+        self.bucket, _, self.key = url.removeprefix("s3://").partition("/")
+        if not self.bucket or not self.key:
+            raise ValueError("S3File URL must be in the form of s3://bucket/key.")
+        self._client = client
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, S3File) and other.url == self.url and other._client is self._client
+
+    def __hash__(self) -> int:
+        return hash((S3File, self.url, id(self._client)))
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
@@ -138,7 +531,30 @@ class S3File:
             ConnectionError: Could not connect to a networked config source.
             ValueError: Could not parse the config file, which may be malformed.
         """
-        return {}
+        import botocore.exceptions
+
+        client = self._client or _aws_client(service_name="s3")
+        cache_key = ("s3", self.url, id(client))
+        cached = _AWS_DOCUMENTS.get(cache_key)
+
+        try:
+            if cached is not None:
+                response = client.get_object(Bucket=self.bucket, Key=self.key, IfNoneMatch=cached.version)
+            else:
+                response = client.get_object(Bucket=self.bucket, Key=self.key)
+        except botocore.exceptions.ClientError as e:
+            if cached is not None and e.response["Error"]["Code"] in {"304", "NotModified"}:
+                return StaticDictionary(dictionary=cached.configuration)(prefix=prefix)
+            _raise_for_aws_client_error(e=e, resource=self.url)
+        except botocore.exceptions.BotoCoreError as e:
+            _raise_for_aws_client_error(e=e, resource=self.url)
+
+        # Close the body however parsing goes, so that its connection is released back to the pool.
+        with contextlib.closing(response["Body"]) as body:
+            lines = (line.decode("utf-8") for line in body.iter_lines())
+            document = _AWSDocument(version=response["ETag"], configuration=_parse_key_value_lines(lines=lines))
+        _AWS_DOCUMENTS[cache_key] = document
+        return StaticDictionary(dictionary=document.configuration)(prefix=prefix)
 
 
 class AWSSecretsManagerSecret:
@@ -147,6 +563,7 @@ class AWSSecretsManagerSecret:
     Sources configuration from an AWS Secrets Manager secret.
     The secret is interpreted as a plain text document.
     The secret must use `=` as a key value separator and `\n` as a new line separator.
+    The secret is only parsed again once its version changes.
 
     Example valid document:
     ```
@@ -154,6 +571,26 @@ class AWSSecretsManagerSecret:
     DB_PORT=5432
     ```
     """
+    secret_id: str
+
+    def __init__(self, secret_id: str, client: typing.Any = None) -> None:
+        """
+        Args:
+            secret_id: Name or ARN of the secret.
+            client: boto3 Secrets Manager client to use. Defaults to a client shared by all instances.
+        """
+        self.secret_id = secret_id
+        self._client = client
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, AWSSecretsManagerSecret)
+            and other.secret_id == self.secret_id
+            and other._client is self._client
+        )
+
+    def __hash__(self) -> int:
+        return hash((AWSSecretsManagerSecret, self.secret_id, id(self._client)))
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
@@ -162,7 +599,28 @@ class AWSSecretsManagerSecret:
             ConnectionError: Could not connect to a networked config source.
             ValueError: Could not parse the config file, which may be malformed.
         """
-        return {}
+        import botocore.exceptions
+
+        client = self._client or _aws_client(service_name="secretsmanager")
+        cache_key = ("secretsmanager", self.secret_id, id(client))
+
+        try:
+            response = client.get_secret_value(SecretId=self.secret_id)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            _raise_for_aws_client_error(e=e, resource=self.secret_id)
+
+        document = _AWS_DOCUMENTS.get(cache_key)
+        if document is None or document.version != response["VersionId"]:
+            if "SecretString" in response:
+                secret = response["SecretString"]
+            else:
+                secret = response["SecretBinary"].decode("utf-8")
+            document = _AWSDocument(
+                version=response["VersionId"],
+                configuration=_parse_key_value_lines(lines=io.StringIO(secret)),
+            )
+            _AWS_DOCUMENTS[cache_key] = document
+        return StaticDictionary(dictionary=document.configuration)(prefix=prefix)
 
 
 class AWSParameterStoreDocument:
@@ -171,6 +629,7 @@ class AWSParameterStoreDocument:
     Sources configuration from an AWS Parameter Store document.
     The file is interpreted as a plain text document.
     The document must use `=` as a key value separator and `\n` as a new line separator.
+    The document is only parsed again once its version changes.
 
     Example valid document:
     ```
@@ -178,6 +637,26 @@ class AWSParameterStoreDocument:
     DB_PORT=5432
     ```
     """
+    parameter_name: str
+
+    def __init__(self, parameter_name: str, client: typing.Any = None) -> None:
+        """
+        Args:
+            parameter_name: Name of the parameter.
+            client: boto3 SSM client to use. Defaults to a client shared by all instances.
+        """
+        self.parameter_name = parameter_name
+        self._client = client
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, AWSParameterStoreDocument)
+            and other.parameter_name == self.parameter_name
+            and other._client is self._client
+        )
+
+    def __hash__(self) -> int:
+        return hash((AWSParameterStoreDocument, self.parameter_name, id(self._client)))
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
@@ -186,15 +665,60 @@ class AWSParameterStoreDocument:
             ConnectionError: Could not connect to a networked config source.
             ValueError: Could not parse the config file, which may be malformed.
         """
-        return {}
+        import botocore.exceptions
+
+        client = self._client or _aws_client(service_name="ssm")
+        cache_key = ("ssm", self.parameter_name, id(client))
+
+        try:
+            response = client.get_parameter(Name=self.parameter_name, WithDecryption=True)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            _raise_for_aws_client_error(e=e, resource=self.parameter_name)
+
+        document = _AWS_DOCUMENTS.get(cache_key)
+        version = str(response["Parameter"]["Version"])
+        if document is None or document.version != version:
+            document = _AWSDocument(
+                version=version,
+                configuration=_parse_key_value_lines(lines=io.StringIO(response["Parameter"]["Value"])),
+            )
+            _AWS_DOCUMENTS[cache_key] = document
+        return StaticDictionary(dictionary=document.configuration)(prefix=prefix)
+
+
+@dataclasses.dataclass
+class _HTTPCacheEntry:
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    # JSON and TOML documents parsed from the body, keyed by document format.
+    parsed: dict[DocumentFormat, _config_load_session.PrefixIndex] = dataclasses.field(default_factory=dict)
+
+
+# Documents fetched by RemoteHTTPFile, keyed by URL and request headers, shared by all RemoteHTTPFile instances.
+# Config classes typically each have their own RemoteHTTPFile instance pointing at the same URL, so sharing the cache
+# across instances is what lets them all be served from a single fetch. The authorization header and user agent are
+# part of the key, as the server may serve different documents to, or refuse, differently authorized requests.
+_HTTPCacheKey = tuple[str, str | None, str]
+_HTTP_CACHE: dict[_HTTPCacheKey, _HTTPCacheEntry] = {}
+_HTTP_CACHE_LOCKS: dict[_HTTPCacheKey, threading.Lock] = {}
+_HTTP_CACHE_LOCKS_LOCK = threading.Lock()
 
 
 class RemoteHTTPFile:
     name: str = "Remote HTTP File"
     description: str = """
     Sources configuration from a remote HTTP server at a given URL.
-    The contents are interpreted as a plain text document.
-    The document must use `=` as a key value separator and `\n` as a new line separator.
+    URLs whose path ends in `.json` or `.toml` are interpreted as JSON or TOML documents, as described by `FileObject`,
+    and others as plain text documents, unless a document format is given.
+    The plain text document must use `=` as a key value separator and `\n` as a new line separator.
+
+    Fetched documents are cached by URL, authorization header and user agent, and shared by all RemoteHTTPFile
+    instances. Within `max_age` seconds of a
+    fetch, the cached document is served without contacting the server. After that, the document is revalidated using
+    `If-None-Match` and `If-Modified-Since`, and the cached document is served if the server responds with
+    `304 Not Modified`. JSON and TOML documents are parsed once per fetch.
 
     Example valid document:
     ```
@@ -206,6 +730,8 @@ class RemoteHTTPFile:
     timeout: int
     authorization_header: str | None
     user_agent_string: str
+    max_age: float
+    document_format: DocumentFormat | None
 
     def __init__(
         self,
@@ -213,6 +739,8 @@ class RemoteHTTPFile:
         timeout: int = 10,
         authorization_header: str | None = None,
         user_agent_string: str = f"python-sdk-{python_sdk.__version__}",
+        max_age: float = 1.0,
+        document_format: DocumentFormat | None = None,
     ) -> None:
         if not url.startswith("http://") and not url.startswith("https://"):
             raise ValueError("RemoteHTTPFile only supports http and https endpoints.")
@@ -220,6 +748,20 @@ class RemoteHTTPFile:
         self.timeout = timeout
         self.authorization_header = authorization_header
         self.user_agent_string = user_agent_string
+        self.max_age = max_age
+        self.document_format = document_format
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, RemoteHTTPFile)
+            and other.url == self.url
+            and other.authorization_header == self.authorization_header
+            and other.user_agent_string == self.user_agent_string
+            and other.document_format == self.document_format
+        )
+
+    def __hash__(self) -> int:
+        return hash((RemoteHTTPFile, self.url, self.authorization_header, self.user_agent_string, self.document_format))
 
     def __call__(self, prefix: str) -> dict[str, str]:
         """
@@ -227,14 +769,63 @@ class RemoteHTTPFile:
             PermissionError: Could not read from config source.
             ConnectionError: Could not connect to a networked config source.
             ValueError: Could not parse the config file, which may be malformed.
+            ModuleNotFoundError: TOML documents require the `tomli` package on Python versions before 3.11.
         """
-        try:
-            request = urllib.request.urlopen(url=self.url, timeout=self.timeout)
-        except urllib.error.HTTPError as e:
-            if 400 <= e.code <= 500:
-                raise PermissionError(f"Received status code {e.code} {e.reason} when connecting to {self.url}.") from e
-            raise ConnectionError(f"Received status code {e.code} {e.reason} when connecting to {self.url}.") from e
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Could not connect to {self.url}. Malformed URL?") from e
-
-        return FileObject(file=request)(prefix=prefix)
+        fetched = self._fetch()
+        document_format = _document_format(
+            path=urllib.parse.urlparse(self.url).path, document_format=self.document_format
+        )
+        if document_format == "PLAIN_TEXT":
+            return FileObject(file=fetched.body)(prefix=prefix)
+        index = fetched.parsed.get(document_format)
+        if index is None:
+            configuration = _parse_structured_document(document=fetched.body, document_format=document_format)
+            index = fetched.parsed[document_format] = _config_load_session.PrefixIndex(configuration=configuration)
+        return index.slice(prefix=prefix)
+
+    def _fetch(self) -> _HTTPCacheEntry:
+        cache_key = (self.url, self.authorization_header, self.user_agent_string)
+        with _HTTP_CACHE_LOCKS_LOCK:
+            lock = _HTTP_CACHE_LOCKS.setdefault(cache_key, threading.Lock())
+
+        # Hold the lock for this document while fetching, so that concurrent loads wait for, and share, a single fetch.
+        with lock:
+            cached = _HTTP_CACHE.get(cache_key)
+            if cached is not None and time.monotonic() - cached.fetched_at < self.max_age:
+                return cached
+
+            headers = {"User-Agent": self.user_agent_string}
+            if self.authorization_header:
+                headers["Authorization"] = self.authorization_header
+            if cached is not None and cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached is not None and cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+            # Deferred, as urllib.request pulls in http.client and ssl, which most applications never need.
+            import urllib.error
+            import urllib.request
+
+            try:
+                request = urllib.request.Request(url=self.url, headers=headers)
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    fetched = _HTTPCacheEntry(
+                        body=response.read(),
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        fetched_at=time.monotonic(),
+                    )
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and cached is not None:
+                    cached.fetched_at = time.monotonic()
+                    return cached
+                if 400 <= e.code <= 500:
+                    raise PermissionError(
+                        f"Received status code {e.code} {e.reason} when connecting to {self.url}."
+                    ) from e
+                raise ConnectionError(f"Received status code {e.code} {e.reason} when connecting to {self.url}.") from e
+            except urllib.error.URLError as e:
+                raise ConnectionError(f"Could not connect to {self.url}. Malformed URL?") from e
+
+            _HTTP_CACHE[cache_key] = fetched
+            return fetched
@@ -0,0 +1,248 @@
+import contextlib
+import dataclasses
+import datetime
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import typing
+
+import python_sdk
+from python_sdk.config import _config_registry
+from python_sdk.config import _config_secrets
+from python_sdk.config import _config_sources
+
+if typing.TYPE_CHECKING:
+    from python_sdk.config import _config
+
+# Child processes inheriting this environment variable restore the state in the file it points to, as their Config
+# classes are defined, rather than loading them. See `share_state_with_child_processes`.
+STATE_FILE_ENVIRONMENT_VARIABLE = "PYTHON_SDK_CONFIG_STATE_FILE"
+
+# Bump whenever the layout of _State or _ConfigState changes, so that state exported by other versions is ignored.
+_STATE_FORMAT_VERSION = 2
+
+
+@dataclasses.dataclass
+class _ConfigState:
+    options_fingerprint: str
+    # Fingerprint of each config source, or None for config sources which cannot be fingerprinted.
+    config_source_fingerprints: list[str | None]
+    last_loaded_at: datetime.datetime | None
+    # Option name to (encoded value, decoded value), for options not holding their default. Unset encoded values are None.
+    values: dict[str, tuple[typing.Any, typing.Any]]
+    hardcoded_values: dict[str, typing.Any]
+
+
+@dataclasses.dataclass
+class _State:
+    format_version: int
+    python_sdk_version: str
+    # Keyed by `_config_key`.
+    configs: dict[str, _ConfigState]
+
+
+# States imported into this process, waiting for their Config classes to be defined. None until first looked up, when
+# the state file pointed to by STATE_FILE_ENVIRONMENT_VARIABLE, if any, is read.
+_IMPORTED_STATES: dict[str, _ConfigState] | None = None
+_IMPORTED_STATES_LOCK = threading.Lock()
+
+
+def _config_key(config: type["_config.Config"]) -> str:
+    # Processes started with the spawn start method import the parent's __main__ module as __mp_main__.
+    module = "__main__" if config.__module__ == "__mp_main__" else config.__module__
+    return f"{module}.{config.__qualname__}"
+
+
+def _config_source_fingerprints(config: type["_config.Config"]) -> list[str | None]:
+    return [
+        (
+            config_source.fingerprint(prefix=config.meta.option_prefix)
+            if isinstance(config_source, _config_sources.FingerprintableConfigSource)
+            else None
+        )
+        for config_source in config.meta.config_sources
+    ]
+
+
+def export_state(configs: typing.Iterable[type["_config.Config"]] | None = None) -> bytes:
+    """
+    Exports the loaded state of every registered Config class, or every given Config class, for `import_state` to
+    restore in another process. Config classes which are yet to be loaded are left out, as are Config classes holding
+    the values of `secret:` references, so that secrets are never exported. Other processes load those instead,
+    resolving the references themselves.
+    The state is a pickle, and holds the values of sensitive options. Protect it as you would the config itself.
+
+    Raises:
+        pickle.PicklingError: An option value cannot be pickled.
+    """
+    configs = _config_registry.registered_configs() if configs is None else configs
+    states = {}
+    for config in configs:
+        with config.meta.lock:
+            if not config.meta.loaded:
+                continue
+            values, hardcoded_values = config._export_option_values()
+            if any(isinstance(encoded_value, _config_secrets.SecretValue) for encoded_value, _ in values.values()):
+                logging.debug(f"{config.meta.name} holds the values of secrets, so its state is not exported.")
+                continue
+            states[_config_key(config=config)] = _ConfigState(
+                options_fingerprint=config.meta.options_fingerprint,
+                config_source_fingerprints=_config_source_fingerprints(config=config),
+                last_loaded_at=config.meta.last_loaded_at,
+                values=values,
+                hardcoded_values=hardcoded_values,
+            )
+    state = _State(format_version=_STATE_FORMAT_VERSION, python_sdk_version=python_sdk.__version__, configs=states)
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def import_state(state: bytes) -> None:
+    """
+    Imports state exported by `export_state`. Config classes which are already defined are restored straight away,
+    while Config classes defined later are restored as they are defined, rather than loaded. Neither are config sources
+    read, nor are option values decoded or validated again. Config validators and the post load hook still run.
+    Config classes whose options, or whose fingerprintable config sources, have changed since the state was exported
+    are left as they are.
+    Only import state exported by this application, as importing state can execute arbitrary code.
+
+    Raises:
+        ValueError: The state cannot be read, or was exported by another version of python-sdk.
+    """
+    try:
+        imported_state = pickle.loads(state)
+    except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError) as e:
+        raise ValueError("Could not read the config state.") from e
+    if (
+        not isinstance(imported_state, _State)
+        or getattr(imported_state, "format_version", None) != _STATE_FORMAT_VERSION
+        or imported_state.python_sdk_version != python_sdk.__version__
+    ):
+        raise ValueError("The config state was exported by another version of python-sdk.")
+
+    global _IMPORTED_STATES
+    with _IMPORTED_STATES_LOCK:
+        imported_states = _read_state_file() if _IMPORTED_STATES is None else _IMPORTED_STATES
+        _IMPORTED_STATES = {**imported_states, **imported_state.configs}
+
+    for config in _config_registry.registered_configs():
+        restore_state(config=config)
+
+
+def process_initializer(state: bytes) -> None:
+    """
+    Initializer for process pools, which imports the state of the parent process.
+    Processes started with the spawn or forkserver start methods import the `__main__` module of the parent before
+    running the initializer, so Config classes defined while importing it load as usual. Start the pool within
+    `share_state_with_child_processes` for those to be restored as well.
+
+    Example:
+    ```
+    with concurrent.futures.ProcessPoolExecutor(
+        initializer=config.process_initializer, initargs=(config.export_state(),)
+    ) as executor:
+        ...
+    ```
+
+    Raises:
+        ValueError: The state cannot be read, or was exported by another version of python-sdk.
+    """
+    import_state(state=state)
+
+
+@contextlib.contextmanager
+def share_state_with_child_processes(file: pathlib.Path) -> typing.Generator[None, None, None]:
+    """
+    Exports the state of every registered Config class to the given file, and points STATE_FILE_ENVIRONMENT_VARIABLE
+    at it for the duration of the context, so that child processes started within it restore their Config classes
+    from it as they are defined, no matter the start method. Config classes holding the values of `secret:`
+    references are not exported, see `export_state`. Child processes take the variable out of their environment once
+    they have read the state file, so the state is not handed on to their own child processes.
+    The state file holds the values of sensitive options. Protect it as you would the config itself.
+
+    Example:
+    ```
+    with config.share_state_with_child_processes(file=pathlib.Path("config.state")):
+        executor = concurrent.futures.ProcessPoolExecutor()
+        executor.submit(...)
+    ```
+
+    Raises:
+        PermissionError: Could not write to the file.
+        pickle.PicklingError: An option value cannot be pickled.
+    """
+    state = export_state()
+    fd, temporary_file = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(state)
+        os.replace(temporary_file, file)
+    except BaseException:
+        os.unlink(temporary_file)
+        raise
+
+    previous_file = os.environ.get(STATE_FILE_ENVIRONMENT_VARIABLE)
+    _config_sources.set_environment_variable(key=STATE_FILE_ENVIRONMENT_VARIABLE, value=str(file.absolute()))
+    try:
+        yield
+    finally:
+        _config_sources.set_environment_variable(key=STATE_FILE_ENVIRONMENT_VARIABLE, value=previous_file)
+
+
+def restore_state(config: type["_config.Config"]) -> bool:
+    """
+    Restores the Config class from imported state, if there is any for it. Returns whether it was restored.
+    Failing to restore is logged, and leaves the Config class to be loaded from its config sources.
+    """
+    global _IMPORTED_STATES
+    if _IMPORTED_STATES is None:
+        with _IMPORTED_STATES_LOCK:
+            if _IMPORTED_STATES is None:
+                _IMPORTED_STATES = _read_state_file()
+
+    config_state = _IMPORTED_STATES.get(_config_key(config=config))
+    if config_state is None:
+        return False
+    if config_state.options_fingerprint != config.meta.options_fingerprint:
+        logging.debug(f"Options of {config.meta.name} changed since its state was exported, so it is not restored.")
+        return False
+    if config_state.config_source_fingerprints != _config_source_fingerprints(config=config):
+        logging.debug(
+            f"Config sources of {config.meta.name} changed since its state was exported, so it is not restored."
+        )
+        return False
+    try:
+        config._restore_option_values(
+            values=config_state.values,
+            hardcoded_values=config_state.hardcoded_values,
+            last_loaded_at=config_state.last_loaded_at,
+        )
+    except Exception:
+        logging.exception(f"Failed to restore {config.meta.name} ({config.__qualname__}) from imported state.")
+        return False
+    return True
+
+
+def _read_state_file() -> dict[str, _ConfigState]:
+    file = os.environ.get(STATE_FILE_ENVIRONMENT_VARIABLE)
+    if not file:
+        return {}
+    try:
+        with open(file, mode="rb") as f:
+            state = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        logging.warning(f"Could not read the config state file {file}, so Config classes will be loaded instead.")
+        return {}
+    if (
+        not isinstance(state, _State)
+        or getattr(state, "format_version", None) != _STATE_FORMAT_VERSION
+        or state.python_sdk_version != python_sdk.__version__
+    ):
+        logging.warning(f"The config state file {file} was exported by another version of python-sdk, so is ignored.")
+        return {}
+    # Only once consumed, so that the state is handed to the processes it was shared with, and not on to their own
+    # child processes.
+    _config_sources.set_environment_variable(key=STATE_FILE_ENVIRONMENT_VARIABLE, value=None)
+    return state.configs
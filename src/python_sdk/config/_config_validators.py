@@ -18,3 +18,15 @@ class ConfigValidator(typing.Protocol):
             ConfigValidationError: Config does not pass validation.
         """
         ...
+
+
+@typing.runtime_checkable
+class DependentConfigValidator(ConfigValidator, typing.Protocol):
+    """
+    Config validator which declares the options it depends on. When options are set, or the config is reloaded, it is
+    only run again if any of those options changed, rather than whenever any option changes.
+    Config validators not declaring their dependencies are run again on every change, as are overrides of
+    `Config.validate`.
+    """
+
+    depends_on: frozenset[str]
@@ -1,3 +1,4 @@
+import array
 import base64
 import pathlib
 import typing
@@ -21,6 +22,55 @@ class Base64EncodedString(str):
         return base64.b64decode(self, validate=True).decode(self.encoding)
 
 
+_NumericArrayT = typing.TypeVar("_NumericArrayT", bound="_NumericArray")
+
+
+class _NumericArray(array.array):  # type: ignore[type-arg]
+    typecode_: typing.ClassVar[str]
+
+    def __new__(cls: type[_NumericArrayT], values: typing.Iterable[typing.Any] = ()) -> _NumericArrayT:
+        return super().__new__(cls, cls.typecode_, values)
+
+    @classmethod
+    def _from_bytes(cls: type[_NumericArrayT], data: bytes) -> _NumericArrayT:
+        values = cls()
+        values.frombytes(data)
+        return values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()})"
+
+    # array.array copies and pickles to plain arrays, losing the subclass.
+    def __copy__(self: _NumericArrayT) -> _NumericArrayT:
+        return self._from_bytes(self.tobytes())
+
+    def __deepcopy__(self: _NumericArrayT, memo: typing.Any) -> _NumericArrayT:
+        return self._from_bytes(self.tobytes())
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> tuple[typing.Any, ...]:
+        return type(self)._from_bytes, (self.tobytes(),)
+
+
+class Int64Array(_NumericArray):
+    """
+    A list of signed 64-bit integers, stored contiguously rather than as a list of int objects, so large lists take a
+    fraction of the memory.
+    Supports the buffer protocol, so NumPy can wrap it without copying: `numpy.frombuffer(value, dtype=numpy.int64)`.
+    """
+
+    typecode_ = "q"
+
+
+class Float64Array(_NumericArray):
+    """
+    A list of 64-bit floats, stored contiguously rather than as a list of float objects, so large lists take a fraction
+    of the memory.
+    Supports the buffer protocol, so NumPy can wrap it without copying: `numpy.frombuffer(value, dtype=numpy.float64)`.
+    """
+
+    typecode_ = "d"
+
+
 # TODO: base64encodedpemcert
 # TODO: base64encodeddercert
 
@@ -39,5 +89,7 @@ ConfigValueType: typing.TypeAlias = (
     | list[float]
     | list[Base64EncodedString]
     | list[pathlib.Path]
+    | Int64Array
+    | Float64Array
     | None
 )
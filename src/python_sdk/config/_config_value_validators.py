@@ -1,10 +1,63 @@
+import contextlib
+import contextvars
 import os
 import pathlib
+import stat
 import typing
 
 if typing.TYPE_CHECKING:
     from python_sdk.config import _config_option
 
+# Results of filesystem queries made within the current validation pass, keyed by query and path, so that validators
+# checking the same path query the filesystem once per pass rather than once each. None outside of a validation pass.
+_VALIDATION_PASS_CACHE: contextvars.ContextVar[dict[tuple[str, str], typing.Any] | None] = contextvars.ContextVar(
+    "_PYTHON_SDK_CONFIG_VALIDATION_PASS_CACHE", default=None
+)
+
+
+@contextlib.contextmanager
+def validation_pass() -> typing.Generator[None, None, None]:
+    """
+    Within a validation pass, filesystem validators share one `os.stat`, and one `os.access` per mode, per path.
+    Changes made to the filesystem during the pass are not picked up until the next pass.
+    Nested passes share the outermost pass.
+    """
+    if _VALIDATION_PASS_CACHE.get() is not None:
+        yield
+        return
+
+    token = _VALIDATION_PASS_CACHE.set({})
+    try:
+        yield
+    finally:
+        _VALIDATION_PASS_CACHE.reset(token)
+
+
+def _stat(path: pathlib.Path) -> os.stat_result | None:
+    """Stat of the path, following symlinks, or None if it cannot be stat-ed, such as when it does not exist."""
+    cache = _VALIDATION_PASS_CACHE.get()
+    key = ("stat", os.fspath(path))
+    if cache is not None and key in cache:
+        return typing.cast(os.stat_result | None, cache[key])
+    try:
+        result: os.stat_result | None = os.stat(path)
+    except (OSError, ValueError):
+        result = None
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+def _access(path: pathlib.Path, mode: int) -> bool:
+    cache = _VALIDATION_PASS_CACHE.get()
+    key = (f"access:{mode}", os.fspath(path))
+    if cache is not None and key in cache:
+        return typing.cast(bool, cache[key])
+    result = os.access(path, mode)
+    if cache is not None:
+        cache[key] = result
+    return result
+
 
 class ConfigValueValidationError(Exception):
     """Config Value does not pass validation."""
@@ -43,9 +96,10 @@ class ValidateFileExists:
         Raises:
             ConfigValueValidationError: Path does not exist or is not a directory.
         """
-        if not config_value.exists():
+        path_stat = _stat(path=config_value)
+        if path_stat is None:
             raise ConfigValueValidationError(f"File at {config_value} does not exist.")
-        if not config_value.is_file():
+        if not stat.S_ISREG(path_stat.st_mode):
             raise ConfigValueValidationError(f"{config_value} not a file.")
 
 
@@ -63,9 +117,10 @@ class ValidateDirectoryExists:
         Raises:
             ConfigValueValidationError: Path does not exist or is not a directory.
         """
-        if not config_value.exists():
+        path_stat = _stat(path=config_value)
+        if path_stat is None:
             raise ConfigValueValidationError(f"Directory at {config_value} does not exist.")
-        if not config_value.is_dir():
+        if not stat.S_ISDIR(path_stat.st_mode):
             raise ConfigValueValidationError(f"{config_value} not a directory.")
 
 
@@ -83,8 +138,8 @@ class ValidatePathIsReadable:
         Raises:
             ConfigValueValidationError: Path is not readable.
         """
-        path_to_evaluate = config_value if config_value.exists() else config_value.parent
-        if not os.access(path_to_evaluate, os.R_OK):
+        path_to_evaluate = config_value if _stat(path=config_value) is not None else config_value.parent
+        if not _access(path=path_to_evaluate, mode=os.R_OK):
             raise ConfigValueValidationError(f"{config_value} is not readable.")
 
 
@@ -102,8 +157,8 @@ class ValidatePathIsWritable:
         Raises:
             ConfigValueValidationError: Path is not writeable.
         """
-        path_to_evaluate = config_value if config_value.exists() else config_value.parent
-        if not os.access(path_to_evaluate, os.W_OK):
+        path_to_evaluate = config_value if _stat(path=config_value) is not None else config_value.parent
+        if not _access(path=path_to_evaluate, mode=os.W_OK):
             raise ConfigValueValidationError(f"{config_value} is not writeable")
 
 
@@ -121,8 +176,8 @@ class ValidatePathIsExecutable:
         Raises:
             ConfigValueValidationError: Path is not executable.
         """
-        path_to_evaluate = config_value if config_value.exists() else config_value.parent
-        if not os.access(path_to_evaluate, os.EX_OK):
+        path_to_evaluate = config_value if _stat(path=config_value) is not None else config_value.parent
+        if not _access(path=path_to_evaluate, mode=os.EX_OK):
             raise ConfigValueValidationError(f"{config_value} is not executable")
 
 
@@ -1,4 +1,6 @@
+import array
 import base64
+import copy
 import functools
 import json
 import pathlib
@@ -10,6 +12,33 @@ ENCODED_STRING_LIST_SEPARATOR = ","
 
 _T = typing.TypeVar("_T")
 
+# Types of decoded values which can be changed in place, which callers sharing a decoded value would see each other
+# change.
+MUTABLE_TYPES: tuple[type, ...] = (dict, list, array.array)
+
+StringDecoder: typing.TypeAlias = typing.Callable[[str], _config_value_types.ConfigValueType]
+
+# Resolved decoders, keyed by datatype.
+# Resolving a decoder walks the whole dispatch chain in _get_string_decoder, so we only ever do it once per datatype.
+_DECODERS: dict[typing.Any, StringDecoder] = {}
+
+
+class DecodedString(str):
+    """
+    An encoded value which carries the value it decodes to, for config sources which have already parsed it out of a
+    structured document, so that it is not parsed again when decoded.
+    """
+
+    decoded: typing.Any
+
+    def __new__(cls, string: str, decoded: typing.Any) -> "DecodedString":
+        instance = super().__new__(cls, string)
+        instance.decoded = decoded
+        return instance
+
+    def __getnewargs__(self) -> tuple[str, typing.Any]:  # type: ignore[override]
+        return str(self), self.decoded
+
 
 def _str_to_bool(string: str) -> bool:
     normalized_string = string.strip().lower()
@@ -21,6 +50,9 @@ def _str_to_bool(string: str) -> bool:
 
 
 def _str_to_dict(string: str) -> dict[str, typing.Any]:
+    if isinstance(string, DecodedString) and isinstance(string.decoded, dict):
+        # The parsed table is shared by every config sourcing from the document, so each decode gets its own copy.
+        return _copy_json_value(string.decoded)  # type: ignore[no-any-return]
     try:
         data = json.loads(string)
     except json.JSONDecodeError:
@@ -32,15 +64,67 @@ def _str_to_dict(string: str) -> dict[str, typing.Any]:
     return data
 
 
+def _copy_json_value(value: typing.Any) -> typing.Any:
+    # Much cheaper than copy.deepcopy, which need not handle anything but the dicts and lists of a parsed document.
+    if isinstance(value, dict):
+        return {key: _copy_json_value(item) if isinstance(item, (dict, list)) else item for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_copy_json_value(item) if isinstance(item, (dict, list)) else item for item in value]
+    return value
+
+
+def decoded_value_copier(value: typing.Any) -> typing.Callable[[], typing.Any]:
+    """
+    Returns a function returning a copy of the value, which shares nothing that can be changed in place with the value
+    or other copies. Only dicts, lists and numeric arrays are copied, see MUTABLE_TYPES, so copies of a flat dict cost
+    little more than a `dict.copy`. Other values are returned as they are.
+    The value must not be changed once the function is made.
+    """
+    if isinstance(value, dict):
+        dict_items = [
+            (key, decoded_value_copier(item)) for key, item in value.items() if isinstance(item, MUTABLE_TYPES)
+        ]
+
+        def copy_dict() -> dict[typing.Any, typing.Any]:
+            copied = value.copy()
+            for key, copy_item in dict_items:
+                copied[key] = copy_item()
+            return copied
+
+        return copy_dict
+    elif isinstance(value, list):
+        list_items = [
+            (i, decoded_value_copier(item)) for i, item in enumerate(value) if isinstance(item, MUTABLE_TYPES)
+        ]
+
+        def copy_list() -> list[typing.Any]:
+            copied = value.copy()
+            for i, copy_item in list_items:
+                copied[i] = copy_item()
+            return copied
+
+        return copy_list
+    elif isinstance(value, array.array):
+        return functools.partial(copy.copy, value)
+    return lambda: value
+
+
 def _str_to_base64_encoded_string(string: str) -> str:
     string = string.strip()
     if not string:
         raise ValueError()
+    _validate_base64_encoded_string(string)
+    return string
+
+
+# Base64 encoded values tend to be large, such as certificates and keys, and the same values are validated on every
+# load, by every option holding them. Only strings which pass validation are cached, as exceptions are not.
+@functools.lru_cache(maxsize=1024)
+def _validate_base64_encoded_string(string: str) -> None:
     try:
         base64.b64decode(string, validate=True).decode("utf-8")  # check it can be decoded
     except Exception as e:
         raise ValueError() from e
-    return string
 
 
 def _str_to_literal(string: str, literal: type) -> str:
@@ -71,6 +155,24 @@ def _str_to_list_of_floats(string: str) -> list[float]:
     return [float(i) for i in string.split(ENCODED_STRING_LIST_SEPARATOR)]
 
 
+def _str_to_int64_array(string: str) -> _config_value_types.Int64Array:
+    string = string.strip().strip(ENCODED_STRING_LIST_SEPARATOR)
+    if not string:
+        raise ValueError()
+    # Fills the array straight from the iterator, without building an intermediate list.
+    try:
+        return _config_value_types.Int64Array(map(int, string.split(ENCODED_STRING_LIST_SEPARATOR)))
+    except OverflowError as e:
+        raise ValueError() from e
+
+
+def _str_to_float64_array(string: str) -> _config_value_types.Float64Array:
+    string = string.strip().strip(ENCODED_STRING_LIST_SEPARATOR)
+    if not string:
+        raise ValueError()
+    return _config_value_types.Float64Array(map(float, string.split(ENCODED_STRING_LIST_SEPARATOR)))
+
+
 def _str_to_list_of_base64_encoded_strings(string: str) -> list[str]:
     string = string.strip().strip(ENCODED_STRING_LIST_SEPARATOR)
     if not string:
@@ -100,7 +202,7 @@ def _str_to_list_of_literals(string: str, literal: type) -> list[str]:
     return strings
 
 
-def _get_string_decoder(data_type: type) -> typing.Callable[[str], _config_value_types.ConfigValueType]:
+def _get_string_decoder(data_type: type) -> StringDecoder:
     # primitives
     if data_type == str:
         return str
@@ -132,6 +234,12 @@ def _get_string_decoder(data_type: type) -> typing.Callable[[str], _config_value
         return _str_to_list_of_paths
     elif _is_list_of_literals(data_type=data_type):
         return functools.partial(_str_to_list_of_literals, literal=typing.get_args(data_type)[0])
+
+    # arrays of numbers
+    elif data_type == _config_value_types.Int64Array:
+        return _str_to_int64_array
+    elif data_type == _config_value_types.Float64Array:
+        return _str_to_float64_array
     else:
         raise NotImplementedError("Datatype not supported.")
 
@@ -149,9 +257,20 @@ def _is_list_of_literals(data_type: type) -> bool:
     return typing.get_origin(data_type) == list and _is_literal(data_type=typing.get_args(data_type)[0])
 
 
+def get_string_decoder(data_type: type) -> StringDecoder:
+    """
+    Raises:
+        NotImplementedError: Datatype not supported.
+    """
+    decoder = _DECODERS.get(data_type)
+    if decoder is None:
+        decoder = _DECODERS.setdefault(data_type, _get_string_decoder(data_type=data_type))
+    return decoder
+
+
 def type_is_supported(data_type: type) -> bool:
     try:
-        _get_string_decoder(data_type=data_type)
+        get_string_decoder(data_type=data_type)
         return True
     except NotImplementedError:
         return False
@@ -160,5 +279,5 @@ def type_is_supported(data_type: type) -> bool:
 def decode_string(
     string: str, data_type: type[_config_value_types.ConfigValueType]
 ) -> _config_value_types.ConfigValueType:
-    decoder = _get_string_decoder(data_type=data_type)
+    decoder = get_string_decoder(data_type=data_type)
     return decoder(string)
@@ -1,3 +1,5 @@
+import typing
+
 # This has to be the first import.
 # It sets up the base logging system, to be used by python_sdk, while it's initializing.
 from python_sdk.log import _base  # isort:skip
@@ -14,7 +16,15 @@ from python_sdk.log._log import info as info
 from python_sdk.log._log import security as security
 from python_sdk.log._log import warning as warning
 
-# This has to be the last import.
-# Placed anywhere else, it will cause cyclical imports.
-# When imported, the below will set up the user-configured logging system.
-from python_sdk.log._config import LogConfig as LogConfig  # isort:skip
+if typing.TYPE_CHECKING:
+    from python_sdk.log._config import LogConfig as LogConfig
+
+
+def __getattr__(name: str) -> typing.Any:
+    # LogConfig is defined, and so loaded, on first use rather than on import, as loading it means importing and
+    # loading the config package too. The user-configured logging system is set up on the first log call regardless.
+    if name == "LogConfig":
+        from python_sdk.log._config import LogConfig
+
+        return LogConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,49 @@
-import datetime
 import logging
+import threading
+import typing
 
 from python_sdk.log import _logging_formatter
 from python_sdk.log import _logging_handler
 
+if typing.TYPE_CHECKING:
+    from python_sdk import config
+
 _LOGGER: logging.Logger | None = None
-_LAST_CONFIGURED: datetime.datetime | None = None
+_LOGGER_LOCK = threading.Lock()
+_SUBSCRIBED = False
 
 
 def logger() -> logging.Logger:
+    global _LOGGER
+    global _SUBSCRIBED
+
+    # Changes to LogConfig are pushed to _on_log_config_change, so there is nothing to check on the hot path.
+    if _LOGGER is not None:
+        return _LOGGER
+
     from python_sdk.log._config import LogConfig
 
-    global _LOGGER
-    global _LAST_CONFIGURED
+    with _LOGGER_LOCK:
+        if _LOGGER is None:
+            _LOGGER = _configure_logger()
+        if not _SUBSCRIBED:
+            LogConfig.subscribe(subscriber=_on_log_config_change)
+            _SUBSCRIBED = True
+        return _LOGGER
+
 
-    if not _LOGGER:
-        _LOGGER = _configure_logger()
-    elif _LAST_CONFIGURED and _LAST_CONFIGURED != LogConfig.last_loaded_at():
-        _LAST_CONFIGURED = LogConfig.last_loaded_at()
-        _LOGGER = _configure_logger()
+def _on_log_config_change(config: type["config.Config"], changed_options: frozenset[str]) -> None:
+    global _LOGGER
 
-    return _LOGGER
+    with _LOGGER_LOCK:
+        if _LOGGER is None:
+            # Not configured yet. It will be configured from the changed config on first use.
+            return
+        if changed_options == {"LEVEL"}:
+            # The level is the only thing that changed. No need to tear down the handlers.
+            _LOGGER.setLevel(level=config.LEVEL)
+        else:
+            _LOGGER = _configure_logger()
 
 
 def _configure_logger() -> logging.Logger:
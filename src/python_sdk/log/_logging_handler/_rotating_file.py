@@ -1,15 +1,21 @@
 import contextlib
 import logging
 import logging.handlers
-import multiprocessing
+import typing
 
-from python_sdk.log._config import LogConfig
+if typing.TYPE_CHECKING:
+    import multiprocessing
 
 
 class RotatingFile(logging.handlers.QueueHandler):
     TYPE: str = "ROTATING_FILE"
 
     def __init__(self) -> None:
+        # Deferred, so that importing python_sdk.log neither imports multiprocessing, nor defines and loads LogConfig.
+        import multiprocessing
+
+        from python_sdk.log._config import LogConfig
+
         # For this to support multiprocessing, logs will flow:
         # processes -> queue -> queue-handler -> queue-listener.
 
@@ -2,8 +2,10 @@ import typing
 
 from python_sdk.secrets._config import AWSSecretsEngineConfig as AWSSecretsEngineConfig
 from python_sdk.secrets._config import SecretsConfig as SecretsConfig
+from python_sdk.secrets._secrets_engine import BatchSecretsEngine as BatchSecretsEngine
 from python_sdk.secrets._secrets_engine import DoesNotExist as DoesNotExist
 from python_sdk.secrets._secrets_engine import Unauthorized as Unauthorized
+from python_sdk.secrets._secrets_engine import _batch
 from python_sdk.secrets._secrets_engine import register_implementation as register_implementation
 from python_sdk.secrets._secrets_engine import secrets_engine as secrets_engine
 
@@ -16,5 +18,18 @@ def get_secret_value(key: str) -> typing.IO[bytes]:
     return secrets_engine(type=SecretsConfig.ENGINE).get_secret_value(key=key)
 
 
+def get_secret_values(keys: typing.Iterable[str], type: str | None = None) -> dict[str, typing.IO[bytes]]:
+    """
+    Gets the values of many keys from the given secrets engine, or the configured one, at once. Engines implementing
+    BatchSecretsEngine get them in as few requests as they allow, while others get them one by one. Either way,
+    requests are made concurrently.
+
+    Raises:
+        DoesNotExist: A secret does not exist.
+        Unauthorized: Not authorized to access a secret.
+    """
+    return _batch.get_secret_values(engine=secrets_engine(type=type or SecretsConfig.ENGINE), keys=keys)
+
+
 def set_secret_value(key: str, value: typing.IO[bytes]) -> None:
     return secrets_engine(type=SecretsConfig.ENGINE).set_secret_value(key=key, value=value)
@@ -1,4 +1,5 @@
 from python_sdk.secrets._secrets_engine._factory import register_implementation as register_implementation
 from python_sdk.secrets._secrets_engine._factory import secrets_engine as secrets_engine
+from python_sdk.secrets._secrets_engine._protocol import BatchSecretsEngine as BatchSecretsEngine
 from python_sdk.secrets._secrets_engine._protocol import DoesNotExist as DoesNotExist
 from python_sdk.secrets._secrets_engine._protocol import Unauthorized as Unauthorized
@@ -8,6 +8,7 @@ from python_sdk.secrets._secrets_engine import _protocol
 
 class AWSSecretsManager:
     TYPE: str = "AWS_SECRETS_MANAGER"
+    MAX_BATCH_SIZE: int = 20
 
     def __init__(self) -> None:
         import boto3  # type: ignore
@@ -59,6 +60,39 @@ class AWSSecretsManager:
         value.seek(0)
         return value
 
+    def get_secret_values(self, keys: list[str]) -> dict[str, typing.IO[bytes]]:
+        import botocore.exceptions
+
+        logging.debug(f"Getting secrets. {keys=}")
+        secret_ids = {self._processed_key(key=key): key for key in keys}
+        try:
+            response = self.client.batch_get_secret_value(SecretIdList=list(secret_ids))
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in {"AccessDeniedException", "NotAuthorizedException"}:
+                raise _protocol.Unauthorized(e.response["Error"]["Message"]) from e
+            raise
+
+        for error in response.get("Errors", []):
+            if error["ErrorCode"] == "ResourceNotFoundException":
+                raise _protocol.DoesNotExist(error["Message"])
+            elif error["ErrorCode"] in {"AccessDeniedException", "NotAuthorizedException"}:
+                raise _protocol.Unauthorized(error["Message"])
+            raise RuntimeError(f"Could not get secret {error['SecretId']}: {error['Message']}")
+
+        values: dict[str, typing.IO[bytes]] = {}
+        for secret in response["SecretValues"]:
+            # Secrets may have been asked for by name or by ARN.
+            key = secret_ids.get(secret["Name"], secret_ids.get(secret["ARN"]))
+            if key is None:
+                continue
+            if "SecretBinary" in secret:
+                values[key] = io.BytesIO(secret["SecretBinary"])
+            else:
+                values[key] = io.BytesIO(secret["SecretString"].encode("utf-8"))
+        if missing_keys := set(keys) - values.keys():
+            raise _protocol.DoesNotExist(f"Secrets {sorted(missing_keys)} were not returned.")
+        return values
+
     def set_secret_value(self, key: str, value: typing.IO[bytes]) -> None:
         import botocore.exceptions
 
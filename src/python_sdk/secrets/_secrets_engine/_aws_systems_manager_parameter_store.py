@@ -8,6 +8,7 @@ from python_sdk.secrets._secrets_engine import _protocol
 
 class AWSSystemsManagerParameterStore:
     TYPE: str = "AWS_SYSTEMS_MANAGER_PARAMETER_STORE"
+    MAX_BATCH_SIZE: int = 10
 
     def __init__(self) -> None:
         import boto3  # type: ignore
@@ -56,5 +57,25 @@ class AWSSystemsManagerParameterStore:
         value.seek(0)
         return value
 
+    def get_secret_values(self, keys: list[str]) -> dict[str, typing.IO[bytes]]:
+        import botocore.exceptions
+
+        logging.debug(f"Getting secrets. {keys=}")
+        names = {self._processed_key(key=key): key for key in keys}
+        try:
+            response = self.client.get_parameters(Names=list(names), WithDecryption=True)
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in {"AccessDeniedException", "NotAuthorizedException"}:
+                raise _protocol.Unauthorized(e.response["Error"]["Message"]) from e
+            raise
+
+        if response.get("InvalidParameters"):
+            raise _protocol.DoesNotExist(f"Parameters {response['InvalidParameters']} do not exist.")
+        return {
+            names[parameter["Name"]]: io.BytesIO(parameter["Value"].encode("utf-8"))
+            for parameter in response["Parameters"]
+            if parameter["Name"] in names
+        }
+
     def set_secret_value(self, key: str, value: typing.IO[bytes]) -> None:
         self.client.put_parameter(Name=self._processed_key(key=key), Value=value.read().decode("utf-8"), Overwrite=True)
@@ -0,0 +1,40 @@
+import concurrent.futures
+import typing
+
+from python_sdk.secrets._secrets_engine import _protocol
+
+# Bounds the number of requests in flight at once, so that many secrets do not exhaust connection pools or API limits.
+_MAX_WORKERS = 8
+
+
+def get_secret_values(engine: _protocol.SecretsEngine, keys: typing.Iterable[str]) -> dict[str, typing.IO[bytes]]:
+    """
+    Gets the values of many keys concurrently, using as few requests as the engine allows.
+
+    Raises:
+        DoesNotExist: A secret does not exist.
+        Unauthorized: Not authorized to access a secret.
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+
+    batches: list[list[str]]
+    if isinstance(engine, _protocol.BatchSecretsEngine):
+        batches = [keys[i : i + engine.MAX_BATCH_SIZE] for i in range(0, len(keys), engine.MAX_BATCH_SIZE)]
+    else:
+        batches = [[key] for key in keys]
+
+    def get_batch(batch: list[str]) -> dict[str, typing.IO[bytes]]:
+        if isinstance(engine, _protocol.BatchSecretsEngine):
+            return engine.get_secret_values(keys=batch)
+        return {key: engine.get_secret_value(key=key) for key in batch}
+
+    if len(batches) == 1:
+        return get_batch(batches[0])
+
+    values: dict[str, typing.IO[bytes]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(batches))) as executor:
+        for batch_values in executor.map(get_batch, batches):
+            values |= batch_values
+    return values
@@ -1,7 +1,5 @@
 import typing
 
-import boto3  # type: ignore
-
 
 class DoesNotExist(Exception):
     """Secret does not exist."""
@@ -14,8 +12,7 @@ class Unauthorized(Exception):
 class SecretsEngine(typing.Protocol):
     TYPE: str
 
-    def autocomplete_key(self, key: str) -> list[str]:
-        ...
+    def autocomplete_key(self, key: str) -> list[str]: ...
 
     def get_secret_value(self, key: str) -> typing.IO[bytes]:
         """
@@ -32,3 +29,21 @@ class SecretsEngine(typing.Protocol):
             Unauthorized: Not authorized to access secret.
         """
         ...
+
+
+@typing.runtime_checkable
+class BatchSecretsEngine(SecretsEngine, typing.Protocol):
+    """Secrets engine which can get many secret values in a single request."""
+
+    # Most keys the engine can get in a single request.
+    MAX_BATCH_SIZE: int
+
+    def get_secret_values(self, keys: list[str]) -> dict[str, typing.IO[bytes]]:
+        """
+        Returns the value of each key, keyed by the key as given.
+
+        Raises:
+            DoesNotExist: A secret does not exist.
+            Unauthorized: Not authorized to access a secret.
+        """
+        ...
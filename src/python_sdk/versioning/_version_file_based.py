@@ -1,7 +1,7 @@
-import inspect
 import json
 import os
 import pathlib
+import sys
 
 
 # TODO: Add debug logs
@@ -18,12 +18,11 @@ def version_file_based(version_file_name: str = "version") -> str:
     #         )
     #     return packaged_version_file.read_text()
 
-    calling_module_frame = inspect.stack()[1]
-    calling_module_name = calling_module_frame[0]
-    calling_module = inspect.getmodule(calling_module_name)
-    if not calling_module or not calling_module.__file__:
+    # Rather than inspect.stack(), which reads the source of every frame on the stack, and costs the import of inspect.
+    calling_module_file_name = sys._getframe(1).f_globals.get("__file__")
+    if not calling_module_file_name:
         raise ModuleNotFoundError("Could not discover calling module.")
-    calling_module_file = pathlib.Path(calling_module.__file__)
+    calling_module_file = pathlib.Path(calling_module_file_name)
 
     current_dir = calling_module_file.parent
     checked = []
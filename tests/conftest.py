@@ -0,0 +1,14 @@
+import typing
+
+import pytest
+
+from python_sdk import config
+
+
+@pytest.fixture(scope="function", autouse=True)
+def invalidate_environment_variables() -> typing.Generator[None, None, None]:
+    # Tests change the environment through os.environ, and undo their changes through it, which EnvironmentVariables
+    # only picks up once invalidated.
+    config.invalidate_environment_variables()
+    yield
+    config.invalidate_environment_variables()
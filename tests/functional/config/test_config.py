@@ -1,5 +1,12 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import operator
 import os
 import pathlib
+import pickle
+import threading
+import time
 import typing
 
 import pytest
@@ -14,10 +21,11 @@ def remove_test_env_vars() -> typing.Generator[None, None, None]:
         if key.startswith("TEST_"):
             print("popping", key)
             os.environ.pop(key)
+    config.invalidate_environment_variables()
 
 
 def test_set_mandatory_option_is_present_in_config() -> None:
-    os.environ["TEST_KEY"] = "/tmp"
+    config.set_environment_variable(key="TEST_KEY", value="/tmp")
 
     class Config(config.Config):
         TEST_KEY: pathlib.Path = config.Option()
@@ -62,6 +70,8 @@ def test_unset_optional_option_defaults_to_provided_default() -> None:
         (list[float],                               "1.5,1.5",           [1.5, 1.5]),
         (list[config.Base64EncodedString],          "dGVzdA==,dGVzdA==", ["dGVzdA==", "dGVzdA=="]),
         (list[pathlib.Path],                        "/tmp,/home",        [pathlib.Path("/tmp"), pathlib.Path("/home")]),
+        (config.Int64Array,                         "1,2",               config.Int64Array([1, 2])),
+        (config.Float64Array,                       "1.5,1.5",           config.Float64Array([1.5, 1.5])),
         (str | None,                                "test",              "test"),
         (int | None,                                "1",                 1),
         (float | None,                              "1.5",               1.5),
@@ -74,6 +84,8 @@ def test_unset_optional_option_defaults_to_provided_default() -> None:
         (list[float] | None,                        "1.5,1.5",           [1.5, 1.5]),
         (list[config.Base64EncodedString] | None,   "dGVzdA==,dGVzdA==", ["dGVzdA==", "dGVzdA=="]),
         (list[pathlib.Path] | None,                 "/tmp,/home",        [pathlib.Path("/tmp"), pathlib.Path("/home")]),
+        (config.Int64Array | None,                  "1,2",               config.Int64Array([1, 2])),
+        (config.Float64Array | None,                "1.5,1.5",           config.Float64Array([1.5, 1.5])),
         (typing.Literal["ONE"],                     "ONE",               "ONE"),
         (typing.Literal["ONE"] | None,              "ONE",               "ONE"),  # type: ignore
         (list[typing.Literal["ONE", "TWO"]] | None, "ONE,TWO",           ["ONE", "TWO"]),
@@ -83,7 +95,7 @@ def test_unset_optional_option_defaults_to_provided_default() -> None:
 def test_config_value_when_set_is_retrieved_and_converted_correctly(
     data_type: config.ConfigValueType, value: str, expected_value: config.ConfigValueType
 ) -> None:
-    os.environ["TEST_KEY"] = value
+    config.set_environment_variable(key="TEST_KEY", value=value)
     cls = type(
         "Config",
         (config.Config,),
@@ -104,3 +116,856 @@ def test_options_support_callable_defaults() -> None:
         TEST_KEY: dict[str, typing.Any] = config.Option(default=dict)
 
     assert Config.TEST_KEY == {}
+
+
+def test_set_config_value_is_visible_on_attribute_read() -> None:
+    class Config(config.Config):
+        TEST_KEY: int = config.Option(default=1)
+
+    assert Config.TEST_KEY == 1
+    Config.set_config_value(option="TEST_KEY", value=2)
+    assert Config.TEST_KEY == 2
+
+
+def test_lazy_config_is_loaded_on_first_attribute_read() -> None:
+    class Config(config.Config, lazy_load_config=True):
+        TEST_KEY: int = config.Option(default=1)
+
+    assert not Config.meta.loaded
+    assert Config.TEST_KEY == 1
+    assert Config.meta.loaded
+
+
+def test_reload_without_changes_reports_no_changes() -> None:
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: int = config.Option()
+        TEST_OTHER_KEY: int = config.Option(default=2)
+
+    Config.reload_config()
+
+    assert not Config.last_load_contained_changes()
+    assert Config.last_load_changed_options() == frozenset()
+
+
+def test_reload_with_changes_reports_changed_options() -> None:
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: int = config.Option()
+        TEST_OTHER_KEY: int = config.Option(default=2)
+
+    config.set_environment_variable(key="TEST_KEY", value="3")
+    Config.reload_config()
+
+    assert Config.last_load_contained_changes()
+    assert Config.last_load_changed_options() == frozenset({"TEST_KEY"})
+
+
+def test_reload_does_not_decode_or_validate_unchanged_values() -> None:
+    validated_values: list[typing.Any] = []
+
+    class _RecordingValidator:
+        name: str = "Recording Validator"
+        description: str = "Records the values it validates."
+
+        def __call__(self, config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+            validated_values.append(config_value)
+
+    config.set_environment_variable(key="TEST_KEY", value="/tmp/key")
+    config.set_environment_variable(key="TEST_OTHER_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: pathlib.Path = config.Option(validators=[_RecordingValidator()])
+        TEST_OTHER_KEY: int = config.Option(validators=[_RecordingValidator()])
+
+    value = Config.TEST_KEY
+    config.set_environment_variable(key="TEST_OTHER_KEY", value="2")
+    Config.reload_config()
+
+    assert Config.TEST_KEY is value
+    assert Config.TEST_OTHER_KEY == 2
+    assert validated_values == [pathlib.Path("/tmp/key"), 1, 2]
+    assert Config.meta.last_load_timings is not None
+    assert "TEST_KEY" not in Config.meta.last_load_timings.decode
+
+
+def test_reload_undoes_changes_to_unchanged_values_without_decoding_or_validating_them_again() -> None:
+    validated: list[str] = []
+    dictionary = {"TEST_TABLE": '{"hosts": ["a"]}', "TEST_NUMBERS": "1,2"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_TABLE: dict[str, typing.Any] = config.Option(
+            validators=[_FunctionValidator(function=lambda *args: validated.append(args[0]))]
+        )
+        TEST_NUMBERS: config.Int64Array = config.Option()
+
+    Config.TEST_TABLE["hosts"].append("b")
+    Config.TEST_NUMBERS.append(3)
+    Config.reload_config()
+
+    assert Config.TEST_TABLE == {"hosts": ["a"]}
+    assert list(Config.TEST_NUMBERS) == [1, 2]
+    assert validated == ["TEST_TABLE"]
+    assert Config.meta.last_load_timings is not None
+    assert not Config.meta.last_load_timings.decode
+
+
+def test_reload_falls_back_to_default_when_option_is_no_longer_set() -> None:
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: int = config.Option(default=2)
+
+    config.set_environment_variable(key="TEST_KEY", value=None)
+    Config.reload_config()
+
+    assert Config.TEST_KEY == 2
+    assert Config.last_load_changed_options() == frozenset({"TEST_KEY"})
+
+
+def test_option_hardcoded_through_config_option_is_kept_on_reload() -> None:
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: int = config.Option()
+
+    config_option = Config.get_config_option(option="TEST_KEY")
+    config_option.hardcode_value(value="2")
+    assert config_option.hardcoded
+    assert config_option.value == 2
+
+    Config.reload_config()
+
+    assert Config.TEST_KEY == 2
+
+
+def test_reload_with_invalid_value_leaves_config_unchanged() -> None:
+    dictionary = {"TEST_ONE": "1", "TEST_TWO": "1"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+    dictionary |= {"TEST_ONE": "2", "TEST_TWO": "not a number"}
+    with pytest.raises(ValueError):
+        Config.reload_config()
+
+    assert (Config.TEST_ONE, Config.TEST_TWO) == (1, 1)
+    assert Config.get_config_option(option="TEST_ONE").value == 1
+
+
+def test_reload_failing_config_validation_leaves_config_unchanged() -> None:
+    dictionary = {"TEST_ONE": "1", "TEST_TWO": "1"}
+
+    config_validation_error = config.ConfigValidationError
+
+    def validate_equal(config: typing.Any) -> None:
+        if config.TEST_ONE != config.TEST_TWO:
+            raise config_validation_error()
+
+    class Config(
+        config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)], validators=[validate_equal]
+    ):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+    dictionary["TEST_ONE"] = "2"
+    with pytest.raises(config.ConfigValidationError):
+        Config.reload_config()
+
+    assert Config.option_values() == {"TEST_ONE": 1, "TEST_TWO": 1}
+    assert Config.get_config_option(option="TEST_ONE").value == 1
+
+
+def test_values_are_not_visible_to_other_threads_until_they_pass_config_validation() -> None:
+    dictionary = {"TEST_ONE": "1", "TEST_TWO": "1"}
+    validating = threading.Event()
+    read = threading.Event()
+    validated_values: list[int] = []
+    config_validation_error = config.ConfigValidationError
+
+    def validate_equal(config: typing.Any) -> None:
+        validated_values.append(config.TEST_ONE)
+        if config.TEST_ONE != config.TEST_TWO:
+            assert config.option_values()["TEST_ONE"] == config.TEST_ONE
+            validating.set()
+            read.wait(timeout=10)
+            raise config_validation_error()
+
+    class Config(
+        config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)], validators=[validate_equal]
+    ):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+    def read_while_validating() -> tuple[int, config.ConfigValueType]:
+        validating.wait(timeout=10)
+        try:
+            return Config.TEST_ONE, Config.option_values()["TEST_ONE"]
+        finally:
+            read.set()
+
+    dictionary["TEST_ONE"] = "2"
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(read_while_validating)
+        with pytest.raises(config.ConfigValidationError):
+            Config.reload_config()
+        assert future.result(timeout=10) == (1, 1)
+
+    assert validated_values == [1, 2]
+    assert Config.TEST_ONE == 1
+
+
+class _FunctionValidator:
+    name: str = "Function Validator"
+    description: str = "Calls the function it is given with every value it validates."
+
+    def __init__(self, function: typing.Callable[[str, typing.Any, typing.Any], None]) -> None:
+        self.function = function
+
+    def __call__(self, config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+        self.function(config_option_name, config_option, config_value)
+
+
+class _RecordingConfigValidator:
+    name: str = "Recording Config Validator"
+    description: str = "Records each run."
+
+    def __init__(self, depends_on: frozenset[str] | None = None) -> None:
+        if depends_on is not None:
+            self.depends_on = depends_on
+        self.runs = 0
+
+    def __call__(self, config: type[config.Config]) -> None:
+        self.runs += 1
+
+
+def test_config_validators_only_run_again_when_options_they_depend_on_change() -> None:
+    depends_on_one = _RecordingConfigValidator(depends_on=frozenset({"TEST_ONE"}))
+    depends_on_two = _RecordingConfigValidator(depends_on=frozenset({"TEST_TWO"}))
+    depends_on_anything = _RecordingConfigValidator()
+
+    class Config(
+        config.Config,
+        config_sources=[config.StaticDictionary(dictionary={"TEST_ONE": "1", "TEST_TWO": "1"})],
+        validators=[depends_on_one, depends_on_two, depends_on_anything],
+    ):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+    assert isinstance(depends_on_one, config.DependentConfigValidator)
+    assert (depends_on_one.runs, depends_on_two.runs, depends_on_anything.runs) == (1, 1, 1)
+
+    values: list[config.ConfigValueType] = [2, 3, "4", "4"]
+    for value in values:
+        Config.set_config_value(option="TEST_ONE", value=value)
+
+    assert (depends_on_one.runs, depends_on_two.runs, depends_on_anything.runs) == (4, 1, 5)
+
+
+def test_config_validators_all_run_when_validate_is_overridden() -> None:
+    depends_on_one = _RecordingConfigValidator(depends_on=frozenset({"TEST_ONE"}))
+
+    class Config(
+        config.Config,
+        config_sources=[config.StaticDictionary(dictionary={"TEST_ONE": "1", "TEST_TWO": "1"})],
+        validators=[depends_on_one],
+    ):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+        @classmethod
+        def validate(cls) -> None:
+            super().validate()
+
+    Config.set_config_value(option="TEST_TWO", value=2)
+
+    assert depends_on_one.runs == 2
+
+
+def test_config_validator_depending_on_unknown_option_raises() -> None:
+    with pytest.raises(ValueError):
+
+        class Config(config.Config, validators=[_RecordingConfigValidator(depends_on=frozenset({"TEST_UNKNOWN"}))]):
+            TEST_ONE: int = config.Option(default=1)
+
+
+def test_filesystem_validators_share_one_stat_per_path_per_pass(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("")
+    stat = os.stat
+    stat_calls: list[typing.Any] = []
+
+    def counting_stat(path: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> os.stat_result:
+        if os.fspath(path) == str(config_file):
+            stat_calls.append(path)
+        return stat(path, *args, **kwargs)
+
+    validators: list[config.ConfigValueValidator] = [
+        config.ValidateFileExists(),
+        config.ValidatePathIsReadable(),
+        config.ValidatePathIsWritable(),
+    ]
+    dictionary = {"TEST_ONE": str(config_file), "TEST_TWO": str(config_file)}
+    monkeypatch.setattr(os, "stat", counting_stat)
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_ONE: pathlib.Path = config.Option(validators=validators)
+        TEST_TWO: pathlib.Path = config.Option(validators=validators)
+
+    assert len(stat_calls) == 1
+
+
+def test_option_values_are_never_torn_by_concurrent_reloads() -> None:
+    dictionary = {"TEST_ONE": "0", "TEST_TWO": "0"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+
+    stop = threading.Event()
+
+    def reload() -> None:
+        i = 0
+        while not stop.is_set():
+            i += 1
+            dictionary.update({"TEST_ONE": str(i), "TEST_TWO": str(i)})
+            Config.reload_config()
+
+    reloader = threading.Thread(target=reload)
+    reloader.start()
+    try:
+        for _ in range(20_000):
+            option_values = Config.option_values()
+            assert option_values["TEST_ONE"] == option_values["TEST_TWO"]
+    finally:
+        stop.set()
+        reloader.join()
+
+    assert Config.TEST_ONE > 0
+
+
+def test_subscribers_are_notified_once_per_change_with_changed_options() -> None:
+    dictionary = {"TEST_ONE": "1", "TEST_TWO": "1", "TEST_THREE": "1"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_ONE: int = config.Option()
+        TEST_TWO: int = config.Option()
+        TEST_THREE: int = config.Option()
+
+    notifications: list[tuple[str, frozenset[str]]] = []
+
+    def subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        notifications.append(("config", changed_options))
+
+    def option_subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        notifications.append(("options", changed_options))
+
+    Config.subscribe(subscriber=subscriber)
+    Config.subscribe(subscriber=option_subscriber, options=["TEST_ONE", "TEST_TWO"])
+
+    Config.reload_config()
+    assert notifications == []
+
+    dictionary |= {"TEST_TWO": "2", "TEST_THREE": "2"}
+    Config.reload_config()
+    assert notifications == [
+        ("config", frozenset({"TEST_TWO", "TEST_THREE"})),
+        ("options", frozenset({"TEST_TWO"})),
+    ]
+
+    notifications.clear()
+    Config.set_config_value(option="TEST_THREE", value=3)
+    assert notifications == [("config", frozenset({"TEST_THREE"}))]
+
+    notifications.clear()
+    Config.unsubscribe(subscriber=subscriber)
+    Config.set_config_value(option="TEST_ONE", value=3)
+    assert notifications == [("options", frozenset({"TEST_ONE"}))]
+
+
+def test_subscribers_are_notified_on_executor() -> None:
+    dictionary = {"TEST_KEY": "1"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_KEY: int = config.Option()
+
+    notified = threading.Event()
+    subscriber_threads = []
+
+    def subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        subscriber_threads.append(threading.current_thread())
+        notified.set()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        Config.subscribe(subscriber=subscriber, executor=executor)
+        dictionary["TEST_KEY"] = "2"
+        Config.reload_config()
+        assert notified.wait(timeout=5)
+
+    assert subscriber_threads != [threading.current_thread()]
+
+
+def test_subscribers_are_notified_once_the_config_lock_is_released() -> None:
+    dictionary = {"TEST_KEY": "1"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_KEY: int = config.Option()
+
+    notifications = []
+
+    def subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        notifications.append(config.TEST_KEY)
+        if len(notifications) > 1:
+            return
+        # Would time out were the lock still held, as the other thread waits on it while this one waits on the thread.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(config.set_config_value, option="TEST_KEY", value="3").result(timeout=5)
+
+    Config.subscribe(subscriber=subscriber)
+    dictionary["TEST_KEY"] = "2"
+    Config.reload_config()
+
+    assert notifications == [2, 3]
+    assert Config.TEST_KEY == 3
+
+
+def test_failing_subscriber_does_not_fail_reload() -> None:
+    dictionary = {"TEST_KEY": "1"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_KEY: int = config.Option()
+
+    def subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        raise RuntimeError()
+
+    Config.subscribe(subscriber=subscriber)
+    dictionary["TEST_KEY"] = "2"
+    Config.reload_config()
+
+    assert Config.TEST_KEY == 2
+
+
+def test_subscribing_to_unknown_option_raises() -> None:
+    class Config(config.Config):
+        TEST_KEY: int | None = config.Option()
+
+    def subscriber(config: type[config.Config], changed_options: frozenset[str]) -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        Config.subscribe(subscriber=subscriber, options=["TEST_UNKNOWN"])
+
+
+def test_lazily_decoded_options_are_decoded_and_validated_on_first_read() -> None:
+    dictionary = {"TEST_VALID": "1", "TEST_INVALID": "not a number"}
+    validated = []
+
+    def validate(config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+        validated.append(config_option_name)
+
+    class Config(
+        config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)], lazy_decode_options=True
+    ):
+        TEST_VALID: int = config.Option(validators=[_FunctionValidator(function=validate)])
+        TEST_INVALID: int = config.Option(validators=[_FunctionValidator(function=validate)])
+        TEST_DEFAULT: int = config.Option(default=2)
+
+    assert validated == []
+    assert Config.TEST_VALID == 1
+    assert Config.TEST_VALID == 1
+    assert Config.TEST_DEFAULT == 2
+    assert validated == ["TEST_VALID"]
+    with pytest.raises(ValueError):
+        Config.TEST_INVALID
+    with pytest.raises(ValueError):
+        Config.validate_all()
+
+    dictionary |= {"TEST_VALID": "3", "TEST_INVALID": "4"}
+    Config.reload_config()
+    Config.validate_all()
+
+    assert (Config.TEST_VALID, Config.TEST_INVALID) == (3, 4)
+
+
+def test_load_timings_are_recorded() -> None:
+    dictionary = {"TEST_KEY": "1"}
+    config_source = config.StaticDictionary(dictionary=dictionary)
+
+    def slow_validator(config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+        time.sleep(0.05)
+
+    class Config(config.Config, config_sources=[config_source]):
+        TEST_KEY: int = config.Option(validators=[_FunctionValidator(function=slow_validator)])
+        TEST_DEFAULT: int = config.Option(default=1)
+
+    dictionary["TEST_KEY"] = "2"
+    Config.reload_config()
+    timings = Config.meta.last_load_timings
+
+    assert Config.meta.load_count == 2
+    assert timings is not None
+    assert list(timings.config_sources) == [config_source]
+    assert list(timings.decode) == ["TEST_KEY"]
+    assert timings.value_validators["TEST_KEY"] >= 0.05
+    assert timings.total >= timings.value_validators["TEST_KEY"]
+
+
+def test_load_timings_hook_is_called_after_every_load() -> None:
+    reported: list[tuple[str, config.ConfigLoadTimings]] = []
+
+    def hook(config: type[config.Config], timings: config.ConfigLoadTimings) -> None:
+        reported.append((config.meta.name, timings))
+
+    config.set_load_timings_hook(hook=hook)
+    try:
+
+        class Config(config.Config, name="Timed Config"):
+            TEST_KEY: int | None = config.Option()
+
+        Config.reload_config()
+    finally:
+        config.set_load_timings_hook(hook=None)
+
+    assert [name for name, _ in reported] == ["Timed Config", "Timed Config"]
+    assert reported[-1][1] is Config.meta.last_load_timings
+
+
+def test_config_sources_are_read_once_per_load_session() -> None:
+    calls = []
+
+    class CountingConfigSource:
+        name: str = "Counting Config Source"
+        description: str = ""
+
+        def __call__(self, prefix: str) -> dict[str, str]:
+            calls.append(prefix)
+            return {"TEST_ONE_KEY": "1", "TEST_TWO_KEY": "2"}
+
+    config_source = CountingConfigSource()
+
+    with config.load_session():
+
+        class ConfigOne(config.Config, option_prefix="TEST_ONE_", config_sources=[config_source]):
+            KEY: int = config.Option()
+
+        class ConfigTwo(config.Config, option_prefix="TEST_TWO_", config_sources=[config_source]):
+            KEY: int = config.Option()
+
+    assert ConfigOne.KEY == 1
+    assert ConfigTwo.KEY == 2
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("within_load_session", [False, True])
+def test_malformed_lines_only_fail_configs_whose_prefix_they_are_under(
+    tmp_path: pathlib.Path, within_load_session: bool
+) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("TEST_ONE_KEY=1\nTEST_TWO_MALFORMED\n")
+    session = config.load_session() if within_load_session else contextlib.nullcontext()
+
+    with session:
+
+        class ConfigOne(
+            config.Config, option_prefix="TEST_ONE_", config_sources=[config.LocalFile(filepath=config_file)]
+        ):
+            KEY: int = config.Option()
+
+        class ConfigTwo(
+            config.Config,
+            option_prefix="TEST_TWO_",
+            config_sources=[config.LocalFile(filepath=config_file)],
+            lazy_load_config=True,
+        ):
+            KEY: int = config.Option(default=2)
+
+        assert ConfigOne.KEY == 1
+        with pytest.raises(ValueError):
+            ConfigTwo.reload_config()
+
+    with pytest.raises(ValueError):
+        config.reload_all(configs=[ConfigOne, ConfigTwo])
+    config.reload_all(configs=[ConfigOne])
+
+
+class _SlowConfigSource:
+    name: str = "Slow Config Source"
+    description: str = ""
+
+    def __init__(self, dictionary: dict[str, str], latency: float) -> None:
+        self.dictionary = dictionary
+        self.latency = latency
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        time.sleep(self.latency)
+        return config.StaticDictionary(dictionary=self.dictionary)(prefix=prefix)
+
+
+class _AsyncConfigSource:
+    name: str = "Async Config Source"
+    description: str = ""
+
+    def __init__(self, dictionary: dict[str, str]) -> None:
+        self.dictionary = dictionary
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        raise AssertionError("Async config source should have been awaited.")
+
+    async def acall(self, prefix: str) -> dict[str, str]:
+        await asyncio.sleep(0)
+        return config.StaticDictionary(dictionary=self.dictionary)(prefix=prefix)
+
+
+async def test_aload_reads_config_sources_concurrently() -> None:
+    class Config(
+        config.Config,
+        lazy_load_config=True,
+        config_sources=[
+            _SlowConfigSource(dictionary={"TEST_KEY": "1"}, latency=0.2),
+            _SlowConfigSource(dictionary={"TEST_KEY": "2", "TEST_OTHER_KEY": "2"}, latency=0.2),
+        ],
+    ):
+        TEST_KEY: int = config.Option()
+        TEST_OTHER_KEY: int = config.Option()
+
+    start = time.monotonic()
+    await Config.aload()
+
+    assert time.monotonic() - start < 0.35
+    assert Config.TEST_KEY == 1
+    assert Config.TEST_OTHER_KEY == 2
+
+
+async def test_aload_awaits_async_config_sources() -> None:
+    class Config(
+        config.Config, lazy_load_config=True, config_sources=[_AsyncConfigSource(dictionary={"TEST_KEY": "1"})]
+    ):
+        TEST_KEY: int = config.Option()
+
+    await Config.aload()
+
+    assert Config.TEST_KEY == 1
+
+
+async def test_areload_config_does_not_block_the_event_loop() -> None:
+    class Config(config.Config, config_sources=[_SlowConfigSource(dictionary={"TEST_KEY": "1"}, latency=0.2)]):
+        TEST_KEY: int = config.Option()
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await Config.areload_config()
+    ticker.cancel()
+
+    assert ticks > 5
+
+
+async def test_aload_applies_values_off_the_event_loop() -> None:
+    post_load_hook_threads = []
+
+    class Config(
+        config.Config, lazy_load_config=True, config_sources=[_AsyncConfigSource(dictionary={"TEST_KEY": "1"})]
+    ):
+        TEST_KEY: int = config.Option()
+
+        @classmethod
+        def post_load_hook(cls) -> None:
+            post_load_hook_threads.append(threading.current_thread())
+
+    assert await Config.aload()
+
+    assert Config.TEST_KEY == 1
+    assert post_load_hook_threads and threading.current_thread() not in post_load_hook_threads
+
+
+async def test_aload_is_not_applied_over_a_newer_load() -> None:
+    dictionary = {"TEST_KEY": "1"}
+    reading = asyncio.Event()
+    released = asyncio.Event()
+
+    class _BlockingAsyncConfigSource(_AsyncConfigSource):
+        def __call__(self, prefix: str) -> dict[str, str]:
+            return config.StaticDictionary(dictionary=self.dictionary)(prefix=prefix)
+
+        async def acall(self, prefix: str) -> dict[str, str]:
+            configuration = self(prefix=prefix)
+            reading.set()
+            await released.wait()
+            return configuration
+
+    class Config(
+        config.Config, lazy_load_config=True, config_sources=[_BlockingAsyncConfigSource(dictionary=dictionary)]
+    ):
+        TEST_KEY: int = config.Option()
+
+    aload = asyncio.create_task(Config.aload())
+    await reading.wait()
+    dictionary["TEST_KEY"] = "2"
+    await asyncio.to_thread(Config.reload_config)
+    released.set()
+
+    assert not await aload
+    assert Config.TEST_KEY == 2
+
+
+def test_config_loaded_from_snapshot_has_saved_values(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    dictionary = {"TEST_PATH": "/tmp", "TEST_NUMBERS": "1,2"}
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_PATH: pathlib.Path = config.Option()
+        TEST_NUMBERS: list[int] = config.Option()
+        TEST_OPTIONAL: str | None = config.Option()
+        TEST_DEFAULT: str = config.Option(default="default")
+
+    Config.save_to_file(file=snapshot_file)
+
+    decodes = []
+
+    def validate(config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+        decodes.append(config_option_name)
+
+    class WarmConfig(
+        config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)], lazy_load_config=True
+    ):
+        TEST_PATH: pathlib.Path = config.Option(validators=[_FunctionValidator(function=validate)])
+        TEST_NUMBERS: list[int] = config.Option(validators=[_FunctionValidator(function=validate)])
+        TEST_OPTIONAL: str | None = config.Option()
+        TEST_DEFAULT: str = config.Option(default="default")
+
+    assert WarmConfig.load_from_file(file=snapshot_file)
+    assert decodes == []
+    assert WarmConfig.TEST_PATH == pathlib.Path("/tmp")
+    assert WarmConfig.TEST_NUMBERS == [1, 2]
+    assert WarmConfig.TEST_OPTIONAL is None
+    assert WarmConfig.TEST_DEFAULT == "default"
+    assert WarmConfig.last_load_changed_options() == {"TEST_PATH", "TEST_NUMBERS"}
+
+
+def test_saving_snapshot_keeps_the_values_set_and_does_not_notify_subscribers(tmp_path: pathlib.Path) -> None:
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary={"TEST_KEY": "1"})]):
+        TEST_KEY: int = config.Option()
+
+    changes: list[frozenset[str]] = []
+    Config.subscribe(subscriber=lambda config, changed_options: changes.append(changed_options))
+    Config.set_config_value(option="TEST_KEY", value=2)
+
+    Config.save_to_file(file=tmp_path / "snapshot")
+
+    assert Config.TEST_KEY == 2
+    assert changes == [frozenset({"TEST_KEY"})]
+    assert Config.load_from_file(file=tmp_path / "snapshot")
+    assert Config.TEST_KEY == 2
+
+
+def test_config_is_not_loaded_from_snapshot_once_config_sources_change(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config, lazy_load_config=True):
+        TEST_KEY: int = config.Option()
+
+    Config.save_to_file(file=snapshot_file)
+    config.set_environment_variable(key="TEST_KEY", value="2")
+
+    assert not Config.load_from_file(file=snapshot_file)
+    assert not Config.load_from_file(file=tmp_path / "missing")
+
+
+def test_config_is_not_loaded_from_snapshot_once_options_change(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    config.set_environment_variable(key="TEST_KEY", value="1")
+
+    class Config(config.Config):
+        TEST_KEY: int = config.Option()
+
+    Config.save_to_file(file=snapshot_file)
+
+    class ChangedConfig(config.Config, lazy_load_config=True):
+        TEST_KEY: str = config.Option()
+
+    assert not ChangedConfig.load_from_file(file=snapshot_file)
+
+
+class _UnpicklesToKeyError:
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return operator.getitem, ({}, "missing")
+
+
+@pytest.mark.parametrize("snapshot", [b"", b"not a pickle", pickle.dumps(_UnpicklesToKeyError())])
+def test_config_is_not_loaded_from_corrupt_snapshot(tmp_path: pathlib.Path, snapshot: bytes) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    snapshot_file.write_bytes(snapshot)
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary={"TEST_KEY": "1"})]):
+        TEST_KEY: int = config.Option()
+
+    assert not Config.load_from_file(file=snapshot_file)
+    assert Config.TEST_KEY == 1
+
+
+def test_config_with_config_sources_which_cannot_be_fingerprinted_cannot_be_snapshotted(tmp_path: pathlib.Path) -> None:
+    class Config(
+        config.Config, config_sources=[config.RemoteHTTPFile(url="http://127.0.0.1:1")], lazy_load_config=True
+    ):
+        TEST_KEY: int | None = config.Option()
+
+    with pytest.raises(ValueError):
+        Config.save_to_file(file=tmp_path / "snapshot")
+    assert not Config.load_from_file(file=tmp_path / "snapshot")
+
+
+def test_dict_options_are_sourced_from_tables_in_structured_documents(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[test.database]\nhost = "localhost"\nport = 5432\n')
+
+    class Config(config.Config, config_sources=[config.LocalFile(filepath=config_file)]):
+        TEST_DATABASE: dict[str, typing.Any] = config.Option()
+        TEST_DATABASE_PORT: int = config.Option()
+
+    assert Config.TEST_DATABASE == {"host": "localhost", "port": 5432}
+    assert Config.TEST_DATABASE_PORT == 5432
+
+
+def test_dict_options_sourced_from_the_same_table_do_not_share_values(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"TEST": {"DATABASE": {"host": "localhost", "replicas": ["a"]}}}')
+
+    def define_config() -> type[config.Config]:
+        class Config(config.Config, config_sources=[config.LocalFile(filepath=config_file)]):
+            TEST_DATABASE: dict[str, typing.Any] = config.Option()
+
+        return Config
+
+    first, second = define_config(), define_config()
+    assert first.TEST_DATABASE is not second.TEST_DATABASE
+    first.TEST_DATABASE["replicas"].append("b")
+
+    first.reload_config()
+    assert first.TEST_DATABASE == second.TEST_DATABASE == {"host": "localhost", "replicas": ["a"]}
+
+
+def test_dict_options_decode_toml_dates_as_json_documents_would(tmp_path: pathlib.Path) -> None:
+    toml_file = tmp_path / "config.toml"
+    toml_file.write_text("[test.schedule]\nstart = 2024-01-02T03:04:05\n")
+    json_file = tmp_path / "config.json"
+    json_file.write_text('{"TEST": {"SCHEDULE": {"start": "2024-01-02T03:04:05"}}}')
+
+    class TOMLConfig(config.Config, config_sources=[config.LocalFile(filepath=toml_file)]):
+        TEST_SCHEDULE: dict[str, typing.Any] = config.Option()
+
+    class JSONConfig(config.Config, config_sources=[config.LocalFile(filepath=json_file)]):
+        TEST_SCHEDULE: dict[str, typing.Any] = config.Option()
+
+    assert TOMLConfig.TEST_SCHEDULE == JSONConfig.TEST_SCHEDULE == {"start": "2024-01-02T03:04:05"}
@@ -0,0 +1,76 @@
+import pytest
+
+from python_sdk import config
+
+
+class _CountingDictionary(config.StaticDictionary):
+    def __init__(self, dictionary: dict[str, str]) -> None:
+        super().__init__(dictionary=dictionary)
+        self.calls = 0
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        self.calls += 1
+        return super().__call__(prefix=prefix)
+
+
+def test_config_classes_are_registered_in_definition_order() -> None:
+    class FirstConfig(config.Config, config_sources=[config.StaticDictionary(dictionary={})]):
+        TEST_KEY: str | None = config.Option()
+
+    class SecondConfig(config.Config, config_sources=[config.StaticDictionary(dictionary={})]):
+        TEST_KEY: str | None = config.Option()
+
+    configs = config.registered_configs()
+
+    assert config.ConfigSourcesConfig in configs
+    assert configs.index(config.ConfigSourcesConfig) < configs.index(FirstConfig) < configs.index(SecondConfig)
+
+
+def test_reload_all_reads_each_config_source_once() -> None:
+    config_source = _CountingDictionary(dictionary={"APP_ONE_KEY": "1", "APP_TWO_KEY": "2"})
+
+    class FirstConfig(config.Config, option_prefix="APP_ONE_", config_sources=[config_source]):
+        KEY: int = config.Option()
+
+    class SecondConfig(config.Config, option_prefix="APP_TWO_", config_sources=[config_source]):
+        KEY: int = config.Option()
+
+    config_source.calls = 0
+    config_source.dictionary |= {"APP_ONE_KEY": "3", "APP_TWO_KEY": "4"}
+    durations = config.reload_all(configs=[FirstConfig, SecondConfig])
+
+    assert config_source.calls == 1
+    assert (FirstConfig.KEY, SecondConfig.KEY) == (3, 4)
+    assert list(durations) == [FirstConfig, SecondConfig]
+
+
+def test_load_all_only_loads_configs_yet_to_be_loaded() -> None:
+    config_source = _CountingDictionary(dictionary={"TEST_KEY": "1"})
+
+    class LoadedConfig(config.Config, config_sources=[config_source]):
+        TEST_KEY: int = config.Option()
+
+    class LazyConfig(config.Config, config_sources=[config_source], lazy_load_config=True):
+        TEST_KEY: int = config.Option()
+
+    durations = config.load_all(configs=[LoadedConfig, LazyConfig])
+
+    assert list(durations) == [LazyConfig]
+    assert LazyConfig.meta.loaded
+
+
+def test_reload_all_reloads_remaining_configs_when_one_fails() -> None:
+    dictionary = {"TEST_KEY": "1"}
+
+    class FailingConfig(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_KEY: int = config.Option()
+
+    class OtherConfig(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)]):
+        TEST_KEY: str = config.Option()
+
+    dictionary["TEST_KEY"] = "not a number"
+    with pytest.raises(ValueError):
+        config.reload_all(configs=[FailingConfig, OtherConfig])
+
+    assert FailingConfig.TEST_KEY == 1
+    assert OtherConfig.TEST_KEY == "not a number"
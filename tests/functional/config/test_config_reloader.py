@@ -0,0 +1,232 @@
+import pathlib
+import threading
+import time
+import typing
+
+import pytest
+
+from python_sdk import config
+
+
+def _wait_until(condition: typing.Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize("force_polling", [False, True])
+def test_local_file_reloader_reloads_config_when_file_changes(tmp_path: pathlib.Path, force_polling: bool) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("TEST_KEY=1")
+
+    class Config(config.Config, config_sources=[config.LocalFile(filepath=config_file)]):
+        TEST_KEY: str | None = config.Option()
+
+    class UnrelatedConfig(config.Config, config_sources=[config.StaticDictionary(dictionary={})]):
+        TEST_KEY: str | None = config.Option()
+
+    last_loaded_at = Config.last_loaded_at()
+    unrelated_last_loaded_at = UnrelatedConfig.last_loaded_at()
+
+    with config.LocalFileReloader(
+        configs=[Config, UnrelatedConfig], poll_interval=0.05, debounce_interval=0.05, force_polling=force_polling
+    ):
+        config_file.write_text("TEST_KEY=2")
+        assert _wait_until(lambda: Config.last_loaded_at() != last_loaded_at)
+
+    assert Config.TEST_KEY == "2"
+
+    assert UnrelatedConfig.last_loaded_at() == unrelated_last_loaded_at
+
+
+@pytest.mark.parametrize("force_polling", [False, True])
+def test_local_file_reloader_coalesces_bursts_of_writes(tmp_path: pathlib.Path, force_polling: bool) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("TEST_KEY=0")
+
+    reloads = []
+
+    class Config(config.Config, config_sources=[config.LocalFile(filepath=config_file)]):
+        TEST_KEY: str | None = config.Option()
+
+        @classmethod
+        def post_load_hook(cls) -> None:
+            reloads.append(cls.last_loaded_at())
+
+    reloads.clear()
+    with config.LocalFileReloader(
+        configs=[Config], poll_interval=0.05, debounce_interval=0.5, force_polling=force_polling
+    ):
+        for i in range(5):
+            config_file.write_text(f"TEST_KEY={i}")
+            time.sleep(0.02)
+        assert _wait_until(lambda: len(reloads) > 0)
+        time.sleep(0.6)
+
+    assert len(reloads) == 1
+
+
+def test_local_file_reloader_reads_changed_file_once_for_all_configs(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("TEST_ONE_KEY=1\nTEST_TWO_KEY=1")
+
+    class ConfigOne(config.Config, option_prefix="TEST_ONE_", config_sources=[config.LocalFile(filepath=config_file)]):
+        KEY: int = config.Option()
+
+    class ConfigTwo(config.Config, option_prefix="TEST_TWO_", config_sources=[config.LocalFile(filepath=config_file)]):
+        KEY: int = config.Option()
+
+    reads = []
+    read = config.LocalFile.__call__
+
+    def counting_read(self: config.LocalFile, prefix: str) -> dict[str, str]:
+        reads.append(prefix)
+        return read(self, prefix=prefix)
+
+    monkeypatch.setattr(config.LocalFile, "__call__", counting_read)
+
+    with config.LocalFileReloader(configs=[ConfigOne, ConfigTwo], poll_interval=0.05, debounce_interval=0.05):
+        config_file.write_text("TEST_ONE_KEY=2\nTEST_TWO_KEY=2")
+        assert _wait_until(lambda: ConfigOne.KEY == ConfigTwo.KEY == 2)
+
+    assert reads == [""]
+
+
+class _RemoteConfigSource:
+    """Stands in for a remote config source, which can be made to fail or to hang."""
+
+    name: str = "Remote"
+    description: str = "Stands in for a remote config source."
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+        self.failing = False
+        self.blocking = False
+        self.released = threading.Event()
+        self.reads = 0
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        self.reads += 1
+        value = self.value
+        if self.blocking:
+            self.released.wait()
+        if self.failing:
+            raise ConnectionError("Could not connect.")
+        return {"TEST_KEY": value}
+
+
+def _define_remote_config(config_source: _RemoteConfigSource) -> type[config.Config]:
+    class Config(config.Config, config_sources=[config_source]):
+        TEST_KEY: str = config.Option()
+
+    return Config
+
+
+def test_periodic_reloader_refreshes_configs() -> None:
+    config_source = _RemoteConfigSource(value="1")
+    Config = _define_remote_config(config_source=config_source)
+
+    with config.PeriodicReloader(configs=[Config], interval=0.05):
+        config_source.value = "2"
+        assert _wait_until(lambda: Config.TEST_KEY == "2")
+
+
+def test_periodic_reloader_serves_last_good_values_and_backs_off_while_refreshes_fail() -> None:
+    config_source = _RemoteConfigSource(value="1")
+    Config = _define_remote_config(config_source=config_source)
+    reloader = config.PeriodicReloader(configs=[Config], interval=0.02, jitter=0, max_backoff_interval=0.16)
+
+    with reloader:
+        config_source.failing = True
+        reads_before_failing = config_source.reads
+        time.sleep(0.5)
+        reads_while_failing = config_source.reads - reads_before_failing
+        assert reloader.consecutive_failures(config=Config) >= 3
+        assert Config.TEST_KEY == "1"
+
+        config_source.value = "2"
+        config_source.failing = False
+        assert _wait_until(lambda: reloader.consecutive_failures(config=Config) == 0)
+
+    assert Config.TEST_KEY == "2"
+    # Backing off 0.04, 0.08, then 0.16s between failed refreshes, rather than refreshing every 0.02s, 25 times.
+    assert reads_while_failing <= 8
+
+
+def test_refresh_does_not_block_readers_or_writers_of_the_config() -> None:
+    config_source = _RemoteConfigSource(value="1")
+    Config = _define_remote_config(config_source=config_source)
+    config_source.value = "2"
+    config_source.blocking = True
+
+    refresh = threading.Thread(target=Config.refresh_config)
+    refresh.start()
+    try:
+        assert _wait_until(lambda: config_source.reads == 2)
+        assert Config.TEST_KEY == "1"
+        assert Config.get_config_option(option="TEST_KEY").value == "1"
+        Config.set_config_value(option="TEST_KEY", value="set")
+    finally:
+        config_source.released.set()
+        refresh.join()
+
+    assert Config.TEST_KEY == "2"
+
+
+def test_refresh_is_not_applied_over_a_load_which_happened_while_refreshing() -> None:
+    config_source = _RemoteConfigSource(value="1")
+    Config = _define_remote_config(config_source=config_source)
+    config_source.value = "2"
+    config_source.blocking = True
+    refreshed = []
+
+    refresh = threading.Thread(target=lambda: refreshed.append(Config.refresh_config()))
+    refresh.start()
+    try:
+        assert _wait_until(lambda: config_source.reads == 2)
+        config_source.blocking = False
+        config_source.value = "3"
+        Config.reload_config()
+    finally:
+        config_source.released.set()
+        refresh.join()
+
+    assert refreshed == [False]
+    assert Config.TEST_KEY == "3"
+
+
+def test_refresh_is_not_applied_over_a_load_which_happened_within_the_resolution_of_the_clock() -> None:
+    config_source = _RemoteConfigSource(value="1")
+    Config = _define_remote_config(config_source=config_source)
+    last_loaded_at = Config.last_loaded_at()
+    config_source.value = "2"
+    config_source.blocking = True
+    refreshed = []
+
+    refresh = threading.Thread(target=lambda: refreshed.append(Config.refresh_config()))
+    refresh.start()
+    try:
+        assert _wait_until(lambda: config_source.reads == 2)
+        config_source.blocking = False
+        config_source.value = "3"
+        Config.reload_config()
+        # As if the clock had not ticked since the refresh started, as on Windows, where it ticks every 15ms or so.
+        Config.meta.last_loaded_at = last_loaded_at
+    finally:
+        config_source.released.set()
+        refresh.join()
+
+    assert refreshed == [False]
+    assert Config.TEST_KEY == "3"
+
+
+def test_periodic_reloader_rejects_invalid_intervals() -> None:
+    with pytest.raises(ValueError):
+        config.PeriodicReloader(configs=[], interval=0)
+    with pytest.raises(ValueError):
+        config.PeriodicReloader(configs=[], jitter=1)
@@ -0,0 +1,167 @@
+import io
+import pathlib
+import threading
+import typing
+
+import pytest
+
+from python_sdk import config
+from python_sdk import secrets
+from python_sdk.config import _config_state
+
+
+class _FakeSecretsEngine:
+    TYPE: str = "TEST_ENGINE"
+    MAX_BATCH_SIZE: int = 2
+    secrets: typing.ClassVar[dict[str, bytes]] = {}
+    requested_batches: typing.ClassVar[list[list[str]]] = []
+    _lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    def autocomplete_key(self, key: str) -> list[str]:
+        return [k for k in self.secrets if k.startswith(key)]
+
+    def get_secret_value(self, key: str) -> typing.IO[bytes]:
+        return self.get_secret_values(keys=[key])[key]
+
+    def get_secret_values(self, keys: list[str]) -> dict[str, typing.IO[bytes]]:
+        with self._lock:
+            self.requested_batches.append(keys)
+        if missing := [key for key in keys if key not in self.secrets]:
+            raise secrets.DoesNotExist(missing)
+        return {key: io.BytesIO(self.secrets[key]) for key in keys}
+
+    def set_secret_value(self, key: str, value: typing.IO[bytes]) -> None:
+        self.secrets[key] = value.read()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def fake_secrets_engine() -> typing.Generator[None, None, None]:
+    secrets.register_implementation(type=_FakeSecretsEngine.TYPE, implementation=_FakeSecretsEngine)
+    _FakeSecretsEngine.secrets = {f"key_{i}": f"secret_{i}".encode() for i in range(5)}
+    _FakeSecretsEngine.requested_batches = []
+    yield
+
+
+def _define_config(dictionary: dict[str, str]) -> type[config.Config]:
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary=dictionary)], lazy_load_config=True):
+        TEST_KEY_0: str = config.Option()
+        TEST_KEY_1: str | None = config.Option()
+        TEST_KEY_2: int = config.Option(default=0)
+
+    return Config
+
+
+def test_secret_references_are_resolved_in_batches() -> None:
+    Config = _define_config(
+        dictionary={
+            "TEST_KEY_0": "secret:TEST_ENGINE:key_0",
+            "TEST_KEY_1": "secret:TEST_ENGINE:key_1",
+            "TEST_KEY_2": "secret:TEST_ENGINE:key_2",
+        }
+    )
+    _FakeSecretsEngine.secrets["key_2"] = b"2"
+
+    assert Config.TEST_KEY_0 == "secret_0"
+    assert Config.TEST_KEY_1 == "secret_1"
+    assert Config.TEST_KEY_2 == 2
+    assert sorted(key for batch in _FakeSecretsEngine.requested_batches for key in batch) == ["key_0", "key_1", "key_2"]
+    assert len(_FakeSecretsEngine.requested_batches) == 2
+
+
+def test_values_which_are_not_secret_references_are_left_as_they_are() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "plain", "TEST_KEY_1": "secrets:TEST_ENGINE:key_1"})
+
+    assert Config.TEST_KEY_0 == "plain"
+    assert Config.TEST_KEY_1 == "secrets:TEST_ENGINE:key_1"
+    assert _FakeSecretsEngine.requested_batches == []
+
+
+def test_secret_references_are_resolved_once_per_load_session() -> None:
+    dictionary = {"TEST_KEY_0": "secret:TEST_ENGINE:key_0", "TEST_KEY_1": "secret:TEST_ENGINE:key_1"}
+    configs = [_define_config(dictionary=dictionary) for _ in range(3)]
+
+    with config.load_session():
+        for cls in configs:
+            cls.reload_config()
+
+    assert all(cls.TEST_KEY_0 == "secret_0" for cls in configs)
+    assert len(_FakeSecretsEngine.requested_batches) == 1
+
+
+def test_secret_references_are_resolved_again_on_reload() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:TEST_ENGINE:key_0"})
+    assert Config.TEST_KEY_0 == "secret_0"
+
+    _FakeSecretsEngine.secrets["key_0"] = b"rotated"
+    Config.reload_config()
+
+    assert Config.TEST_KEY_0 == "rotated"
+
+
+async def test_secret_references_are_resolved_on_async_load() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:TEST_ENGINE:key_0"})
+
+    await Config.aload()
+
+    assert Config.TEST_KEY_0 == "secret_0"
+
+
+def test_hardcoded_options_are_not_resolved() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:TEST_ENGINE:key_0"})
+    Config.hardcode_config_value(option="TEST_KEY_0", value="hardcoded")
+    _FakeSecretsEngine.requested_batches.clear()
+
+    Config.reload_config()
+
+    assert Config.TEST_KEY_0 == "hardcoded"
+    assert _FakeSecretsEngine.requested_batches == []
+
+
+def test_reference_to_missing_secret_raises() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:TEST_ENGINE:missing"})
+
+    with pytest.raises(ValueError):
+        Config.reload_config()
+
+
+def test_reference_to_missing_secrets_engine_raises() -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:MISSING_ENGINE:key_0"})
+
+    with pytest.raises(ValueError):
+        Config.reload_config()
+
+
+def test_reloading_many_configs_resolves_their_secret_references_together() -> None:
+    configs = [
+        _define_config(dictionary={f"TEST_KEY_{j}": f"secret:TEST_ENGINE:key_{i + j}" for j in range(2)})
+        for i in range(3)
+    ]
+
+    config.reload_all(configs=configs)
+
+    assert [cls.TEST_KEY_1 for cls in configs] == ["secret_1", "secret_2", "secret_3"]
+    assert sorted(len(batch) for batch in _FakeSecretsEngine.requested_batches) == [2, 2]
+
+
+def test_configs_holding_secret_values_are_not_snapshotted(tmp_path: pathlib.Path) -> None:
+    Config = _define_config(dictionary={"TEST_KEY_0": "secret:TEST_ENGINE:key_0", "TEST_KEY_2": "2"})
+
+    with pytest.raises(ValueError):
+        Config.save_to_file(file=tmp_path / "snapshot")
+
+    assert Config.TEST_KEY_0 == "secret_0"
+    assert not (tmp_path / "snapshot").exists()
+
+
+def test_configs_holding_secret_values_are_not_exported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_config_state, "_IMPORTED_STATES", None)
+    dictionary = {"TEST_KEY_0": "secret:TEST_ENGINE:key_0", "TEST_KEY_2": "2"}
+    parent = _define_config(dictionary=dictionary)
+    assert parent.TEST_KEY_0 == "secret_0"
+
+    state = config.export_state(configs=[parent])
+    config.import_state(state=state)
+    _FakeSecretsEngine.secrets["key_0"] = b"rotated"
+
+    assert b"secret_0" not in state
+    assert _define_config(dictionary=dictionary).TEST_KEY_0 == "rotated"
@@ -0,0 +1,429 @@
+import contextlib
+import hashlib
+import http.server
+import io
+import pathlib
+import threading
+import typing
+import uuid
+
+import botocore.exceptions  # type: ignore
+import botocore.response  # type: ignore
+import pytest
+
+from python_sdk import config
+from python_sdk.config import _config_load_session
+from python_sdk.config import _config_sources
+
+
+class _ConfigDocumentHandler(http.server.BaseHTTPRequestHandler):
+    document: bytes = b"TEST_KEY=1"
+    etag: str = '"1"'
+    requests: list[dict[str, str]] = []
+
+    def do_GET(self) -> None:
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.document)))
+        self.end_headers()
+        self.wfile.write(self.document)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture(scope="function")
+def config_server() -> typing.Generator[tuple[str, type[_ConfigDocumentHandler]], None, None]:
+    handler = type("Handler", (_ConfigDocumentHandler,), {"requests": []})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/config", handler
+    server.shutdown()
+    server.server_close()
+
+
+def test_environment_variables_are_filtered_by_prefix_preserving_case(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TEST_ENVIRONMENT_KEY", "1")
+    monkeypatch.setenv("TEST_ENVIRONMENT_key_2", "2")
+    monkeypatch.setenv("TEST_ENVIRONMENTAL_KEY", "3")
+    config.invalidate_environment_variables()
+
+    assert config.EnvironmentVariables()(prefix="test_environment_") == {
+        "TEST_ENVIRONMENT_KEY": "1",
+        "TEST_ENVIRONMENT_key_2": "2",
+    }
+
+
+def test_environment_variables_pick_up_changes_made_through_python_sdk() -> None:
+    source = config.EnvironmentVariables()
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="1")
+    fingerprint = source.fingerprint(prefix="TEST_ENVIRONMENT_")
+    assert source(prefix="TEST_ENVIRONMENT_") == {"TEST_ENVIRONMENT_KEY": "1"}
+
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="2")
+    assert source(prefix="TEST_ENVIRONMENT_") == {"TEST_ENVIRONMENT_KEY": "2"}
+    assert source.fingerprint(prefix="TEST_ENVIRONMENT_") != fingerprint
+
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value=None)
+    assert source(prefix="TEST_ENVIRONMENT_") == {}
+
+
+def test_environment_variables_pick_up_changes_made_through_os_environ_once_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = config.EnvironmentVariables()
+    monkeypatch.setenv("TEST_ENVIRONMENT_KEY", "1")
+    config.invalidate_environment_variables()
+    assert source(prefix="TEST_ENVIRONMENT_") == {"TEST_ENVIRONMENT_KEY": "1"}
+
+    monkeypatch.setenv("TEST_ENVIRONMENT_KEY", "2")
+    assert source(prefix="TEST_ENVIRONMENT_") == {"TEST_ENVIRONMENT_KEY": "1"}
+    config.invalidate_environment_variables()
+    assert source(prefix="TEST_ENVIRONMENT_") == {"TEST_ENVIRONMENT_KEY": "2"}
+
+
+def test_environment_variables_are_not_read_whole_again_by_repeated_loads(monkeypatch: pytest.MonkeyPatch) -> None:
+    indexed = []
+
+    class _CountingPrefixIndex(_config_load_session.PrefixIndex):
+        def __init__(self, configuration: typing.Mapping[str, str], preserve_case: bool = False) -> None:
+            indexed.append(configuration)
+            super().__init__(configuration=configuration, preserve_case=preserve_case)
+
+    monkeypatch.setattr(_config_load_session, "PrefixIndex", _CountingPrefixIndex)
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="1")
+
+    class Config(config.Config, option_prefix="TEST_ENVIRONMENT_", config_sources=[config.EnvironmentVariables()]):
+        KEY: int = config.Option()
+
+    Config.reload_config()
+    Config.refresh_config()
+    assert len(indexed) == 1
+
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="2")
+    Config.reload_config()
+    Config.reload_config()
+    assert len(indexed) == 2
+    assert Config.KEY == 2
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value=None)
+
+
+def test_environment_variables_are_read_once_per_load_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = config.EnvironmentVariables()
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="1")
+
+    with config.load_session():
+
+        class Config(config.Config, option_prefix="TEST_ENVIRONMENT_", config_sources=[source]):
+            KEY: int = config.Option()
+
+        config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value="2")
+        fingerprint = source.fingerprint(prefix="TEST_ENVIRONMENT_")
+        Config.reload_config()
+        assert Config.KEY == 1
+
+    assert source.fingerprint(prefix="TEST_ENVIRONMENT_") != fingerprint
+    Config.reload_config()
+    assert Config.KEY == 2
+    config.set_environment_variable(key="TEST_ENVIRONMENT_KEY", value=None)
+
+
+def test_file_object_parses_document() -> None:
+    document = "# Comment\n\nTEST_ONE=1\r\nTEST_TWO=a=b\nOTHER_ONE=2\n"
+
+    assert config.FileObject(file=io.StringIO(document))(prefix="test_") == {"TEST_ONE": "1", "TEST_TWO": "a=b"}
+    assert config.FileObject(file=document.encode())(prefix="test_") == {"TEST_ONE": "1", "TEST_TWO": "a=b"}
+    assert config.FileObject(file=memoryview(document.encode()))(prefix="") == {
+        "TEST_ONE": "1",
+        "TEST_TWO": "a=b",
+        "OTHER_ONE": "2",
+    }
+
+
+def test_file_object_does_not_parse_lines_outside_of_prefix() -> None:
+    document = "TEST_ONE=1\nmalformed line\n"
+
+    assert config.FileObject(file=io.StringIO(document))(prefix="TEST_") == {"TEST_ONE": "1"}
+    assert config.FileObject(file=document.encode())(prefix="TEST_") == {"TEST_ONE": "1"}
+    with pytest.raises(ValueError):
+        config.FileObject(file=document.encode())(prefix="")
+
+
+def test_local_file_is_parsed_and_filtered_by_prefix(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("# Comment\nTEST_ONE=1\nOTHER_ONE=2\n")
+
+    assert config.LocalFile(filepath=config_file)(prefix="TEST_") == {"TEST_ONE": "1"}
+
+
+def test_empty_local_file_is_parsed(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("")
+
+    assert config.LocalFile(filepath=config_file)(prefix="") == {}
+
+
+def test_malformed_local_file_raises(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("TEST_ONE")
+
+    with pytest.raises(ValueError):
+        config.LocalFile(filepath=config_file)(prefix="")
+
+
+def test_json_local_file_maps_nested_tables_to_prefixes(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"TEST": {"ONE": 1, "TWO": [1.5, 2.5], "THREE": true, "FOUR": null}, "OTHER": "2"}')
+
+    assert config.LocalFile(filepath=config_file)(prefix="TEST_") == {
+        "test_one": "1",
+        "test_two": "1.5,2.5",
+        "test_three": "true",
+    }
+
+
+def test_toml_local_file_maps_nested_tables_to_prefixes(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[test]\none = 1\n\n[test.db]\nuser = "admin"\n\n[other]\none = 2\n')
+
+    assert config.LocalFile(filepath=config_file)(prefix="TEST_") == {
+        "test_one": "1",
+        "test_db": '{"user": "admin"}',
+        "test_db_user": "admin",
+    }
+
+
+def test_local_file_document_format_overrides_extension(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text('{"TEST_ONE": "1"}')
+
+    assert config.LocalFile(filepath=config_file, document_format="JSON")(prefix="TEST_") == {"test_one": "1"}
+
+
+def test_structured_local_file_is_only_parsed_again_once_changed(tmp_path: pathlib.Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"TEST_ONE": "1"}')
+
+    first = config.LocalFile(filepath=config_file)(prefix="")
+    second = config.LocalFile(filepath=config_file)(prefix="")
+    assert first["test_one"] is second["test_one"]
+
+    config_file.write_text('{"TEST_ONE": "22"}')
+    assert config.LocalFile(filepath=config_file)(prefix="") == {"test_one": "22"}
+
+
+@pytest.mark.parametrize("document", ["[1, 2]", "{", '{"TEST_ONE": }'])
+def test_malformed_json_local_file_raises(tmp_path: pathlib.Path, document: str) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(document)
+
+    with pytest.raises(ValueError):
+        config.LocalFile(filepath=config_file)(prefix="")
+
+
+def test_remote_http_file_sends_authorization_and_user_agent_headers(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+
+    config.RemoteHTTPFile(url=url, authorization_header="Bearer token", user_agent_string="test-agent")(prefix="")
+
+    assert handler.requests[0]["Authorization"] == "Bearer token"
+    assert handler.requests[0]["User-Agent"] == "test-agent"
+
+
+def test_remote_http_file_is_fetched_once_for_many_configs(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+
+    for _ in range(10):
+        assert config.RemoteHTTPFile(url=url, max_age=60)(prefix="") == {"TEST_KEY": "1"}
+
+    assert len(handler.requests) == 1
+
+
+def test_remote_http_file_is_not_shared_between_differently_authorized_instances(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+
+    config.RemoteHTTPFile(url=url, authorization_header="Bearer token", max_age=60)(prefix="")
+    config.RemoteHTTPFile(url=url, max_age=60)(prefix="")
+    config.RemoteHTTPFile(url=url, authorization_header="Bearer other", max_age=60)(prefix="")
+
+    assert [request.get("Authorization") for request in handler.requests] == ["Bearer token", None, "Bearer other"]
+
+
+def test_remote_http_file_is_not_shared_within_load_session_between_instances_with_different_user_agents(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+
+    with config.load_session():
+        for user_agent_string in ["test-agent", "other-agent"]:
+
+            class Config(
+                config.Config, config_sources=[config.RemoteHTTPFile(url=url, user_agent_string=user_agent_string)]
+            ):
+                TEST_KEY: int = config.Option()
+
+    assert config.RemoteHTTPFile(url=url) != config.RemoteHTTPFile(url=url, user_agent_string="test-agent")
+    assert [request["User-Agent"] for request in handler.requests] == ["test-agent", "other-agent"]
+
+
+def test_remote_http_file_revalidates_with_etag_once_stale(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+
+    config.RemoteHTTPFile(url=url, max_age=0)(prefix="")
+    assert config.RemoteHTTPFile(url=url, max_age=0)(prefix="") == {"TEST_KEY": "1"}
+
+    assert len(handler.requests) == 2
+    assert "If-None-Match" not in handler.requests[0]
+    assert handler.requests[1]["If-None-Match"] == handler.etag
+
+
+def test_remote_http_file_parses_json_document_by_url_extension(
+    config_server: tuple[str, type[_ConfigDocumentHandler]],
+) -> None:
+    url, handler = config_server
+    handler.document = b'{"TEST": {"KEY": 1}}'
+
+    assert config.RemoteHTTPFile(url=f"{url}.json", max_age=60)(prefix="TEST_") == {"test_key": "1"}
+
+
+class _FakeS3Client:
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.downloads = 0
+        self.bodies: list[io.BytesIO] = []
+
+    def get_object(self, Bucket: str, Key: str, IfNoneMatch: str | None = None) -> dict[str, typing.Any]:
+        if (Bucket, Key) not in self.objects:
+            raise botocore.exceptions.ClientError({"Error": {"Code": "NoSuchKey", "Message": ""}}, "GetObject")
+        body = self.objects[(Bucket, Key)]
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if IfNoneMatch == etag:
+            raise botocore.exceptions.ClientError({"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject")
+        self.downloads += 1
+        self.bodies.append(io.BytesIO(body))
+        return {"Body": botocore.response.StreamingBody(self.bodies[-1], len(body)), "ETag": etag}
+
+
+class _FakeSecretsManagerClient:
+    def __init__(self) -> None:
+        self.secrets: dict[str, tuple[str, str]] = {}
+
+    def get_secret_value(self, SecretId: str) -> dict[str, typing.Any]:
+        if SecretId not in self.secrets:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": ""}}, "GetSecretValue"
+            )
+        secret, version = self.secrets[SecretId]
+        return {"SecretString": secret, "VersionId": version}
+
+
+class _FakeSSMClient:
+    def __init__(self) -> None:
+        self.parameters: dict[str, tuple[str, int]] = {}
+
+    def get_parameter(self, Name: str, WithDecryption: bool) -> dict[str, typing.Any]:
+        if Name not in self.parameters:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "ParameterNotFound", "Message": ""}}, "GetParameter"
+            )
+        value, version = self.parameters[Name]
+        return {"Parameter": {"Name": Name, "Value": value, "Version": version}}
+
+
+@pytest.fixture(scope="function")
+def parse_count(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    count = [0]
+    parse = _config_sources._parse_key_value_lines
+
+    def counting_parse(*args: typing.Any, **kwargs: typing.Any) -> dict[str, str]:
+        count[0] += 1
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(_config_sources, "_parse_key_value_lines", counting_parse)
+    return count
+
+
+def test_s3_file_is_parsed_and_filtered_by_prefix() -> None:
+    client = _FakeS3Client()
+    client.objects[("bucket", "config")] = b"APP_ONE=1\nAPP_TWO=2\n\nDB_ONE=3\n"
+
+    assert config.S3File(url="s3://bucket/config", client=client)(prefix="APP_") == {"APP_ONE": "1", "APP_TWO": "2"}
+
+
+def test_s3_file_is_not_downloaded_again_when_unchanged() -> None:
+    client = _FakeS3Client()
+    client.objects[("bucket", "config")] = b"APP_ONE=1"
+    source = config.S3File(url="s3://bucket/config", client=client)
+
+    source(prefix="")
+    assert source(prefix="") == {"APP_ONE": "1"}
+    assert client.downloads == 1
+
+    client.objects[("bucket", "config")] = b"APP_ONE=2"
+    assert source(prefix="") == {"APP_ONE": "2"}
+    assert client.downloads == 2
+
+
+@pytest.mark.parametrize("document", [b"APP_ONE=1", b"APP_ONE"])
+def test_s3_file_body_is_closed_once_read(document: bytes) -> None:
+    client = _FakeS3Client()
+    client.objects[("bucket", "config")] = document
+
+    with contextlib.suppress(ValueError):
+        config.S3File(url="s3://bucket/config", client=client)(prefix="")
+
+    assert client.bodies and all(body.closed for body in client.bodies)
+
+
+def test_s3_file_that_does_not_exist_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        config.S3File(url="s3://bucket/config", client=_FakeS3Client())(prefix="")
+
+
+def test_aws_secrets_manager_secret_is_only_parsed_again_when_version_changes(parse_count: list[int]) -> None:
+    client = _FakeSecretsManagerClient()
+    secret_id = str(uuid.uuid4())
+    client.secrets[secret_id] = ("APP_ONE=1\nDB_ONE=2", "1")
+    source = config.AWSSecretsManagerSecret(secret_id=secret_id, client=client)
+
+    assert source(prefix="APP_") == {"APP_ONE": "1"}
+    assert source(prefix="APP_") == {"APP_ONE": "1"}
+    assert parse_count[0] == 1
+
+    client.secrets[secret_id] = ("APP_ONE=3", "2")
+    assert source(prefix="APP_") == {"APP_ONE": "3"}
+    assert parse_count[0] == 2
+
+
+def test_aws_parameter_store_document_is_only_parsed_again_when_version_changes(parse_count: list[int]) -> None:
+    client = _FakeSSMClient()
+    name = str(uuid.uuid4())
+    client.parameters[name] = ("APP_ONE=1\nDB_ONE=2", 1)
+    source = config.AWSParameterStoreDocument(parameter_name=name, client=client)
+
+    assert source(prefix="APP_") == {"APP_ONE": "1"}
+    assert source(prefix="APP_") == {"APP_ONE": "1"}
+    assert parse_count[0] == 1
+
+    client.parameters[name] = ("APP_ONE=3", 2)
+    assert source(prefix="APP_") == {"APP_ONE": "3"}
+    assert parse_count[0] == 2
+
+
+def test_aws_parameter_store_document_that_does_not_exist_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        config.AWSParameterStoreDocument(parameter_name="missing", client=_FakeSSMClient())(prefix="")
@@ -0,0 +1,172 @@
+import concurrent.futures
+import multiprocessing
+import os
+import pathlib
+import typing
+
+import pytest
+
+from python_sdk import config
+from python_sdk.config import _config_state
+
+
+class _ProcessIDConfigSource:
+    name: str = "Process ID"
+    description: str = "Sources the ID of the process reading it, to tell which process loaded a config."
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        return {"TEST_PROCESS_ID": str(os.getpid())}
+
+
+class _SharedConfig(config.Config, config_sources=[_ProcessIDConfigSource()], lazy_load_config=True):
+    TEST_PROCESS_ID: int = config.Option()
+
+
+class _RemoteDictionary:
+    name: str = "Remote Dictionary"
+    description: str = "Sources configuration from a dictionary, standing in for a config source with no fingerprint."
+
+    def __init__(self, dictionary: dict[str, str]) -> None:
+        self.dictionary = dictionary
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        return self.dictionary
+
+
+def _read_shared_config() -> int:
+    return _SharedConfig.TEST_PROCESS_ID
+
+
+@pytest.fixture(scope="function", autouse=True)
+def imported_states(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_config_state, "_IMPORTED_STATES", None)
+
+
+def _define_config(dictionary: dict[str, str], **kwargs: typing.Any) -> type[config.Config]:
+    class Config(config.Config, config_sources=[_RemoteDictionary(dictionary=dictionary)], **kwargs):
+        TEST_KEY: str = config.Option()
+        TEST_HARDCODED: str = config.Option(default="default")
+
+    return Config
+
+
+def test_config_defined_after_importing_state_is_restored_rather_than_loaded() -> None:
+    parent = _define_config(dictionary={"TEST_KEY": "parent"})
+    parent.hardcode_config_value(option="TEST_HARDCODED", value="hardcoded")
+    last_loaded_at = parent.meta.last_loaded_at
+
+    config.import_state(state=config.export_state(configs=[parent]))
+    child = _define_config(dictionary={"TEST_KEY": "child"})
+
+    assert child.TEST_KEY == "parent"
+    assert child.TEST_HARDCODED == "hardcoded"
+    assert child.get_config_option(option="TEST_HARDCODED").hardcoded
+    assert child.meta.last_loaded_at == last_loaded_at
+
+
+def test_config_defined_before_importing_state_is_restored() -> None:
+    state = config.export_state(configs=[_define_config(dictionary={"TEST_KEY": "parent"})])
+    child = _define_config(dictionary={"TEST_KEY": "child"})
+
+    config.import_state(state=state)
+
+    assert child.TEST_KEY == "parent"
+
+
+def test_config_with_changed_options_is_loaded_rather_than_restored() -> None:
+    config.import_state(state=config.export_state(configs=[_define_config(dictionary={"TEST_KEY": "parent"})]))
+
+    class Config(config.Config, config_sources=[config.StaticDictionary(dictionary={"TEST_KEY": "child"})]):
+        TEST_KEY: str = config.Option()
+
+    assert Config.TEST_KEY == "child"
+
+
+def test_config_with_changed_config_sources_is_loaded_rather_than_restored(monkeypatch: pytest.MonkeyPatch) -> None:
+    def define_config() -> type[config.Config]:
+        class Config(config.Config, config_sources=[config.EnvironmentVariables()], option_prefix="TEST_STATE_"):
+            LEVEL: str = config.Option()
+
+        return Config
+
+    monkeypatch.setenv("TEST_STATE_LEVEL", "INFO")
+    config.invalidate_environment_variables()
+    state = config.export_state(configs=[define_config()])
+    monkeypatch.setenv("TEST_STATE_LEVEL", "DEBUG")
+    config.invalidate_environment_variables()
+    config.import_state(state=state)
+
+    assert define_config().LEVEL == "DEBUG"
+
+
+def test_configs_yet_to_be_loaded_are_not_exported() -> None:
+    lazy = _define_config(dictionary={"TEST_KEY": "parent"}, lazy_load_config=True)
+
+    config.import_state(state=config.export_state(configs=[lazy]))
+
+    assert _define_config(dictionary={"TEST_KEY": "child"}).TEST_KEY == "child"
+
+
+def test_importing_malformed_state_raises() -> None:
+    with pytest.raises(ValueError):
+        config.import_state(state=b"not a pickle")
+
+
+def test_spawned_processes_restore_state_shared_through_state_file(tmp_path: pathlib.Path) -> None:
+    parent_process_id = _read_shared_config()
+
+    with (
+        config.share_state_with_child_processes(file=tmp_path / "state"),
+        concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor,
+    ):
+        assert executor.submit(_read_shared_config).result(timeout=60) == parent_process_id
+
+
+def test_state_file_is_only_shared_within_context(tmp_path: pathlib.Path) -> None:
+    _read_shared_config()
+
+    with config.share_state_with_child_processes(file=tmp_path / "state"):
+        assert os.environ[config.STATE_FILE_ENVIRONMENT_VARIABLE] == str(tmp_path / "state")
+    assert config.STATE_FILE_ENVIRONMENT_VARIABLE not in os.environ
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        assert executor.submit(_read_shared_config).result(timeout=60) != os.getpid()
+
+
+def test_state_file_is_taken_out_of_the_environment_once_read(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "state").write_bytes(config.export_state(configs=[_define_config(dictionary={"TEST_KEY": "parent"})]))
+    config.set_environment_variable(key=config.STATE_FILE_ENVIRONMENT_VARIABLE, value=str(tmp_path / "state"))
+    monkeypatch.setattr(_config_state, "_IMPORTED_STATES", None)
+    try:
+        assert config.STATE_FILE_ENVIRONMENT_VARIABLE in os.environ
+        assert _define_config(dictionary={"TEST_KEY": "child"}).TEST_KEY == "parent"
+        assert config.STATE_FILE_ENVIRONMENT_VARIABLE not in os.environ
+    finally:
+        config.set_environment_variable(key=config.STATE_FILE_ENVIRONMENT_VARIABLE, value=None)
+
+
+def test_unreadable_state_file_is_left_in_the_environment(tmp_path: pathlib.Path) -> None:
+    config.set_environment_variable(key=config.STATE_FILE_ENVIRONMENT_VARIABLE, value=str(tmp_path / "missing"))
+    try:
+        assert _define_config(dictionary={"TEST_KEY": "child"}).TEST_KEY == "child"
+        assert os.environ[config.STATE_FILE_ENVIRONMENT_VARIABLE] == str(tmp_path / "missing")
+    finally:
+        config.set_environment_variable(key=config.STATE_FILE_ENVIRONMENT_VARIABLE, value=None)
+
+
+def test_spawned_processes_restore_state_given_to_process_initializer() -> None:
+    parent_process_id = _read_shared_config()
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=config.process_initializer,
+        initargs=(config.export_state(configs=[_SharedConfig]),),
+    ) as executor:
+        assert executor.submit(_read_shared_config).result(timeout=60) == parent_process_id
@@ -1,9 +1,11 @@
 import inspect
 import json
+import logging
 import types
 
 import pytest
 
+from python_sdk import config
 from python_sdk import log
 
 # TODO: Remove log.LogConfig.configure_logging() from all tests
@@ -74,3 +76,23 @@ def test_log_line_number_is_correct(capsys: pytest.CaptureFixture[str]) -> None:
 # def test_log_timestamp_is_rfc3339_compliant(captured_log: dict[str, typing.Any]) -> None:
 #     assert datetime.datetime.strptime(captured_log["timestamp"], '%Y-%m-%dT%H:%M:%S%z')
 #     assert datetime.datetime.strptime(captured_log["timestamp"], '%Y-%m-%dT%H:%M:%S%z').tzinfo is not None
+
+
+def test_log_config_reload_with_only_level_changed_keeps_handlers(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log.info("test")
+    capsys.readouterr()
+    handlers = list(logging.getLogger().handlers)
+
+    monkeypatch.setenv("PYTHON_SDK_LOG_LEVEL", "WARNING")
+    config.invalidate_environment_variables()
+    try:
+        log.LogConfig.reload_config()
+        log.info("test")
+        assert capsys.readouterr().err == ""
+        assert logging.getLogger().handlers == handlers
+    finally:
+        monkeypatch.delenv("PYTHON_SDK_LOG_LEVEL")
+        config.invalidate_environment_variables()
+        log.LogConfig.reload_config()
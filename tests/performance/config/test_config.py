@@ -0,0 +1,315 @@
+import io
+import json
+import os
+import pathlib
+import threading
+import time
+import typing
+
+import pytest
+
+from python_sdk import config
+from python_sdk import secrets
+from python_sdk.config import _config_option
+from python_sdk.config import _config_state
+from tests.performance import conftest
+
+# Benchmarks of each optimisation against the approach it replaced, recorded rather than compared, see
+# `conftest.Benchmark`.
+
+
+class _Config(config.Config):
+    TEST_KEY: str = config.Option(default="test")
+
+
+def _define_config(
+    datatype: typing.Any,
+    names: typing.Iterable[str],
+    option: typing.Callable[[], typing.Any] = config.Option,
+    **kwargs: typing.Any,
+) -> type[config.Config]:
+    names = list(names)
+    cls = type(
+        "_BenchmarkConfig",
+        (config.Config,),
+        {"__annotations__": {name: datatype for name in names}, **{name: option() for name in names}},
+        **kwargs,
+    )
+    return typing.cast(type[config.Config], cls)
+
+
+def _forget_option_values(cls: type[config.Config]) -> None:
+    # So that the next load decodes every value again, as on a cold start, rather than keeping unchanged values.
+    for config_option in cls.meta.options.values():
+        config_option.restore_value(value=_config_option.Unset, encoded_value=_config_option.Unset)
+
+
+def _read_through_config_option(cls: typing.Any, item: str) -> typing.Any:
+    # How option reads were served before loaded configs published their values into a value table.
+    attribute = type.__getattribute__(cls, item)
+    if not isinstance(attribute, _config_option.ConfigOption):
+        return attribute
+    if cls.meta.lazy_load_config and not cls.meta.loaded:
+        cls._load_config()
+        attribute = type.__getattribute__(cls, item)
+    return attribute.value
+
+
+@pytest.mark.parametrize("read_from", ["config_option", "value_table"])
+def test_benchmark_attribute_read_from_value_table(benchmark: conftest.Benchmark, read_from: str) -> None:
+    def read() -> typing.Any:
+        if read_from == "config_option":
+            return _read_through_config_option(cls=_Config, item="TEST_KEY")
+        return _Config.TEST_KEY
+
+    assert read() == "test"
+
+    benchmark(read, number=200_000, read_from=read_from)
+
+
+@pytest.mark.parametrize("within_load_session", [False, True])
+def test_benchmark_reload_many_configs(benchmark: conftest.Benchmark, within_load_session: bool) -> None:
+    environment = {f"UNRELATED_ENVIRONMENT_VARIABLE_{i}": str(i) for i in range(2_000)}
+    config_sources: list[config.ConfigSource] = [config.StaticDictionary(dictionary=environment)]
+    configs = [
+        _define_config(
+            datatype=str,
+            names=["KEY"],
+            option=lambda: config.Option(default="test"),
+            option_prefix=f"APP_{i}_",
+            config_sources=config_sources,
+            lazy_load_config=True,
+        )
+        for i in range(60)
+    ]
+
+    def reload() -> None:
+        if within_load_session:
+            with config.load_session():
+                for cls in configs:
+                    cls.reload_config()
+        else:
+            for cls in configs:
+                cls.reload_config()
+
+    benchmark(reload, number=1, number_of_configs=len(configs), within_load_session=within_load_session)
+
+
+@pytest.mark.parametrize("from_snapshot", [False, True])
+def test_benchmark_load_config_from_snapshot(
+    benchmark: conftest.Benchmark, tmp_path: pathlib.Path, from_snapshot: bool
+) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    dictionary = {f"APP_KEY_{i}": ",".join(str(j) for j in range(20)) for i in range(200)}
+    cls = _define_config(
+        datatype=list[int],
+        names=(f"KEY_{i}" for i in range(200)),
+        option_prefix="APP_",
+        config_sources=[config.StaticDictionary(dictionary=dictionary)],
+        lazy_load_config=True,
+    )
+    cls.save_to_file(file=snapshot_file)
+
+    def load() -> None:
+        _forget_option_values(cls=cls)
+        if from_snapshot:
+            assert cls.load_from_file(file=snapshot_file)
+        else:
+            cls.reload_config()
+
+    load()
+    assert cls.KEY_0 == list(range(20))
+
+    benchmark(load, number=10, number_of_options=200, from_snapshot=from_snapshot)
+
+
+@pytest.mark.parametrize("lazy_decode_options", [False, True])
+def test_benchmark_load_config_and_read_an_option(benchmark: conftest.Benchmark, lazy_decode_options: bool) -> None:
+    dictionary = {f"APP_KEY_{i}": ",".join(str(j) for j in range(20)) for i in range(200)}
+    cls = _define_config(
+        datatype=list[int],
+        names=(f"KEY_{i}" for i in range(200)),
+        option_prefix="APP_",
+        config_sources=[config.StaticDictionary(dictionary=dictionary)],
+        lazy_decode_options=lazy_decode_options,
+    )
+
+    def load_and_read() -> typing.Any:
+        _forget_option_values(cls=cls)
+        cls.reload_config()
+        return cls.KEY_0
+
+    assert load_and_read() == list(range(20))
+
+    benchmark(load_and_read, number=10, number_of_options=200, lazy_decode_options=lazy_decode_options)
+
+
+class _KeysValidator:
+    name: str = "Keys Validator"
+    description: str = "Checks every key of a dict option, as a stand-in for a typical dict validator."
+
+    def __call__(self, config_option_name: str, config_option: typing.Any, config_value: typing.Any) -> None:
+        if not all(key.startswith("key_") for key in config_value):
+            raise config.ConfigValueValidationError(f"{config_option_name} has unexpected keys.")
+
+
+@pytest.mark.parametrize("keep_unchanged_values", [False, True])
+def test_benchmark_reload_unchanged_values(benchmark: conftest.Benchmark, keep_unchanged_values: bool) -> None:
+    dictionary = {f"KEY_{i}": json.dumps({f"key_{j}": j for j in range(200)}) for i in range(50)}
+    cls = _define_config(
+        datatype=dict[str, typing.Any],
+        names=dictionary,
+        option=lambda: config.Option(validators=[_KeysValidator()]),
+        config_sources=[config.StaticDictionary(dictionary=dictionary)],
+    )
+
+    def reload() -> None:
+        if not keep_unchanged_values:
+            _forget_option_values(cls=cls)
+        cls.reload_config()
+
+    reload()
+    assert cls.meta.last_load_timings is not None
+    assert bool(cls.meta.last_load_timings.decode) != keep_unchanged_values
+
+    benchmark(reload, number=20, number_of_options=len(dictionary), keep_unchanged_values=keep_unchanged_values)
+
+
+@pytest.mark.parametrize("from_imported_state", [False, True])
+def test_benchmark_config_class_definition_from_imported_state(
+    benchmark: conftest.Benchmark, from_imported_state: bool
+) -> None:
+    dictionary = {f"APP_KEY_{i}": ",".join(str(j) for j in range(20)) for i in range(200)}
+
+    def define_config() -> type[config.Config]:
+        return _define_config(
+            datatype=list[int],
+            names=(f"KEY_{i}" for i in range(200)),
+            option_prefix="APP_",
+            config_sources=[config.StaticDictionary(dictionary=dictionary)],
+        )
+
+    if from_imported_state:
+        config.import_state(state=config.export_state(configs=[define_config()]))
+    try:
+        benchmark(define_config, number=10, number_of_options=200, from_imported_state=from_imported_state)
+    finally:
+        _config_state._IMPORTED_STATES = None
+
+
+class _SlowSecretsEngine:
+    TYPE: str = "TEST_SLOW_ENGINE"
+    MAX_BATCH_SIZE: int = 10
+    LATENCY_SECONDS: float = 0.005
+
+    def autocomplete_key(self, key: str) -> list[str]:
+        return []
+
+    def get_secret_value(self, key: str) -> typing.IO[bytes]:
+        time.sleep(self.LATENCY_SECONDS)
+        return io.BytesIO(key.encode())
+
+    def get_secret_values(self, keys: list[str]) -> dict[str, typing.IO[bytes]]:
+        time.sleep(self.LATENCY_SECONDS)
+        return {key: io.BytesIO(key.encode()) for key in keys}
+
+    def set_secret_value(self, key: str, value: typing.IO[bytes]) -> None:
+        raise NotImplementedError()
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_benchmark_resolve_secret_references(benchmark: conftest.Benchmark, batched: bool) -> None:
+    secrets.register_implementation(type=_SlowSecretsEngine.TYPE, implementation=_SlowSecretsEngine)
+    dictionary = {f"KEY_{i}": f"secret:{_SlowSecretsEngine.TYPE}:key_{i}" for i in range(25)}
+    cls = _define_config(
+        datatype=str, names=dictionary, config_sources=[config.StaticDictionary(dictionary=dictionary)]
+    )
+
+    def resolve() -> None:
+        if batched:
+            cls.reload_config()
+        else:
+            engine = secrets.secrets_engine(type=_SlowSecretsEngine.TYPE)
+            for reference in dictionary.values():
+                engine.get_secret_value(key=reference.rsplit(":", 1)[1]).read().decode()
+
+    resolve()
+    assert cls.KEY_0 == "key_0"
+
+    benchmark(resolve, number=1, repeat=3, number_of_references=len(dictionary), batched=batched)
+
+
+class _BlockingConfigSource:
+    name: str = "Blocking"
+    description: str = "Stands in for a slow remote config source, blocking reads until released."
+
+    def __init__(self) -> None:
+        self.reading = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self, prefix: str) -> dict[str, str]:
+        self.reading.set()
+        self.released.wait()
+        return {"KEY": "value"}
+
+
+@pytest.mark.parametrize("refresh_in_flight", [False, True])
+def test_benchmark_write_config_during_refresh(benchmark: conftest.Benchmark, refresh_in_flight: bool) -> None:
+    config_source = _BlockingConfigSource()
+    config_source.released.set()
+    cls = _define_config(datatype=str, names=["KEY"], config_sources=[config_source], lazy_load_config=True)
+    cls.reload_config()
+    config_source.reading.clear()
+    config_source.released.clear()
+
+    refresh = threading.Thread(target=cls.refresh_config)
+    if refresh_in_flight:
+        refresh.start()
+        assert config_source.reading.wait(timeout=10)
+    try:
+        benchmark(
+            lambda: cls.set_config_value(option="KEY", value="set"), number=100, refresh_in_flight=refresh_in_flight
+        )
+        assert refresh.is_alive() == refresh_in_flight
+    finally:
+        config_source.released.set()
+        if refresh_in_flight:
+            refresh.join()
+
+
+class _PathConfigValidator:
+    name: str = "Path Config Validator"
+    description: str = "Validates the path option it is given exists, as a stand-in for a typical config validator."
+
+    def __init__(self, option: str) -> None:
+        self.option = option
+
+    def __call__(self, config: type[config.Config]) -> None:
+        os.stat(getattr(config, self.option))
+
+
+class _DependentPathConfigValidator(_PathConfigValidator):
+    def __init__(self, option: str) -> None:
+        super().__init__(option=option)
+        self.depends_on = frozenset({option})
+
+
+@pytest.mark.parametrize("declare_dependencies", [False, True])
+def test_benchmark_set_options_with_config_validators(
+    benchmark: conftest.Benchmark, tmp_path: pathlib.Path, declare_dependencies: bool
+) -> None:
+    names = [f"KEY_{i}" for i in range(50)]
+    validator = _DependentPathConfigValidator if declare_dependencies else _PathConfigValidator
+    cls = _define_config(
+        datatype=pathlib.Path,
+        names=names,
+        option=lambda: config.Option(validators=[config.ValidateDirectoryExists()]),
+        config_sources=[config.StaticDictionary(dictionary={name: str(tmp_path) for name in names})],
+        validators=[validator(option=name) for name in names],
+    )
+
+    def set_options() -> None:
+        for name in names:
+            cls.set_config_value(option=name, value=tmp_path)
+
+    benchmark(set_options, number=5, number_of_options=len(names), declare_dependencies=declare_dependencies)
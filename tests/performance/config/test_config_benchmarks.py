@@ -0,0 +1,138 @@
+import pathlib
+import threading
+import time
+import typing
+
+import pytest
+
+from python_sdk import config
+from python_sdk.config import _string_decoder
+from tests.performance import conftest
+
+# Benchmarks which record how long config operations take, rather than asserting that one approach is faster than
+# another. Results are written to `.test_artifacts/benchmarks.json`, see `conftest.Benchmark`.
+
+# fmt: off
+_DATATYPES_AND_VALUES: list[tuple[typing.Any, str]] = [
+    (str,                                                   "test"),
+    (int,                                                   "1"),
+    (float,                                                 "1.5"),
+    (bool,                                                  "TRUE"),
+    (dict[str, typing.Any],                                 '{"key": "value"}'),
+    (config.Base64EncodedString,                            "dGVzdA=="),
+    (pathlib.Path,                                          "/tmp"),
+    (typing.Literal["DEBUG", "INFO", "WARNING"],            "INFO"),
+    (list[str],                                             "a,b,c"),
+    (list[int],                                             "1,2,3"),
+    (list[float],                                           "1.5,2.5,3.5"),
+    (list[config.Base64EncodedString],                      "dGVzdA==,dGVzdA=="),
+    (list[pathlib.Path],                                    "/tmp,/var"),
+    (list[typing.Literal["DEBUG", "INFO", "WARNING"]],      "INFO,DEBUG"),
+]
+# fmt: on
+
+
+def _define_config(number_of_options: int, **kwargs: typing.Any) -> type[config.Config]:
+    return type(
+        "_BenchmarkConfig",
+        (config.Config,),
+        {
+            "__annotations__": {f"KEY_{i}": str for i in range(number_of_options)},
+            **{f"KEY_{i}": config.Option(default="test") for i in range(number_of_options)},
+        },
+        option_prefix="TEST_",
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("number_of_options", [1, 10, 100])
+def test_benchmark_config_class_definition(benchmark: conftest.Benchmark, number_of_options: int) -> None:
+    benchmark(
+        lambda: _define_config(number_of_options=number_of_options, config_sources=[]),
+        number=50,
+        number_of_options=number_of_options,
+    )
+
+
+@pytest.mark.parametrize("number_of_entries", [10, 1_000, 10_000])
+def test_benchmark_load_config_from_static_dictionary(benchmark: conftest.Benchmark, number_of_entries: int) -> None:
+    dictionary = {f"UNRELATED_KEY_{i}": str(i) for i in range(number_of_entries)}
+    dictionary |= {f"TEST_KEY_{i}": "value" for i in range(10)}
+    cls = _define_config(number_of_options=10, config_sources=[config.StaticDictionary(dictionary=dictionary)])
+
+    benchmark(cls._load_config, number=20, number_of_entries=number_of_entries)
+
+
+@pytest.mark.parametrize("number_of_environment_variables", [10, 1_000, 10_000])
+def test_benchmark_load_config_from_environment_variables(
+    benchmark: conftest.Benchmark, monkeypatch: pytest.MonkeyPatch, number_of_environment_variables: int
+) -> None:
+    for i in range(number_of_environment_variables):
+        monkeypatch.setenv(f"UNRELATED_ENVIRONMENT_VARIABLE_{i}", str(i))
+    for i in range(10):
+        monkeypatch.setenv(f"TEST_KEY_{i}", "value")
+    config.invalidate_environment_variables()
+    cls = _define_config(number_of_options=10, config_sources=[config.EnvironmentVariables()])
+
+    benchmark(cls._load_config, number=20, number_of_environment_variables=number_of_environment_variables)
+
+
+@pytest.mark.parametrize("number_of_lines", [10, 1_000, 100_000])
+def test_benchmark_load_config_from_local_file(
+    benchmark: conftest.Benchmark, tmp_path: pathlib.Path, number_of_lines: int
+) -> None:
+    file = tmp_path / "config.env"
+    lines = [f"UNRELATED_KEY_{i}=value" for i in range(number_of_lines)] + [f"TEST_KEY_{i}=value" for i in range(10)]
+    file.write_text("\n".join(lines))
+    cls = _define_config(number_of_options=10, config_sources=[config.LocalFile(filepath=file)])
+
+    benchmark(cls._load_config, number=5, number_of_lines=number_of_lines)
+
+
+@pytest.mark.parametrize("lazy_load_config", [False, True])
+def test_benchmark_attribute_read(benchmark: conftest.Benchmark, lazy_load_config: bool) -> None:
+    cls = _define_config(number_of_options=10, config_sources=[], lazy_load_config=lazy_load_config)
+    cls.KEY_0
+
+    benchmark(lambda: cls.KEY_0, number=200_000, lazy_load_config=lazy_load_config)
+
+
+@pytest.mark.parametrize(
+    "data_type, value", _DATATYPES_AND_VALUES, ids=[str(data_type) for data_type, _ in _DATATYPES_AND_VALUES]
+)
+def test_benchmark_decode(benchmark: conftest.Benchmark, data_type: typing.Any, value: str) -> None:
+    decoder = _string_decoder.get_string_decoder(data_type=data_type)
+
+    benchmark(lambda: decoder(value), number=20_000, data_type=str(data_type))
+
+
+@pytest.mark.parametrize("number_of_readers", [1, 4])
+def test_benchmark_reload_under_concurrent_readers(benchmark: conftest.Benchmark, number_of_readers: int) -> None:
+    cls = _define_config(
+        number_of_options=10, config_sources=[config.StaticDictionary(dictionary={"TEST_KEY_0": "value"})]
+    )
+    stop = threading.Event()
+    reads = [0] * number_of_readers
+
+    def read(reader: int) -> None:
+        while not stop.is_set():
+            for _ in range(1_000):
+                cls.KEY_0
+            reads[reader] += 1_000
+
+    readers = [threading.Thread(target=read, args=(i,)) for i in range(number_of_readers)]
+    for reader in readers:
+        reader.start()
+    try:
+        started_at = time.perf_counter()
+        reload_seconds = benchmark(
+            cls.reload_config, number=100, operation="reload", number_of_readers=number_of_readers
+        )
+        elapsed = time.perf_counter() - started_at
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert reload_seconds > 0 and sum(reads) > 0
+    benchmark.record(seconds_per_operation=elapsed / sum(reads), operation="read", number_of_readers=number_of_readers)
@@ -0,0 +1,105 @@
+import json
+import pathlib
+import typing
+
+import pytest
+
+from python_sdk import config
+from tests.performance import conftest
+
+_NUMBER_OF_LINES = 100_000
+_NUMBER_OF_PARSES = 5
+
+
+def _parse_whole_file(filepath: pathlib.Path, prefix: str) -> dict[str, str]:
+    # How local files were parsed before being streamed, with every line parsed before filtering by prefix.
+    configuration = {}
+    with filepath.open(mode="r", encoding="utf-8") as f:
+        for line in f.read().split("\n"):
+            if not line:
+                continue
+            key, val = line.split("=", 1)
+            configuration[key] = val
+    return config.StaticDictionary(dictionary=configuration)(prefix=prefix)
+
+
+@pytest.mark.parametrize("stream_by_prefix", [False, True])
+def test_benchmark_parse_local_file_by_prefix(
+    benchmark: conftest.Benchmark, tmp_path: pathlib.Path, stream_by_prefix: bool
+) -> None:
+    config_file = tmp_path / "config"
+    config_file.write_text("".join(f"SERVICE_{i % 100}_KEY_{i}=value_{i}\n" for i in range(_NUMBER_OF_LINES)))
+    source = config.LocalFile(filepath=config_file)
+
+    def parse() -> dict[str, str]:
+        if stream_by_prefix:
+            return source(prefix="SERVICE_7_")
+        return _parse_whole_file(filepath=config_file, prefix="SERVICE_7_")
+
+    assert parse() == _parse_whole_file(filepath=config_file, prefix="SERVICE_7_")
+
+    benchmark(
+        parse, number=_NUMBER_OF_PARSES, repeat=3, number_of_lines=_NUMBER_OF_LINES, stream_by_prefix=stream_by_prefix
+    )
+
+
+@pytest.mark.parametrize("structured_document", [False, True])
+def test_benchmark_load_dict_options(
+    benchmark: conftest.Benchmark, tmp_path: pathlib.Path, structured_document: bool
+) -> None:
+    tables = {f"TABLE_{j}": {f"KEY_{k}": f"value_{k}" for k in range(100)} for j in range(10)}
+    if structured_document:
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({f"SERVICE_{i}": tables for i in range(100)}))
+    else:
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "".join(f"SERVICE_{i}_{name}={json.dumps(table)}\n" for i in range(100) for name, table in tables.items())
+        )
+    cls = typing.cast(
+        type[config.Config],
+        type(
+            "Config",
+            (config.Config,),
+            {
+                "__annotations__": {name: dict[str, typing.Any] for name in tables},
+                **{name: config.Option() for name in tables},
+            },
+            option_prefix="SERVICE_7_",
+            config_sources=[config.LocalFile(filepath=config_file)],
+        ),
+    )
+
+    assert cls.TABLE_7 == tables["TABLE_7"]
+
+    benchmark(cls.reload_config, number=_NUMBER_OF_PARSES, repeat=3, structured_document=structured_document)
+
+
+@pytest.mark.parametrize("within_load_session", [False, True])
+def test_benchmark_reload_configs_from_large_environment(
+    benchmark: conftest.Benchmark, monkeypatch: pytest.MonkeyPatch, within_load_session: bool
+) -> None:
+    for i in range(5_000):
+        monkeypatch.setenv(f"INJECTED_ENVIRONMENT_VARIABLE_{i}", str(i))
+    for i in range(20):
+        monkeypatch.setenv(f"APP_{i}_KEY", str(i))
+    config.invalidate_environment_variables()
+    configs = []
+    for i in range(20):
+
+        class Config(config.Config, option_prefix=f"APP_{i}_", config_sources=[config.EnvironmentVariables()]):
+            KEY: int = config.Option()
+
+        configs.append(Config)
+
+    def reload() -> None:
+        if within_load_session:
+            config.reload_all(configs=configs)
+        else:
+            for config_class in configs:
+                config_class.reload_config()
+
+    reload()
+    assert [config_class.KEY for config_class in configs] == list(range(20))
+
+    benchmark(reload, number=5, number_of_configs=len(configs), within_load_session=within_load_session)
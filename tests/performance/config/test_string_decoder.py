@@ -0,0 +1,78 @@
+import pathlib
+import tracemalloc
+import typing
+
+import pytest
+
+from python_sdk import config
+from python_sdk.config import _config_option
+from python_sdk.config import _optional_type
+from python_sdk.config import _string_decoder
+from tests.performance import conftest
+
+_NUMBER_OF_DECODES = 20_000
+
+# fmt: off
+_DATATYPES_AND_VALUES: list[tuple[typing.Any, str]] = [
+    (str,                                                   "test"),
+    (int | None,                                            "1"),
+    (bool,                                                  "TRUE"),
+    (pathlib.Path | None,                                   "/tmp"),
+    (config.Base64EncodedString,                            "dGVzdA=="),
+    (list[int],                                             "1,2,3"),
+    (typing.Literal["DEBUG", "INFO", "WARNING"],            "INFO"),
+    (list[typing.Literal["DEBUG", "INFO", "WARNING"]],      "INFO,DEBUG"),
+]
+# fmt: on
+
+
+def _decode_resolving_decoder_every_time(option: _config_option.ConfigOption, string: str) -> None:
+    # How options decoded values before decoders were resolved once per option.
+    data_type = (
+        _optional_type.get_type_in_optional_type(data_type=option.datatype)
+        if _optional_type.is_optional_type(data_type=option.datatype)
+        else option.datatype
+    )
+    _string_decoder._get_string_decoder(data_type=data_type)(string)
+
+
+def _decode_with_resolved_decoder(option: _config_option.ConfigOption, string: str) -> None:
+    option._decoder(string)
+
+
+@pytest.mark.parametrize("resolve_decoder_once", [False, True])
+def test_benchmark_decode_options(benchmark: conftest.Benchmark, resolve_decoder_once: bool) -> None:
+    options_and_values = [
+        (_config_option.ConfigOption(name="TEST_KEY", prefix="", datatype=data_type), value)
+        for data_type, value in _DATATYPES_AND_VALUES
+    ]
+    decode = _decode_with_resolved_decoder if resolve_decoder_once else _decode_resolving_decoder_every_time
+
+    def decode_options() -> None:
+        for option, value in options_and_values:
+            decode(option=option, string=value)
+
+    benchmark(
+        decode_options,
+        number=_NUMBER_OF_DECODES // len(options_and_values),
+        number_of_options=len(options_and_values),
+        resolve_decoder_once=resolve_decoder_once,
+    )
+
+
+def test_numeric_arrays_use_less_memory_than_lists() -> None:
+    string = ",".join(str(i * 1_000.5) for i in range(10_000))
+
+    def allocated_bytes(data_type: typing.Any) -> int:
+        tracemalloc.start()
+        try:
+            value = _string_decoder.decode_string(string=string, data_type=data_type)
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            del value
+            tracemalloc.stop()
+
+    before_bytes = allocated_bytes(data_type=list[float])
+    after_bytes = allocated_bytes(data_type=config.Float64Array)
+
+    assert after_bytes < before_bytes
@@ -0,0 +1,73 @@
+import datetime
+import json
+import platform
+import sys
+import timeit
+import typing
+
+import pytest
+
+import python_sdk
+
+
+class Benchmark:
+    """
+    Times a function with timeit, taking the best of several repeats, and records the result against the running test.
+    All results are listed in the terminal summary, and written to `benchmarks.json` in the pytest base temporary
+    directory (`.test_artifacts`) once the session finishes, so that they can be archived and compared across releases.
+    """
+
+    def __init__(self, test: str, results: list[dict[str, typing.Any]]) -> None:
+        self._test = test
+        self._results = results
+
+    def __call__(
+        self, function: typing.Callable[[], typing.Any], number: int, repeat: int = 5, **parameters: typing.Any
+    ) -> float:
+        """Returns the best time per call, in seconds."""
+        best_seconds = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+        self.record(seconds_per_operation=best_seconds, number=number, repeat=repeat, **parameters)
+        return best_seconds
+
+    def record(self, seconds_per_operation: float, **parameters: typing.Any) -> None:
+        """Records a measurement taken by the test itself, such as one which timeit cannot take."""
+        self._results.append(
+            {"test": self._test, "seconds_per_operation": seconds_per_operation, "parameters": parameters}
+        )
+
+
+_BENCHMARK_RESULTS = pytest.StashKey[list[dict[str, typing.Any]]]()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> typing.Generator[list[dict[str, typing.Any]], None, None]:
+    results = request.config.stash.setdefault(_BENCHMARK_RESULTS, [])
+    yield results
+    if not results:
+        return
+    report = {
+        "python_sdk_version": python_sdk.__version__,
+        "python_version": sys.version,
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "results": results,
+    }
+    (tmp_path_factory.getbasetemp() / "benchmarks.json").write_text(json.dumps(report, indent=2))
+
+
+@pytest.fixture(scope="function")
+def benchmark(request: pytest.FixtureRequest, benchmark_results: list[dict[str, typing.Any]]) -> Benchmark:
+    return Benchmark(test=request.node.nodeid, results=benchmark_results)
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, exitstatus: int, config: pytest.Config) -> None:
+    results = config.stash.get(_BENCHMARK_RESULTS, [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    for result in results:
+        terminalreporter.write_line(
+            f"{result['test']} {result['parameters']}: {result['seconds_per_operation'] * 1e9:.0f}ns per operation"
+        )
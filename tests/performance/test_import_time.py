@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+from tests.performance import conftest
+
+# Modules which must not be imported as a side effect of importing python_sdk.log, as CLIs pay for them on every run.
+_DEFERRED_MODULES = [
+    "asyncio",
+    "boto3",
+    "ctypes",
+    "inspect",
+    "multiprocessing",
+    "python_sdk.config",
+    "python_sdk.secrets",
+    "urllib.request",
+]
+
+
+def _import_time_ms(module: str) -> float:
+    # -X importtime reports cumulative microseconds per module on stderr, the module imported last being the one asked.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative) / 1e3
+    raise AssertionError(f"{module} missing from -X importtime output.")
+
+
+@pytest.mark.parametrize("module", ["python_sdk", "python_sdk.log"])
+def test_benchmark_import_time(benchmark: conftest.Benchmark, module: str) -> None:
+    # Cumulative import time, taking the best of several runs. Recorded rather than compared, as wall-clock budgets
+    # fail on slow machines, see `conftest.Benchmark`. What keeps imports fast is deferring heavy modules, see below.
+    import_time_ms = min(_import_time_ms(module=module) for _ in range(5))
+    benchmark.record(seconds_per_operation=import_time_ms / 1e3, module=module)
+
+
+def test_importing_log_defers_heavy_modules() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, python_sdk.log; print([m for m in {_DEFERRED_MODULES!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,26 @@
+import pytest
+
+from python_sdk.config import _config_load_session
+
+
+@pytest.mark.parametrize(
+    "configuration,prefix,expected_result",
+    [
+        ({"APP_ONE": "1", "APP_TWO": "2", "DB_ONE": "3"}, "APP_", {"app_one": "1", "app_two": "2"}),
+        ({"APP_ONE": "1", "APP_TWO": "2", "DB_ONE": "3"}, "app_", {"app_one": "1", "app_two": "2"}),
+        ({"APP_ONE": "1", "APP_TWO": "2", "DB_ONE": "3"}, "", {"app_one": "1", "app_two": "2", "db_one": "3"}),
+        ({"APP_ONE": "1", "APPLICATION": "2"}, "APP_", {"app_one": "1"}),
+        ({"APP_ONE": "1"}, "DB_", {}),
+        ({}, "APP_", {}),
+    ],
+)
+def test_prefix_index_slice(configuration: dict[str, str], prefix: str, expected_result: dict[str, str]) -> None:
+    assert _config_load_session.PrefixIndex(configuration=configuration).slice(prefix=prefix) == expected_result
+
+
+def test_prefix_index_slice_preserving_case() -> None:
+    index = _config_load_session.PrefixIndex(
+        configuration={"APP_ONE": "1", "app_One": "2", "App_Two": "3", "DB_ONE": "4"}, preserve_case=True
+    )
+
+    assert index.slice(prefix="app_") == {"APP_ONE": "1", "app_One": "2", "App_Two": "3"}
@@ -0,0 +1,27 @@
+import pathlib
+
+from python_sdk.config import _config_snapshot
+
+
+def test_snapshot_is_read_back(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+
+    _config_snapshot.write_snapshot(file=snapshot_file, fingerprint="1", values={"KEY": ("1", 1)})
+
+    assert _config_snapshot.read_snapshot(file=snapshot_file, fingerprint="1") == {"KEY": ("1", 1)}
+    assert list(tmp_path.iterdir()) == [snapshot_file]
+
+
+def test_snapshot_with_different_fingerprint_is_not_read(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+
+    _config_snapshot.write_snapshot(file=snapshot_file, fingerprint="1", values={"KEY": ("1", 1)})
+
+    assert _config_snapshot.read_snapshot(file=snapshot_file, fingerprint="2") is None
+
+
+def test_corrupt_snapshot_is_not_read(tmp_path: pathlib.Path) -> None:
+    snapshot_file = tmp_path / "snapshot"
+    snapshot_file.write_bytes(b"not a snapshot")
+
+    assert _config_snapshot.read_snapshot(file=snapshot_file, fingerprint="1") is None
@@ -242,6 +242,58 @@ def test_decode_config_value_to_list_of_float(
     assert string_decodes_to_expected_result(string=string, data_type=data_type, expected_result=expected_result)
 
 
+@pytest.mark.parametrize(
+    "string,expected_result",
+    [
+        ("1,2,3", config.Int64Array([1, 2, 3])),
+        ("1", config.Int64Array([1])),
+        ("1,2,3,", config.Int64Array([1, 2, 3])),
+        (",1", config.Int64Array([1])),
+        (" 1", config.Int64Array([1])),
+        ("1, ", config.Int64Array([1])),
+        ("-9223372036854775808", config.Int64Array([-9223372036854775808])),
+        ("9223372036854775808", ValueError),
+        ("1.2,1.5", ValueError),
+        ("[1]", ValueError),
+        ("", ValueError),
+        (",", ValueError),
+        (" , ", ValueError),
+    ],
+)
+def test_decode_config_value_to_int64_array(string: str, expected_result: config.ConfigValueType | ValueError) -> None:
+    data_type = config.Int64Array
+    assert string_decodes_to_expected_result(string=string, data_type=data_type, expected_result=expected_result)
+
+
+@pytest.mark.parametrize(
+    "string,expected_result",
+    [
+        ("1.5,2.5,3.5", config.Float64Array([1.5, 2.5, 3.5])),
+        ("1.5", config.Float64Array([1.5])),
+        ("1,2,3,", config.Float64Array([1.0, 2.0, 3.0])),
+        (",1.5", config.Float64Array([1.5])),
+        ("1.5, ", config.Float64Array([1.5])),
+        ("[1.5]", ValueError),
+        ("", ValueError),
+        (",", ValueError),
+        (" , ", ValueError),
+    ],
+)
+def test_decode_config_value_to_float64_array(
+    string: str, expected_result: config.ConfigValueType | ValueError
+) -> None:
+    data_type = config.Float64Array
+    assert string_decodes_to_expected_result(string=string, data_type=data_type, expected_result=expected_result)
+
+
+def test_decoded_arrays_expose_their_buffer() -> None:
+    integers = _string_decoder.decode_string(string="1,2", data_type=config.Int64Array)
+    floats = _string_decoder.decode_string(string="1.5", data_type=config.Float64Array)
+
+    assert isinstance(integers, config.Int64Array) and memoryview(integers).format == "q"
+    assert isinstance(floats, config.Float64Array) and memoryview(floats).format == "d"
+
+
 @pytest.mark.parametrize(
     "string,expected_result",
     [